@@ -513,6 +513,7 @@ def _execute_import(job: Job, client: OdooClient, request: ImportRequest):
                 break
             
             job.current_batch = batch_idx + 1
+            adapter.resolve_references_bulk(batch)
             
             for row_idx, record in enumerate(batch):
                 global_row = batch_idx * batch_size + row_idx + 2  # +2 for header row
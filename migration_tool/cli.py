@@ -57,8 +57,11 @@ def create_client(config: MigrationConfig) -> OdooClient:
             username=config.odoo.username,
             password=config.odoo.password,
             timeout=config.odoo.timeout,
+            protocol=config.odoo.protocol,
             retry_attempts=config.import_settings.retry_attempts,
             retry_delay=config.import_settings.retry_delay,
+            retry_max_delay=config.import_settings.retry_max_delay,
+            retry_jitter=config.import_settings.retry_jitter,
         )
         client.authenticate()
         return client
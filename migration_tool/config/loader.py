@@ -27,6 +27,10 @@ class OdooConfig(BaseModel):
     username: str = Field(..., description="Username for authentication")
     password: str = Field(..., description="Password or API key")
     timeout: int = Field(default=120, ge=10, le=600)
+    protocol: Literal["xmlrpc", "jsonrpc"] = Field(
+        default="jsonrpc",
+        description="RPC endpoint: jsonrpc (smaller payloads) or xmlrpc",
+    )
     
     @field_validator("url")
     @classmethod
@@ -127,6 +131,12 @@ class ImportConfig(BaseModel):
     chunk_size: int = Field(default=500, ge=1, le=5000, description="Records per batch")
     retry_attempts: int = Field(default=3, ge=1, le=10, description="Retry attempts on failure")
     retry_delay: float = Field(default=2.0, ge=0.5, le=60.0, description="Delay between retries")
+    retry_max_delay: float = Field(
+        default=30.0, ge=0.5, le=300.0, description="Upper bound for the growing retry delay"
+    )
+    retry_jitter: float = Field(
+        default=1.0, ge=0.0, le=1.0, description="Share of each retry delay that is randomized"
+    )
     parallel: bool = Field(default=False, description="Enable parallel processing")
     max_workers: int = Field(default=4, ge=1, le=16, description="Max parallel workers")
     stop_on_error: bool = Field(default=False, description="Stop on first error")
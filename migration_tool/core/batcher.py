@@ -320,17 +320,14 @@ class BatchProcessor:
             batch_info.retry_count = attempt
             
             try:
-                # Prepare records with adapter
-                prepared_records = []
-                for record in records:
-                    if adapter:
-                        prepared = adapter.prepare_record(record)
-                    else:
-                        prepared = {
-                            k: v for k, v in record.items()
-                            if not k.startswith("__")
-                        }
-                    prepared_records.append(prepared)
+                # Prepare records with adapter (references resolved per batch)
+                if adapter:
+                    prepared_records = adapter.prepare_records(records)
+                else:
+                    prepared_records = [
+                        {k: v for k, v in record.items() if not k.startswith("__")}
+                        for record in records
+                    ]
                 
                 if dry_run:
                     # Validate without creating
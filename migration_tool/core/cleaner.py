@@ -5,6 +5,7 @@ Provides normalization functions for cleaning messy data before import.
 """
 
 import re
+from functools import lru_cache
 from typing import Any, Callable
 from datetime import datetime, date
 from decimal import Decimal, InvalidOperation
@@ -12,11 +13,56 @@ from decimal import Decimal, InvalidOperation
 import pandas as pd
 
 
+# Patterns used per cell, compiled once
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_DIGIT_RE = re.compile(r"\D")
+_NON_NUMERIC_RE = re.compile(r"[^\d.,\-]")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_SLASH_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+
+# Decoded in this order by strip_html
+_HTML_ENTITIES = (
+    ("&nbsp;", " "),
+    ("&amp;", "&"),
+    ("&lt;", "<"),
+    ("&gt;", ">"),
+    ("&quot;", '"'),
+)
+
+
 class CleanerError(Exception):
     """Raised when cleaning fails."""
     pass
 
 
+def _map_unique(series: pd.Series, func: Callable[[Any], Any]) -> pd.Series:
+    """
+    Apply func once per distinct value of a series and broadcast the results.
+    
+    Import columns repeat values heavily (countries, units, flags), so this
+    cuts the Python-level calls from one per cell to one per distinct value.
+    Missing values map to func(None).
+    
+    Object columns mixing types fall back to Series.apply: factorize treats
+    1, True and 1.0 as one value and would hand every cell the same result.
+    """
+    if series.dtype == object and pd.api.types.infer_dtype(series, skipna=True) not in (
+        "string", "empty"
+    ):
+        return series.apply(func)
+    
+    try:
+        codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    except TypeError:  # Unhashable cells (lists, dicts)
+        return series.apply(func)
+    
+    results = [func(value) for value in uniques]
+    results.append(func(None))  # Position -1: missing values
+    mapped = pd.Series(results, dtype=object).take(codes).set_axis(series.index)
+    return mapped.infer_objects()  # Same dtype inference as Series.apply
+
+
 class DataCleaner:
     """
     Cleans and normalizes data for Odoo import.
@@ -125,6 +171,9 @@ class DataCleaner:
         """
         self.default_country_code = default_country_code
         
+        # Import files repeat the same date strings heavily
+        self._parse_date = lru_cache(maxsize=4096)(self._parse_date_string)
+        
         # Register transform functions
         self._transforms: dict[str, Callable[[Any], Any]] = {
             "normalize_phone": self.normalize_phone,
@@ -161,7 +210,7 @@ class DataCleaner:
         # Always clean whitespace on all string columns
         for col in result.columns:
             if result[col].dtype == object:
-                result[col] = result[col].apply(self._safe_strip)
+                result[col] = _map_unique(result[col], self._safe_strip)
         
         # Apply specified transforms
         if transforms:
@@ -173,8 +222,8 @@ class DataCleaner:
                 if not transform_func:
                     raise CleanerError(f"Unknown transform: {transform_name}")
                 
-                result[column] = result[column].apply(
-                    lambda x: self._safe_transform(x, transform_func)
+                result[column] = _map_unique(
+                    result[column], lambda x: self._safe_transform(x, transform_func)
                 )
         
         return result
@@ -184,10 +233,8 @@ class DataCleaner:
         if pd.isna(value) or value is None:
             return None
         if isinstance(value, str):
-            stripped = value.strip()
             # Normalize multiple spaces
-            stripped = re.sub(r"\s+", " ", stripped)
-            return stripped if stripped else None
+            return _WHITESPACE_RE.sub(" ", value).strip() or None
         return value
     
     def _safe_transform(
@@ -214,9 +261,7 @@ class DataCleaner:
         if value is None or pd.isna(value):
             return None
         
-        text = str(value).strip()
-        text = re.sub(r"\s+", " ", text)
-        return text if text else None
+        return _WHITESPACE_RE.sub(" ", str(value)).strip() or None
     
     def normalize_phone(self, value: Any) -> str | None:
         """
@@ -237,7 +282,7 @@ class DataCleaner:
         has_plus = phone.startswith("+")
         
         # Remove all non-numeric characters
-        digits = re.sub(r"[^\d]", "", phone)
+        digits = _NON_DIGIT_RE.sub("", phone)
         
         if not digits:
             return None
@@ -267,12 +312,7 @@ class DataCleaner:
         if not email:
             return None
         
-        # Basic email validation
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if re.match(email_pattern, email):
-            return email
-        
-        # Return as-is if not valid (let validator handle it)
+        # Invalid addresses are returned as-is; the validator reports them
         return email
     
     def normalize_date(self, value: Any) -> str | None:
@@ -291,6 +331,24 @@ class DataCleaner:
         if not date_str:
             return None
         
+        return self._parse_date(date_str)
+    
+    def _parse_date_string(self, date_str: str) -> str:
+        """Parse a stripped, non-empty date string (cached per instance as _parse_date)."""
+        # Fast paths for the common shapes, in DATE_FORMATS precedence:
+        # ISO, then day-first before month-first for slashed dates
+        candidates: tuple[tuple[int, int, int], ...] = ()
+        if match := _ISO_DATE_RE.fullmatch(date_str):
+            candidates = ((int(match[1]), int(match[2]), int(match[3])),)
+        elif match := _SLASH_DATE_RE.fullmatch(date_str):
+            first, second, year = int(match[1]), int(match[2]), int(match[3])
+            candidates = ((year, second, first), (year, first, second))
+        for year, month, day in candidates:
+            try:
+                return date(year, month, day).isoformat()
+            except ValueError:
+                continue
+        
         # Try each format
         for fmt in self.DATE_FORMATS:
             try:
@@ -351,7 +409,7 @@ class DataCleaner:
             return None
         
         # Remove currency symbols and spaces
-        num_str = re.sub(r"[^\d.,\-]", "", num_str)
+        num_str = _NON_NUMERIC_RE.sub("", num_str)
         
         if not num_str or num_str == "-":
             return None
@@ -392,32 +450,24 @@ class DataCleaner:
         if value is None or pd.isna(value):
             return None
         
-        uom = str(value).strip().lower()
+        uom = str(value).strip()
         if not uom:
             return None
         
-        # Check aliases
-        normalized = self.UOM_ALIASES.get(uom)
-        if normalized:
-            return normalized
-        
-        # Return title case of original
-        return value.strip().title() if value else None
+        # Check aliases, else title case of the original
+        return self.UOM_ALIASES.get(uom.lower()) or uom.title()
     
     def strip_html(self, value: Any) -> str | None:
         """Remove HTML tags from text."""
         if value is None or pd.isna(value):
             return None
         
-        text = str(value)
         # Remove HTML tags
-        text = re.sub(r"<[^>]+>", "", text)
+        text = _HTML_TAG_RE.sub("", str(value))
         # Decode common entities
-        text = text.replace("&nbsp;", " ")
-        text = text.replace("&amp;", "&")
-        text = text.replace("&lt;", "<")
-        text = text.replace("&gt;", ">")
-        text = text.replace("&quot;", '"')
+        if "&" in text:
+            for entity, char in _HTML_ENTITIES:
+                text = text.replace(entity, char)
         
         return self.clean_whitespace(text)
     
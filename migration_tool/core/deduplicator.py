@@ -4,9 +4,10 @@ Deduplicator
 Handles duplicate detection within import batches and against existing Odoo records.
 """
 
-from typing import Any, Literal
+from typing import Any, Hashable, Literal
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 
 import pandas as pd
 
@@ -104,6 +105,9 @@ class Deduplicator:
         "uom.uom": ["name", "category_id"],
     }
     
+    # Distinct key value tuples whose key hash is remembered across batches
+    KEY_HASH_CACHE_SIZE = 65536
+    
     def __init__(self, odoo_client: Any | None = None):
         """
         Initialize deduplicator.
@@ -113,6 +117,9 @@ class Deduplicator:
         """
         self.client = odoo_client
         self._odoo_cache: dict[str, dict[str, int]] = {}  # model -> {key_hash -> id}
+        self._odoo_queried: dict[str, set[tuple[str, str]]] = {}  # model -> {(key, value)}
+        # Key hashes only depend on the values, so reruns and overlapping files hit this
+        self._cached_key_hash = lru_cache(maxsize=self.KEY_HASH_CACHE_SIZE)(self._build_key_hash)
     
     def find_duplicates(
         self,
@@ -142,16 +149,17 @@ class Deduplicator:
         result = DedupeResult()
         dedupe_keys = keys or self.DEFAULT_KEYS.get(model, ["name"])
         
-        # Track seen keys within batch
-        seen_keys: dict[str, int] = {}  # key_hash -> row number
-        
         # Load existing Odoo records if needed
         if check_odoo and self.client:
-            self._load_odoo_records(model, dedupe_keys)
+            self._load_odoo_records(model, dedupe_keys, records, case_sensitive)
         
-        for record in records:
+        key_hashes = self._make_key_hashes(records, dedupe_keys, case_sensitive)
+        
+        # Position of the first record sharing each key within the batch
+        first_positions = self._first_positions(key_hashes, self._key_signatures(key_hashes))
+        
+        for position, (record, key_hash) in enumerate(zip(records, key_hashes)):
             row_num = record.get("__source_row__", 0)
-            key_hash = self._make_key_hash(record, dedupe_keys, case_sensitive)
             key_values = {k: record.get(k) for k in dedupe_keys}
             
             is_duplicate = False
@@ -171,12 +179,13 @@ class Deduplicator:
             
             # Check within batch
             if check_batch and not is_duplicate:
-                if key_hash in seen_keys:
+                first = first_positions[position]
+                if 0 <= first < position:
                     is_duplicate = True
                     match = DuplicateMatch(
                         source_row=row_num,
                         match_type="batch",
-                        batch_row=seen_keys[key_hash],
+                        batch_row=records[first].get("__source_row__", 0),
                         matched_keys=key_values,
                     )
             
@@ -204,8 +213,6 @@ class Deduplicator:
             else:
                 # No duplicate found
                 result.unique_records.append(record)
-                if key_hash:  # Only track non-empty keys
-                    seen_keys[key_hash] = row_num
         
         return result
     
@@ -215,25 +222,137 @@ class Deduplicator:
         keys: list[str],
         case_sensitive: bool,
     ) -> str:
-        """Create a hash string from key values."""
-        values = []
-        for key in keys:
-            value = record.get(key)
-            if value is None or value == "":
+        """
+        Create a hash string from key values.
+        
+        Records whose key values are all strings (or missing) are memoized
+        on the values tuple; other types are hashed directly, since e.g.
+        1 and True would share a cache entry but stringify differently.
+        """
+        values = tuple(record.get(key) for key in keys)
+        if all(value is None or type(value) is str for value in values):
+            return self._cached_key_hash(tuple(keys), values, case_sensitive)
+        return self._build_key_hash(keys, values, case_sensitive)
+    
+    @staticmethod
+    def _build_key_hash(
+        keys: tuple[str, ...] | list[str],
+        values: tuple[Any, ...],
+        case_sensitive: bool,
+    ) -> str:
+        """
+        Join the "key:value" parts of non-empty values in sorted order.
+        
+        None, "" and pandas missing values (NaN, NA, NaT) are skipped, as
+        the column-wise path in _make_key_hashes skips them.
+        """
+        parts = []
+        for key, value in zip(keys, values):
+            if isinstance(value, str):
+                if not value:
+                    continue
+            elif value is None or (pd.api.types.is_scalar(value) and pd.isna(value)):
                 continue
             str_value = str(value).strip()
             if not case_sensitive:
-                str_value = str_value.lower()
-            values.append(f"{key}:{str_value}")
+                str_value = str_value.casefold()
+            parts.append(f"{key}:{str_value}")
         
-        return "|".join(sorted(values)) if values else ""
+        return "|".join(sorted(parts)) if parts else ""
     
-    def _load_odoo_records(self, model: str, keys: list[str]) -> None:
-        """Load existing Odoo records for duplicate checking."""
-        if model in self._odoo_cache:
+    # Batches smaller than this are hashed per record; DataFrame setup would dominate
+    VECTORIZE_MIN_ROWS = 1000
+    
+    def _make_key_hashes(
+        self,
+        records: list[dict[str, Any]],
+        keys: list[str],
+        case_sensitive: bool,
+    ) -> list[str]:
+        """
+        Key hashes for many records, as _make_key_hash would build them.
+        
+        Large batches are hashed column by column with pandas string
+        operations (one strip and casefold per column). Sorting "key:value"
+        parts only depends on the key names, so the parts are concatenated
+        in pre-sorted key order.
+        """
+        if len(records) < self.VECTORIZE_MIN_ROWS:
+            return [self._make_key_hash(record, keys, case_sensitive) for record in records]
+        
+        combined = pd.Series("", index=range(len(records)), dtype=object)
+        for key in sorted(keys, key=lambda k: f"{k}:"):
+            column = pd.Series([record.get(key) for record in records], dtype=object)
+            text = column.astype(str).str.strip()
+            if not case_sensitive:
+                text = text.str.casefold()
+            present = column.notna() & (column != "")
+            combined += (f"{key}:" + text + "|").where(present, "")
+        
+        # Drop the separator after the last part
+        return combined.str[:-1].tolist()
+    
+    def _key_signatures(self, key_hashes: list[str]) -> list[Hashable]:
+        """
+        Compact keys for grouping records of a batch by key.
+        
+        Large batches use pandas' vectorized 64-bit hash of each key hash,
+        so grouping works on fixed-size ints instead of long strings (a
+        collision is negligible at import sizes: ~1e-8 for a million rows).
+        Smaller batches use the key hashes themselves.
+        """
+        if len(key_hashes) < self.VECTORIZE_MIN_ROWS:
+            return list(key_hashes)
+        series = pd.Series(key_hashes, dtype=object)
+        return pd.util.hash_pandas_object(series, index=False).tolist()
+    
+    def _first_positions(self, key_hashes: list[str], signatures: list[Hashable]) -> list[int]:
+        """
+        Position of the first record with the same key, for each record.
+        
+        A record is a batch duplicate when this is before its own position;
+        empty keys get -1 and never match. Odoo matches depend on the key
+        alone, so records sharing a key are either all Odoo duplicates or
+        all batch candidates. Large batches group the 64-bit signatures
+        with pandas instead of a Python dict.
+        """
+        if len(key_hashes) < self.VECTORIZE_MIN_ROWS:
+            first_seen: dict[Hashable, int] = {}
+            return [
+                first_seen.setdefault(signature, position) if key_hash else -1
+                for position, (key_hash, signature) in enumerate(zip(key_hashes, signatures))
+            ]
+        
+        codes, _ = pd.factorize(pd.Series(signatures))
+        first = pd.Series(range(len(codes))).groupby(codes).transform("min")
+        return first.mask(pd.Series(key_hashes) == "", -1).tolist()
+    
+    # Values per search_read when looking up candidate duplicates
+    LOOKUP_CHUNK_SIZE = 200
+    
+    def _load_odoo_records(
+        self,
+        model: str,
+        keys: list[str],
+        records: list[dict[str, Any]] | None = None,
+        case_sensitive: bool = False,
+    ) -> None:
+        """
+        Load existing Odoo records for duplicate checking.
+        
+        With ``records``, only Odoo records sharing a key value with the
+        import data are fetched (in chunks); otherwise the whole model is
+        loaded once.
+        """
+        if records is not None:
+            self._load_odoo_candidates(model, keys, records, case_sensitive)
+            return
+        
+        if model in self._odoo_cache and model not in self._odoo_queried:
             return
         
         self._odoo_cache[model] = {}
+        self._odoo_queried.pop(model, None)
         
         try:
             # Only load fields that exist
@@ -269,6 +388,52 @@ class Deduplicator:
             # On error, proceed without Odoo check
             pass
     
+    def _load_odoo_candidates(
+        self,
+        model: str,
+        keys: list[str],
+        records: list[dict[str, Any]],
+        case_sensitive: bool,
+    ) -> None:
+        """Fetch Odoo records whose key values appear in the import records."""
+        if model in self._odoo_cache and model not in self._odoo_queried:
+            return  # Whole model already loaded
+        
+        cache = self._odoo_cache.setdefault(model, {})
+        queried = self._odoo_queried.setdefault(model, set())
+        fields_to_read = [k for k in keys if k != "id"]
+        
+        # Distinct (key, value) pairs not looked up before
+        pending: dict[str, list[str]] = {}
+        for record in records:
+            for key in fields_to_read:
+                value = record.get(key)
+                if value is None or value == "" or isinstance(value, (list, dict)):
+                    continue
+                pair = (key, str(value).strip())
+                if pair not in queried:
+                    queried.add(pair)
+                    pending.setdefault(key, []).append(pair[1])
+        
+        try:
+            for key, values in pending.items():
+                for i in range(0, len(values), self.LOOKUP_CHUNK_SIZE):
+                    chunk = values[i:i + self.LOOKUP_CHUNK_SIZE]
+                    if case_sensitive:
+                        domain: list[Any] = [(key, "in", chunk)]
+                    else:
+                        # OR of =ilike terms; any superset is fine because
+                        # matches are confirmed by key hash below
+                        domain = ["|"] * (len(chunk) - 1) + [(key, "=ilike", v) for v in chunk]
+                    
+                    for record in self.client.search_read(model, domain, ["id"] + fields_to_read):
+                        key_hash = self._make_key_hash(record, keys, case_sensitive=False)
+                        if key_hash:
+                            cache[key_hash] = record["id"]
+        except Exception:
+            # On error, proceed without Odoo check
+            pass
+    
     def _check_odoo_duplicate(self, model: str, key_hash: str) -> int | None:
         """Check if a key hash exists in Odoo cache."""
         if not key_hash:
@@ -279,8 +444,10 @@ class Deduplicator:
         """Clear the Odoo record cache."""
         if model:
             self._odoo_cache.pop(model, None)
+            self._odoo_queried.pop(model, None)
         else:
             self._odoo_cache.clear()
+            self._odoo_queried.clear()
     
     def get_duplicate_report(
         self,
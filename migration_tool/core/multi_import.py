@@ -195,6 +195,7 @@ class MultiModelImporter:
             
             # Get adapter
             adapter = get_adapter(config.model, self.client, self.reference_cache)
+            adapter.resolve_references_bulk(records)
             
             # Process records
             for i, record in enumerate(records):
@@ -5,20 +5,110 @@ Handles ingestion of CSV and Excel files with column mapping,
 encoding detection, and source tracking.
 """
 
+import codecs
 import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, BinaryIO, Literal
 from dataclasses import dataclass, field
 import io
 
 import pandas as pd
 
+try:
+    import pyarrow
+    from pyarrow import csv as pa_csv
+except ImportError:  # Optional: faster multithreaded CSV parsing
+    pyarrow = None
+
 
 class DataReaderError(Exception):
     """Raised when data reading fails."""
     pass
 
 
+# Bytes read from the start of a CSV file to guess its encoding
+_ENCODING_SAMPLE_SIZE = 65536
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+@lru_cache(maxsize=256)
+def _sniff_encoding(path: str, mtime_ns: int, size: int) -> str | None:
+    """
+    Guess a file's encoding from its head (see _sniff_sample).
+    
+    Only the first _ENCODING_SAMPLE_SIZE bytes are read. Cached per path,
+    modification time and size, so rereading an unchanged file skips
+    the check.
+    """
+    with open(path, "rb") as f:
+        sample = f.read(_ENCODING_SAMPLE_SIZE)
+    return _sniff_sample(sample, complete=len(sample) == size)
+
+
+def _sniff_sample(sample: bytes, complete: bool) -> str | None:
+    """
+    Guess an encoding from a BOM or a strict UTF-8 decode of the sample.
+    
+    Args:
+        sample: First bytes of the data
+        complete: Whether the sample is all of the data
+    
+    Returns:
+        Encoding name, or None if the sample is not valid UTF-8
+    """
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+    
+    try:
+        # A sample cut mid-character is fine unless it is the whole file
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=complete)
+    except UnicodeDecodeError:
+        return None
+    return "utf-8"
+
+
+def _parse_csv_arrow(source: Path | bytes, skip_rows: int) -> pd.DataFrame | None:
+    """
+    Parse a UTF-8 CSV with pyarrow, keeping every value as written.
+    
+    pyarrow infers column types unless told otherwise, and casting the
+    result back to str afterwards cannot undo it ("001" -> "1", dates
+    gain a time). The header is read first so every column can be
+    declared as string up front.
+    
+    Returns:
+        DataFrame of str columns, or None when the header has duplicate
+        or blank names (left to pandas, which renames them)
+    """
+    def open_source() -> Any:
+        return pyarrow.BufferReader(source) if isinstance(source, bytes) else str(source)
+    
+    read_options = pa_csv.ReadOptions(skip_rows=skip_rows)
+    with pa_csv.open_csv(open_source(), read_options=read_options) as stream:
+        names = stream.schema.names
+    if "" in names or len(set(names)) != len(names):
+        return None
+    
+    table = pa_csv.read_csv(
+        open_source(),
+        read_options=read_options,
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pyarrow.string() for name in names},
+            strings_can_be_null=False,  # Keep empty cells as ""
+        ),
+    )
+    return table.to_pandas()
+
+
 @dataclass
 class SourceInfo:
     """Tracks the source of each record for audit purposes."""
@@ -96,19 +186,100 @@ class DataReader:
         if not path.exists():
             raise DataReaderError(f"File not found: {path}")
         
-        suffix = path.suffix.lower()
+        suffix = self._check_suffix(path.name)
+        return self._read(path, str(path), suffix, mapping, sheet, skip_rows, encoding)
+    
+    def read_files(
+        self,
+        file_paths: list[str | Path],
+        mapping: dict[str, str] | None = None,
+        max_workers: int | None = None,
+    ) -> list[ReadResult]:
+        """
+        Read several files in parallel worker processes.
+        
+        Parsing is CPU-bound, so each file is read by read_file in its own
+        process and the results are sent back; a single file is read in
+        this process.
+        
+        Args:
+            file_paths: Paths to CSV or Excel files
+            mapping: Column name to Odoo field mapping, applied to every file
+            max_workers: Worker processes (default: one per CPU)
+            
+        Returns:
+            ReadResult per file, in input order
+            
+        Raises:
+            DataReaderError: If any file cannot be read
+        """
+        if len(file_paths) <= 1:
+            return [self.read_file(path, mapping=mapping) for path in file_paths]
+        
+        workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(partial(_read_one, mapping=mapping), file_paths))
+    
+    def read_buffer(
+        self,
+        buffer: bytes | BinaryIO,
+        filename: str,
+        mapping: dict[str, str] | None = None,
+        sheet: str | None = None,
+        skip_rows: int = 0,
+        encoding: str | None = None,
+    ) -> ReadResult:
+        """
+        Read file content held in memory, e.g. an upload.
+        
+        Parses like read_file without writing the content to disk first.
+        
+        Args:
+            buffer: File content, or a binary stream to read it from
+            filename: Original file name; its extension selects the parser
+                and it is recorded as the source file
+            mapping: Column name to Odoo field mapping
+            sheet: Sheet name for Excel files
+            skip_rows: Number of rows to skip at the start
+            encoding: Force specific encoding (auto-detect if None)
+            
+        Returns:
+            ReadResult with data and metadata
+            
+        Raises:
+            DataReaderError: If the content cannot be read
+        """
+        suffix = self._check_suffix(filename)
+        data = buffer if isinstance(buffer, bytes) else buffer.read()
+        return self._read(data, filename, suffix, mapping, sheet, skip_rows, encoding)
+    
+    def _check_suffix(self, filename: str) -> str:
+        """Return the lowercased extension, rejecting unsupported types."""
+        suffix = Path(filename).suffix.lower()
         if suffix not in self.SUPPORTED_EXTENSIONS:
             raise DataReaderError(
                 f"Unsupported file type: {suffix}. "
                 f"Supported: {', '.join(self.SUPPORTED_EXTENSIONS)}"
             )
-        
+        return suffix
+    
+    def _read(
+        self,
+        source: Path | bytes,
+        source_name: str,
+        suffix: str,
+        mapping: dict[str, str] | None,
+        sheet: str | None,
+        skip_rows: int,
+        encoding: str | None,
+    ) -> ReadResult:
+        """Parse a file or in-memory content and build the ReadResult."""
         # Read based on file type
         if suffix == ".csv":
-            df, detected_encoding = self._read_csv(path, encoding, skip_rows)
+            df, detected_encoding = self._read_csv(source, encoding, skip_rows)
             sheet_name = None
         else:
-            df = self._read_excel(path, sheet, skip_rows)
+            df = self._read_excel(source, sheet, skip_rows, source_name)
             sheet_name = sheet
             detected_encoding = None
         
@@ -122,15 +293,16 @@ class DataReader:
             warnings.extend(map_warnings)
         
         # Add source tracking column
-        df["__source_file__"] = str(path)
+        # One category for the whole file: a 1-byte code per row instead of a pointer
+        df["__source_file__"] = pd.Series(source_name, index=df.index, dtype="category")
         df["__source_row__"] = range(2 + skip_rows, len(df) + 2 + skip_rows)  # 1-indexed with header
         
-        if detected_encoding and detected_encoding != "utf-8":
+        if detected_encoding and detected_encoding not in ("utf-8", "utf-8-sig"):
             warnings.append(f"File encoding detected as {detected_encoding}")
         
         return ReadResult(
             data=df,
-            source_file=str(path),
+            source_file=source_name,
             sheet_name=sheet_name,
             total_rows=len(df),
             columns=list(df.columns),
@@ -140,49 +312,82 @@ class DataReader:
     
     def _read_csv(
         self,
-        path: Path,
+        source: Path | bytes,
         encoding: str | None,
         skip_rows: int,
     ) -> tuple[pd.DataFrame, str]:
         """Read CSV file with encoding detection."""
         if encoding:
             try:
-                df = pd.read_csv(
-                    path,
-                    encoding=encoding,
-                    skiprows=skip_rows,
-                    dtype=str,  # Read all as strings initially
-                    keep_default_na=False,  # Don't convert empty to NaN
-                )
-                return df, encoding
+                return self._parse_csv(source, encoding, skip_rows), encoding
             except UnicodeDecodeError:
                 raise DataReaderError(f"Cannot decode file with encoding: {encoding}")
         
-        # Try encodings in order
-        for enc in self.ENCODINGS:
+        # Try encodings in order, starting with the sniffed one
+        candidates = self._encoding_candidates(source)
+        for enc in candidates:
             try:
-                df = pd.read_csv(
-                    path,
-                    encoding=enc,
-                    skiprows=skip_rows,
-                    dtype=str,
-                    keep_default_na=False,
-                )
-                return df, enc
+                return self._parse_csv(source, enc, skip_rows), enc
             except UnicodeDecodeError:
                 continue
         
         raise DataReaderError(
-            f"Cannot decode CSV file. Tried encodings: {', '.join(self.ENCODINGS)}"
+            f"Cannot decode CSV file. Tried encodings: {', '.join(candidates)}"
+        )
+    
+    def _encoding_candidates(self, source: Path | bytes) -> list[str]:
+        """Encodings to try for a CSV file, most likely first."""
+        if isinstance(source, bytes):
+            sample = source[:_ENCODING_SAMPLE_SIZE]
+            sniffed = _sniff_sample(sample, complete=len(sample) == len(source))
+        else:
+            stat = source.stat()
+            sniffed = _sniff_encoding(str(source), stat.st_mtime_ns, stat.st_size)
+        if sniffed is None:
+            # Head is not UTF-8, so neither is the file
+            return [enc for enc in self.ENCODINGS if not enc.startswith("utf-8")]
+        return [sniffed] + [enc for enc in self.ENCODINGS if enc != sniffed]
+    
+    def _parse_csv(self, source: Path | bytes, encoding: str, skip_rows: int) -> pd.DataFrame:
+        """
+        Parse a CSV file or in-memory content.
+        
+        UTF-8 input goes to pyarrow's CSV reader when pyarrow is installed
+        (multithreaded, SIMD tokenizer), with every column typed as string
+        so no value is reinterpreted ("001" stays "001"). Anything pyarrow
+        rejects (e.g. newlines inside quoted values) and other encodings use
+        pandas' C tokenizer, on a memory-mapped file so it scans the page
+        cache directly instead of copying the file through read buffers.
+        """
+        in_memory = isinstance(source, bytes)
+        
+        if pyarrow is not None and encoding == "utf-8":
+            try:
+                df = _parse_csv_arrow(source, skip_rows)
+            except (pyarrow.ArrowInvalid, ValueError):
+                df = None  # Fall back to the C tokenizer
+            if df is not None:
+                return df
+        
+        return pd.read_csv(
+            io.BytesIO(source) if in_memory else source,
+            encoding=encoding,
+            skiprows=skip_rows,
+            dtype=str,  # Read all as strings initially
+            keep_default_na=False,  # Don't convert empty to NaN
+            engine="c",
+            memory_map=not in_memory,
         )
     
     def _read_excel(
         self,
-        path: Path,
+        source: Path | bytes,
         sheet: str | None,
         skip_rows: int,
+        source_name: str,
     ) -> pd.DataFrame:
         """Read Excel file."""
+        path = io.BytesIO(source) if isinstance(source, bytes) else source
         try:
             if sheet:
                 df = pd.read_excel(
@@ -206,11 +411,41 @@ class DataReader:
             return df
         except ValueError as e:
             if "Worksheet" in str(e):
-                raise DataReaderError(f"Sheet '{sheet}' not found in {path}")
+                raise DataReaderError(f"Sheet '{sheet}' not found in {source_name}")
             raise DataReaderError(f"Error reading Excel file: {e}")
         except Exception as e:
             raise DataReaderError(f"Error reading Excel file: {e}")
     
+    def apply_mapping(
+        self,
+        result: ReadResult,
+        mapping: dict[str, str],
+    ) -> ReadResult:
+        """
+        Apply a column mapping to an already-read result.
+        
+        Lets callers that keep a parsed file around remap it without
+        reading the file again. The source result is left unchanged.
+        
+        Args:
+            result: Result of a previous read_file call (without mapping)
+            mapping: Column name to Odoo field mapping
+            
+        Returns:
+            New ReadResult with the mapping applied
+        """
+        df, errors, warnings = self._apply_mapping(result.data, mapping)
+        
+        return ReadResult(
+            data=df,
+            source_file=result.source_file,
+            sheet_name=result.sheet_name,
+            total_rows=len(df),
+            columns=list(df.columns),
+            errors=result.errors + errors,
+            warnings=result.warnings + warnings,
+        )
+    
     def _apply_mapping(
         self,
         df: pd.DataFrame,
@@ -257,12 +492,13 @@ class DataReader:
             )
         
         # Keep only mapped columns plus source tracking
+        renamed_columns = set(df.columns)
         target_columns = list(valid_mapping.values())
-        available_columns = [c for c in target_columns if c in df.columns]
+        available_columns = [c for c in target_columns if c in renamed_columns]
         
         # Also keep source tracking if present
         for col in ["__source_file__", "__source_row__"]:
-            if col in df.columns:
+            if col in renamed_columns:
                 available_columns.append(col)
         
         return df[available_columns], errors, warnings
@@ -312,3 +548,8 @@ class DataReader:
             return dialect.delimiter
         except Exception:
             return ","  # Default to comma
+
+
+def _read_one(file_path: str | Path, mapping: dict[str, str] | None) -> ReadResult:
+    """Read one file in a worker process (module-level so it can be pickled)."""
+    return DataReader().read_file(file_path, mapping=mapping)
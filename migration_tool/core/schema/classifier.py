@@ -5,6 +5,8 @@ Deterministic classification logic for Odoo fields.
 Determines whether fields are importable, export-only, or ignored.
 """
 
+from itertools import product
+
 from migration_tool.core.schema.models import (
     FieldMeta,
     FieldType,
@@ -107,6 +109,32 @@ class FieldClassifier:
         """
         self.strict_mode = strict_mode
     
+    @property
+    def strict_mode(self) -> bool:
+        """Whether fields of unknown type are ignored rather than imported."""
+        return self._strict_mode
+    
+    @strict_mode.setter
+    def strict_mode(self, value: bool) -> None:
+        self._strict_mode = value
+        
+        # _determine_classification evaluated once for every input combination;
+        # key is (field_type, readonly, stored, computed, has_inverse, is_system)
+        self._decisions = {
+            (field_type, *flags): self._determine_classification(
+                name="",
+                field_type=field_type,
+                required=False,
+                readonly=flags[0],
+                stored=flags[1],
+                computed=flags[2],
+                has_inverse=flags[3],
+                is_system=flags[4],
+            )
+            for field_type in FieldType
+            for flags in product((False, True), repeat=5)
+        }
+    
     def classify(
         self,
         model: str,
@@ -164,16 +192,9 @@ class FieldClassifier:
         digits = field_info.get("digits")
         
         # ---- Classification Logic ----
-        classification, importable, exportable = self._determine_classification(
-            name=name,
-            field_type=field_type,
-            required=required,
-            readonly=readonly,
-            stored=stored,
-            computed=computed,
-            has_inverse=has_inverse,
-            is_system=is_system,
-        )
+        classification, importable, exportable = self._decisions[
+            field_type, bool(readonly), bool(stored), computed, has_inverse, is_system
+        ]
         
         return FieldMeta(
             model=model,
@@ -200,6 +221,27 @@ class FieldClassifier:
             digits=tuple(digits) if digits and len(digits) == 2 else None,
         )
     
+    def classify_many(
+        self,
+        model: str,
+        fields_info: dict[str, dict],
+    ) -> dict[str, FieldMeta]:
+        """
+        Classify all fields of a model, as returned by fields_get.
+        
+        Args:
+            model: Model technical name
+            fields_info: Field name -> raw field_info
+            
+        Returns:
+            Field name -> classified FieldMeta, in input order
+        """
+        classify = self.classify
+        return {
+            name: classify(model, name, info.get("string", name), info)
+            for name, info in fields_info.items()
+        }
+    
     def _determine_classification(
         self,
         name: str,
@@ -6,6 +6,7 @@ Pulls field definitions directly from Odoo without hardcoding.
 """
 
 from typing import Any
+from collections import OrderedDict
 from dataclasses import dataclass
 
 from migration_tool.core.schema.models import FieldMeta, ModelMeta, FieldType
@@ -61,6 +62,9 @@ FIELD_ATTRIBUTES = [
     "context",
 ]
 
+# Operations checked with check_access_rights for each model
+ACCESS_OPERATIONS = ["create", "read", "write", "unlink"]
+
 
 class SchemaInspector:
     """
@@ -91,6 +95,7 @@ class SchemaInspector:
         cache: SchemaCache | None = None,
         classifier: FieldClassifier | None = None,
         auto_cache: bool = True,
+        max_models: int = 64,
     ):
         """
         Initialize schema inspector.
@@ -100,14 +105,17 @@ class SchemaInspector:
             cache: Optional SchemaCache instance
             classifier: Optional FieldClassifier instance
             auto_cache: Whether to automatically cache results
+            max_models: Number of model schemas kept in memory; the least
+                recently used one is evicted beyond that
         """
         self.client = client
         self.cache = cache or SchemaCache()
         self.classifier = classifier or FieldClassifier()
         self.auto_cache = auto_cache
         
-        # In-memory schema storage
-        self._models: dict[str, ModelMeta] = {}
+        # In-memory schema storage, ordered from least to most recently used
+        self.max_models = max_models
+        self._models: OrderedDict[str, ModelMeta] = OrderedDict()
         self._odoo_version: str | None = None
         self._server_version_info: tuple[int, ...] | None = None
         self._installed_modules: list[tuple[str, str]] | None = None
@@ -151,16 +159,20 @@ class SchemaInspector:
             ModelMeta or None if model doesn't exist
         """
         if model in self._models and not refresh:
+            self._models.move_to_end(model)
             return self._models[model]
         
         # Try loading from cache
         if not refresh and self._try_load_from_cache(model):
             return self._models.get(model)
         
+        if refresh:
+            self.client.clear_fields_cache(model)
+        
         # Fetch from Odoo
         model_meta = self._fetch_model_schema(model)
         if model_meta:
-            self._models[model] = model_meta
+            self._remember(model, model_meta)
             
             if self.auto_cache:
                 self._save_to_cache()
@@ -275,11 +287,37 @@ class SchemaInspector:
         for model in target_models:
             model_meta = self._fetch_model_schema(model)
             if model_meta:
-                self._models[model] = model_meta
+                self._remember(model, model_meta)
         
         if self.auto_cache:
             self._save_to_cache()
     
+    def preload_models(self, models: list[str]) -> dict[str, ModelMeta]:
+        """
+        Load schemas for several models using batched requests.
+        
+        Models already in memory are not fetched again; models that do
+        not exist in this Odoo instance are left out of the result.
+        
+        Args:
+            models: Model technical names to load
+            
+        Returns:
+            Dict of model name -> ModelMeta for the models found
+        """
+        loaded = {m: self._models[m] for m in models if m in self._models}
+        pending = [m for m in models if m not in loaded]
+        if pending:
+            fetched = self._fetch_model_schemas(pending)
+            for model, model_meta in fetched.items():
+                self._remember(model, model_meta)
+            loaded.update(fetched)
+            
+            if self.auto_cache and fetched:
+                self._save_to_cache()
+        
+        return loaded
+    
     def preload_common_models(self) -> None:
         """Preload schemas for commonly imported models."""
         for model in COMMON_IMPORT_MODELS:
@@ -339,8 +377,6 @@ class SchemaInspector:
             if not model_info:
                 return None
             
-            model_data = model_info[0]
-            
             # Get field definitions
             fields_data = self.client.fields_get(
                 model,
@@ -348,31 +384,9 @@ class SchemaInspector:
             )
             
             # Check access rights
-            can_create = self._check_access(model, "create")
-            can_read = self._check_access(model, "read")
-            can_write = self._check_access(model, "write")
-            can_unlink = self._check_access(model, "unlink")
+            access = {op: self._check_access(model, op) for op in ACCESS_OPERATIONS}
             
-            # Create ModelMeta
-            model_meta = ModelMeta(
-                name=model,
-                label=model_data.get("name", model),
-                is_transient=model_data.get("transient", False),
-                can_create=can_create,
-                can_read=can_read,
-                can_write=can_write,
-                can_unlink=can_unlink,
-            )
-            
-            # Classify and add fields
-            for field_name, field_info in fields_data.items():
-                field_meta = self.classifier.classify(
-                    model=model,
-                    name=field_name,
-                    label=field_info.get("string", field_name),
-                    field_info=field_info,
-                )
-                model_meta.fields[field_name] = field_meta
+            model_meta = self._build_model_meta(model, model_info[0], fields_data, access)
             
             # Enrich with ir.model.fields if accessible
             self._enrich_from_ir_model_fields(model, model_meta)
@@ -383,6 +397,79 @@ class SchemaInspector:
             # Model might not exist or not accessible
             return None
     
+    def _fetch_model_schemas(self, models: list[str]) -> dict[str, ModelMeta]:
+        """
+        Fetch several model schemas with a fixed number of round trips.
+        
+        One ir.model lookup, one multicall carrying every fields_get and
+        access check, and one ir.model.fields lookup, regardless of how
+        many models are requested.
+        """
+        model_info = self.client.search_read(
+            "ir.model",
+            [("model", "in", models)],
+            ["name", "model", "transient"],
+        )
+        info_by_model = {m["model"]: m for m in model_info}
+        names = [m for m in models if m in info_by_model]
+        if not names:
+            return {}
+        
+        calls: list[tuple[str, str, list[Any], dict[str, Any]]] = []
+        for model in names:
+            calls.append((model, "fields_get", [], {"attributes": FIELD_ATTRIBUTES}))
+            calls.extend(
+                (model, "check_access_rights", [op], {"raise_exception": False})
+                for op in ACCESS_OPERATIONS
+            )
+        results = self.client.execute_kw_multi(calls)
+        
+        ir_fields_by_model: dict[str, list[dict[str, Any]]] = {}
+        try:
+            ir_fields = self.client.search_read(
+                "ir.model.fields",
+                [("model", "in", names)],
+                ["model", "name", "ttype", "state", "store", "compute"],
+            )
+            for ir_field in ir_fields:
+                ir_fields_by_model.setdefault(ir_field["model"], []).append(ir_field)
+        except Exception:
+            pass  # ir.model.fields may not be accessible
+        
+        step = 1 + len(ACCESS_OPERATIONS)
+        schemas: dict[str, ModelMeta] = {}
+        for i, model in enumerate(names):
+            fields_data, *access = results[i * step:(i + 1) * step]
+            model_meta = self._build_model_meta(
+                model, info_by_model[model], fields_data, dict(zip(ACCESS_OPERATIONS, access))
+            )
+            self._apply_ir_model_fields(model_meta, ir_fields_by_model.get(model, []))
+            schemas[model] = model_meta
+        return schemas
+    
+    def _build_model_meta(
+        self,
+        model: str,
+        model_data: dict[str, Any],
+        fields_data: dict[str, dict[str, Any]],
+        access: dict[str, bool],
+    ) -> ModelMeta:
+        """Build a classified ModelMeta from raw ir.model and fields_get data."""
+        model_meta = ModelMeta(
+            name=model,
+            label=model_data.get("name", model),
+            is_transient=model_data.get("transient", False),
+            can_create=access.get("create", False),
+            can_read=access.get("read", False),
+            can_write=access.get("write", False),
+            can_unlink=access.get("unlink", False),
+        )
+        
+        # Classify and add fields
+        model_meta.fields.update(self.classifier.classify_many(model, fields_data))
+        
+        return model_meta
+    
     def _enrich_from_ir_model_fields(
         self,
         model: str,
@@ -395,40 +482,47 @@ class SchemaInspector:
                 [("model", "=", model)],
                 ["name", "ttype", "state", "store", "compute"],
             )
-            
-            for ir_field in ir_fields:
-                field_name = ir_field["name"]
-                if field_name in model_meta.fields:
-                    field = model_meta.fields[field_name]
-                    
-                    # Update is_custom based on state
-                    if ir_field.get("state") == "manual":
-                        # Create new FieldMeta with is_custom=True
-                        model_meta.fields[field_name] = FieldMeta(
-                            model=field.model,
-                            name=field.name,
-                            label=field.label,
-                            field_type=field.field_type,
-                            required=field.required,
-                            readonly=field.readonly,
-                            classification=field.classification,
-                            importable=field.importable,
-                            exportable=field.exportable,
-                            stored=field.stored,
-                            computed=field.computed,
-                            has_inverse=field.has_inverse,
-                            related=field.related,
-                            company_dependent=field.company_dependent,
-                            relation=field.relation,
-                            relation_field=field.relation_field,
-                            selection=field.selection,
-                            help_text=field.help_text,
-                            is_custom=True,  # Mark as custom
-                            is_system=field.is_system,
-                        )
+            self._apply_ir_model_fields(model_meta, ir_fields)
         except Exception:
             pass  # ir.model.fields may not be accessible
     
+    def _apply_ir_model_fields(
+        self,
+        model_meta: ModelMeta,
+        ir_fields: list[dict[str, Any]],
+    ) -> None:
+        """Apply ir.model.fields records to a model's field metadata."""
+        for ir_field in ir_fields:
+            field_name = ir_field["name"]
+            if field_name in model_meta.fields:
+                field = model_meta.fields[field_name]
+                
+                # Update is_custom based on state
+                if ir_field.get("state") == "manual":
+                    # Create new FieldMeta with is_custom=True
+                    model_meta.fields[field_name] = FieldMeta(
+                        model=field.model,
+                        name=field.name,
+                        label=field.label,
+                        field_type=field.field_type,
+                        required=field.required,
+                        readonly=field.readonly,
+                        classification=field.classification,
+                        importable=field.importable,
+                        exportable=field.exportable,
+                        stored=field.stored,
+                        computed=field.computed,
+                        has_inverse=field.has_inverse,
+                        related=field.related,
+                        company_dependent=field.company_dependent,
+                        relation=field.relation,
+                        relation_field=field.relation_field,
+                        selection=field.selection,
+                        help_text=field.help_text,
+                        is_custom=True,  # Mark as custom
+                        is_system=field.is_system,
+                    )
+    
     def _check_access(self, model: str, operation: str) -> bool:
         """Check if user has access for an operation."""
         try:
@@ -436,6 +530,17 @@ class SchemaInspector:
         except Exception:
             return False
     
+    def _remember(self, model: str, model_meta: ModelMeta) -> None:
+        """
+        Store a model schema, evicting the least recently used beyond max_models.
+        
+        Eviction only frees memory; _save_to_cache keeps evicted models on disk.
+        """
+        self._models[model] = model_meta
+        self._models.move_to_end(model)
+        while len(self._models) > self.max_models:
+            self._models.popitem(last=False)
+    
     def _try_load_from_cache(self, model: str) -> bool:
         """Try to load model from cache."""
         try:
@@ -450,7 +555,7 @@ class SchemaInspector:
             
             if cached_models and model in cached_models:
                 model_meta = ModelMeta.from_dict(cached_models[model])
-                self._models[model] = model_meta
+                self._remember(model, model_meta)
                 return True
             
             return False
@@ -459,15 +564,26 @@ class SchemaInspector:
             return False
     
     def _save_to_cache(self) -> None:
-        """Save current models to cache."""
+        """
+        Save current models to cache.
+        
+        Models already cached but evicted from memory by _remember are
+        kept, so max_models bounds memory, not the cache.
+        """
         try:
             version = self._get_odoo_version()
             modules = self._get_installed_modules()
             
-            models_dict = {
-                name: model.to_dict()
+            cached_models = self.cache.load(
+                database=self.client.db,
+                odoo_version=version,
+                modules=modules,
+            )
+            models_dict = dict(cached_models or {})
+            models_dict.update(
+                (name, model.to_dict())
                 for name, model in self._models.items()
-            }
+            )
             
             self.cache.save(
                 database=self.client.db,
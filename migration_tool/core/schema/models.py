@@ -4,6 +4,7 @@ Schema Data Models
 Typed dataclasses for representing Odoo field and model metadata.
 """
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -40,11 +41,12 @@ class FieldType(Enum):
     
     @classmethod
     def from_string(cls, type_str: str) -> "FieldType":
-        """Convert Odoo type string to enum."""
-        try:
-            return cls(type_str)
-        except ValueError:
-            return cls.UNKNOWN
+        """Convert Odoo type string to enum (UNKNOWN if unrecognized)."""
+        return _FIELD_TYPE_BY_STRING.get(type_str, cls.UNKNOWN)
+
+
+# Odoo type string -> FieldType; unknown types skip Enum's ValueError path
+_FIELD_TYPE_BY_STRING: dict[str, FieldType] = {ft.value: ft for ft in FieldType}
 
 
 class FieldClassification(Enum):
@@ -56,7 +58,7 @@ class FieldClassification(Enum):
     RELATIONAL = "relational"      # Requires special handling (many2one)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldMeta:
     """
     Metadata for a single Odoo field.
@@ -106,6 +108,15 @@ class FieldMeta:
     is_custom: bool = False                       # Custom field (x_ prefix)
     is_system: bool = False                       # System field (id, create_*, write_*)
     
+    def __post_init__(self) -> None:
+        # Share one string per model and field name: a catalog repeats model
+        # names for every field and common field names across models, and
+        # FieldMeta loaded from the JSON cache gets fresh copies of each
+        object.__setattr__(self, "model", sys.intern(self.model))
+        object.__setattr__(self, "name", sys.intern(self.name))
+        if self.relation is not None:
+            object.__setattr__(self, "relation", sys.intern(self.relation))
+    
     def __repr__(self) -> str:
         return (
             f"FieldMeta({self.model}.{self.name}, "
@@ -165,7 +176,7 @@ class FieldMeta:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelMeta:
     """
     Metadata for an Odoo model.
@@ -5,12 +5,13 @@ Pre-import validation using Pydantic schemas and custom rules.
 Validates data before any Odoo API calls.
 """
 
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import islice
 
 import pandas as pd
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 
 class ValidationSeverity(Enum):
@@ -20,7 +21,7 @@ class ValidationSeverity(Enum):
     INFO = "info"        # Informational only
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
     """A single validation issue."""
     
@@ -32,7 +33,7 @@ class ValidationIssue:
     code: str = ""        # Error code for programmatic handling
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validating a batch of records."""
     
@@ -64,17 +65,19 @@ class ValidationResult:
         if not self.issues:
             return pd.DataFrame(columns=["row", "field", "severity", "message", "value"])
         
-        return pd.DataFrame([
-            {
-                "row": i.row,
-                "field": i.field or "",
-                "severity": i.severity.value,
-                "message": i.message,
-                "value": str(i.value) if i.value is not None else "",
-                "code": i.code,
-            }
-            for i in self.issues
-        ])
+        # One list per column instead of one dict per issue
+        issues = self.issues
+        return pd.DataFrame({
+            "row": [i.row for i in issues],
+            "field": [i.field or "" for i in issues],
+            "severity": pd.Categorical(
+                [i.severity.value for i in issues],
+                categories=[s.value for s in ValidationSeverity],
+            ),
+            "message": [i.message for i in issues],
+            "value": [str(i.value) if i.value is not None else "" for i in issues],
+            "code": [i.code for i in issues],
+        })
 
 
 class ValidationEngine:
@@ -106,10 +109,12 @@ class ValidationEngine:
         self.client = odoo_client
         self._custom_rules: dict[str, Callable[[Any, dict], ValidationIssue | None]] = {}
         self._reference_cache: dict[str, set[str]] = {}
+        # Schema -> TypeAdapter(list[schema]), built on first use
+        self._batch_adapters: dict[type[BaseModel], TypeAdapter[list[BaseModel]]] = {}
     
     def validate(
         self,
-        records: list[dict[str, Any]],
+        records: Iterable[dict[str, Any]],
         schema: type[BaseModel] | None = None,
         required: list[str] | None = None,
         validation_config: dict[str, Any] | None = None,
@@ -118,7 +123,7 @@ class ValidationEngine:
         Validate a list of records.
         
         Args:
-            records: List of record dictionaries
+            records: Record dictionaries (any iterable; see iter_validate)
             schema: Optional Pydantic schema for type validation
             required: List of required field names
             validation_config: Additional validation configuration
@@ -126,48 +131,14 @@ class ValidationEngine:
         Returns:
             ValidationResult with valid/invalid records and issues
         """
-        result = ValidationResult()
         config = validation_config or {}
-        required_fields = required or config.get("required", [])
+        if not (required or config.get("required")) and schema is None and not self._custom_rules:
+            # Nothing to check: every record is valid
+            return ValidationResult(valid_records=list(records))
         
-        for record in records:
-            row_num = record.get("__source_row__", 0)
-            row_issues: list[ValidationIssue] = []
-            
-            # Check required fields
-            for field_name in required_fields:
-                value = record.get(field_name)
-                if value is None or value == "" or (isinstance(value, str) and not value.strip()):
-                    row_issues.append(ValidationIssue(
-                        row=row_num,
-                        field=field_name,
-                        message=f"Required field '{field_name}' is missing or empty",
-                        severity=ValidationSeverity.ERROR,
-                        value=value,
-                        code="REQUIRED_FIELD_MISSING",
-                    ))
-            
-            # Pydantic schema validation
-            if schema:
-                schema_issues = self._validate_schema(record, schema, row_num)
-                row_issues.extend(schema_issues)
-            
-            # Custom rules
-            for rule_name, rule_func in self._custom_rules.items():
-                try:
-                    issue = rule_func(record.get(rule_name.split(".")[-1]), record)
-                    if issue:
-                        issue.row = row_num
-                        row_issues.append(issue)
-                except Exception as e:
-                    row_issues.append(ValidationIssue(
-                        row=row_num,
-                        field=None,
-                        message=f"Rule '{rule_name}' failed: {e}",
-                        severity=ValidationSeverity.WARNING,
-                        code="RULE_EXECUTION_ERROR",
-                    ))
-            
+        result = ValidationResult()
+        
+        for record, row_issues in self.iter_validate(records, schema, required, validation_config):
             # Add to results
             result.issues.extend(row_issues)
             
@@ -179,32 +150,175 @@ class ValidationEngine:
         
         return result
     
-    def _validate_schema(
+    # Records pulled from the input per batch by iter_validate
+    STREAM_CHUNK_SIZE = 10000
+    
+    def iter_validate(
+        self,
+        records: Iterable[dict[str, Any]],
+        schema: type[BaseModel] | None = None,
+        required: list[str] | None = None,
+        validation_config: dict[str, Any] | None = None,
+    ) -> Iterator[tuple[dict[str, Any], list[ValidationIssue]]]:
+        """
+        Validate records lazily, yielding each record with its issues.
+        
+        Records are pulled from the iterable STREAM_CHUNK_SIZE at a time
+        and checked as a batch, so a generator over a large file is never
+        materialized as a whole. Callers that only need e.g. the valid
+        records can keep those and drop the rest as they go.
+        
+        Args:
+            records: Record dictionaries, e.g. a generator
+            schema: Optional Pydantic schema for type validation
+            required: List of required field names
+            validation_config: Additional validation configuration
+            
+        Yields:
+            (record, issues) in input order; issues are empty for clean records
+        """
+        config = validation_config or {}
+        required_fields = required or config.get("required", [])
+        iterator = iter(records)
+        
+        while chunk := list(islice(iterator, self.STREAM_CHUNK_SIZE)):
+            missing_per_record = self._missing_required(chunk, required_fields)
+            schema_per_record = (
+                self._schema_issues(chunk, schema) if schema else [[] for _ in chunk]
+            )
+            
+            for record, missing_fields, schema_issues in zip(
+                chunk, missing_per_record, schema_per_record
+            ):
+                yield record, self._record_issues(record, missing_fields, schema_issues)
+    
+    def _record_issues(
         self,
         record: dict[str, Any],
-        schema: type[BaseModel],
-        row_num: int,
+        missing_fields: list[str],
+        schema_issues: list[ValidationIssue],
     ) -> list[ValidationIssue]:
-        """Validate a record against a Pydantic schema."""
-        issues: list[ValidationIssue] = []
+        """All issues of one record: required fields, schema, then custom rules."""
+        row_num = record.get("__source_row__", 0)
+        row_issues: list[ValidationIssue] = []
+        
+        # Check required fields
+        for field_name in missing_fields:
+            row_issues.append(ValidationIssue(
+                row=row_num,
+                field=field_name,
+                message=f"Required field '{field_name}' is missing or empty",
+                severity=ValidationSeverity.ERROR,
+                value=record.get(field_name),
+                code="REQUIRED_FIELD_MISSING",
+            ))
+        
+        # Pydantic schema validation
+        row_issues.extend(schema_issues)
+        
+        # Custom rules
+        for rule_name, rule_func in self._custom_rules.items():
+            try:
+                issue = rule_func(record.get(rule_name.split(".")[-1]), record)
+                if issue:
+                    issue.row = row_num
+                    row_issues.append(issue)
+            except Exception as e:
+                row_issues.append(ValidationIssue(
+                    row=row_num,
+                    field=None,
+                    message=f"Rule '{rule_name}' failed: {e}",
+                    severity=ValidationSeverity.WARNING,
+                    code="RULE_EXECUTION_ERROR",
+                ))
+        
+        return row_issues
+    
+    # Batches smaller than this are checked per record; Series setup would dominate
+    VECTORIZE_MIN_ROWS = 1000
+    
+    def _missing_required(
+        self,
+        records: list[dict[str, Any]],
+        required_fields: list[str],
+    ) -> list[list[str]]:
+        """
+        Required fields that are missing in each record, in field order.
+        
+        A value is missing when it is absent, None, NaN or a blank string.
+        Blank strings are found with isspace(), which scans without
+        building stripped copies. Large batches check each field as a
+        column and only build lists for the failing records.
+        """
+        if not required_fields:
+            return [[] for _ in records]
+        
+        if len(records) < self.VECTORIZE_MIN_ROWS:
+            return [
+                [
+                    f for f in required_fields
+                    if (v := record.get(f)) is None
+                    or (isinstance(v, float) and v != v)
+                    or (isinstance(v, str) and (not v or v.isspace()))
+                ]
+                for record in records
+            ]
+        
+        masks = {}
+        for field_name in required_fields:
+            column = pd.Series([record.get(field_name) for record in records], dtype=object)
+            missing = column.isna() | column.eq("")
+            try:
+                missing |= column.str.isspace().fillna(False).astype(bool)
+            except AttributeError:
+                pass  # No strings in the column
+            masks[field_name] = missing.to_numpy(dtype=bool)
+        
+        frame = pd.DataFrame(masks)
+        missing_per_record: list[list[str]] = [[] for _ in records]
+        for position in frame.index[frame.any(axis=1)]:
+            row = frame.iloc[position]
+            missing_per_record[position] = [f for f in required_fields if row[f]]
+        return missing_per_record
+    
+    def _schema_issues(
+        self,
+        records: list[dict[str, Any]],
+        schema: type[BaseModel],
+    ) -> list[list[ValidationIssue]]:
+        """
+        Validate all records against a Pydantic schema in one call.
+        
+        Uses a cached ``TypeAdapter(list[schema])``, so pydantic-core loops
+        over the batch; the item index in each error's location maps it
+        back to its record.
+        
+        Returns:
+            Schema issues per record, in input order
+        """
+        adapter = self._batch_adapters.get(schema)
+        if adapter is None:
+            adapter = self._batch_adapters[schema] = TypeAdapter(list[schema])
         
         # Filter out internal fields
-        clean_record = {
-            k: v for k, v in record.items()
-            if not k.startswith("__")
-        }
+        clean_records = [
+            {k: v for k, v in record.items() if not k.startswith("__")}
+            for record in records
+        ]
         
+        issues: list[list[ValidationIssue]] = [[] for _ in records]
         try:
-            schema.model_validate(clean_record)
+            adapter.validate_python(clean_records)
         except ValidationError as e:
             for error in e.errors():
-                field_path = ".".join(str(loc) for loc in error["loc"])
-                issues.append(ValidationIssue(
-                    row=row_num,
+                position, *loc = error["loc"]
+                field_path = ".".join(str(part) for part in loc)
+                issues[position].append(ValidationIssue(
+                    row=records[position].get("__source_row__", 0),
                     field=field_path,
                     message=error["msg"],
                     severity=ValidationSeverity.ERROR,
-                    value=clean_record.get(field_path),
+                    value=clean_records[position].get(field_path),
                     code=error["type"],
                 ))
         
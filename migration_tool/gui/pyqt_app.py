@@ -3,52 +3,254 @@ Odoo Data Migration Tool - PyQt6 Edition with Full Functionality
 Integrated with Odoo connection, file loading, and import logic
 """
 
+import os
 import sys
-import json
+import mmap
 import time
+import shutil
+import threading
+import hashlib
+import dataclasses
 from pathlib import Path
-from typing import Optional
-from concurrent.futures import ThreadPoolExecutor
+from array import array
+from importlib import resources
+from string import Template
+from types import MappingProxyType, SimpleNamespace
+from functools import cached_property
+from typing import TYPE_CHECKING
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QComboBox, QLineEdit, QPushButton, QScrollArea,
+    QLabel, QComboBox, QLineEdit, QPushButton,
     QFrame, QProgressBar, QSizePolicy, QSpacerItem, QFileDialog,
     QListView, QStackedWidget, QMessageBox, QTabWidget, QTableWidget,
-    QTableWidgetItem, QHeaderView, QInputDialog
+    QTableWidgetItem, QHeaderView, QInputDialog, QTableView, QAbstractItemView,
+    QStyledItemDelegate, QCompleter
+)
+from PyQt6.QtCore import (
+    Qt, QSize, QObject, QRunnable, QThreadPool, QSignalBlocker, pyqtSignal, QTimer,
+    QAbstractTableModel, QModelIndex
+)
+from PyQt6.QtGui import (
+    QFont, QColor, QIcon, QPainter, QPixmap, QStandardItemModel, QStandardItem
 )
-from PyQt6.QtCore import Qt, QSize, QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont
 
-# Import Odoo modules
-from migration_tool.odoo import OdooClient, OdooConnectionError
-from migration_tool.core.schema import SchemaInspector, SchemaCache
-from migration_tool.core.reader import DataReader
-from migration_tool.core.cleaner import DataCleaner
-from migration_tool.odoo.adapters import get_adapter, ReferenceCache
-from migration_tool.core.templates import TemplateManager
-from migration_tool.core.quality_stats import QualityStats, QualityAnalyzer, IssueType
-from migration_tool.core.validation_rules import FieldValidator
+# Odoo and data modules are imported where first used to keep startup fast
+if TYPE_CHECKING:
+    from migration_tool.odoo import OdooClient
+    from migration_tool.core.schema import SchemaInspector
+    from migration_tool.core.templates import TemplateManager
+    from migration_tool.core.quality_stats import QualityStats, QualityAnalyzer
+    from migration_tool.core.validation_rules import FieldValidator
+    from migration_tool.core.reader import DataReader
+    from migration_tool.core.cleaner import DataCleaner
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fallback when the wheel is unavailable
+    import json
+
+    class orjson:  # noqa: N801 - mimics the orjson module surface
+        OPT_INDENT_2 = 1
+        OPT_SORT_KEYS = 2
+
+        @staticmethod
+        def loads(data):
+            return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+        @staticmethod
+        def dumps(obj, option: int = 0) -> bytes:
+            return json.dumps(
+                obj,
+                indent=2 if option & orjson.OPT_INDENT_2 else None,
+                sort_keys=bool(option & orjson.OPT_SORT_KEYS),
+                ensure_ascii=False,
+            ).encode("utf-8")
 
 
 # ============== Settings ==============
 SETTINGS_FILE = Path.home() / ".odoo_migration_tool" / "settings.json"
 
 
-def load_settings() -> dict:
+def _read_json(path: Path):
+    """Parse a JSON file straight from a read-only memory map."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if not size:
+            return {}
+        with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+    finally:
+        os.close(fd)
+
+
+@dataclasses.dataclass(slots=True)
+class Settings:
+    """Saved connection settings, stored under ``connection`` in settings.json."""
+    url: str = ""
+    database: str = ""
+    username: str = ""
+    password: str = ""
+    last_template: str = ""
+    batch_size: int = 0  # Records per create RPC; 0 calibrates on the next import
+
+
+_SETTINGS_KEYS = frozenset(f.name for f in dataclasses.fields(Settings))
+
+
+def load_settings() -> Settings:
     if SETTINGS_FILE.exists():
         try:
-            with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            conn = _read_json(SETTINGS_FILE).get('connection', {})
+            return Settings(**{k: v for k, v in conn.items() if k in _SETTINGS_KEYS})
         except Exception:
             pass
-    return {}
+    return Settings()
+
 
+_settings_blob_hash: int | None = None
 
-def save_settings(settings: dict):
+
+def save_settings(settings: Settings):
+    """Write settings atomically, skipping the write when nothing changed."""
+    global _settings_blob_hash
+    
+    blob = orjson.dumps(
+        {'connection': dataclasses.asdict(settings)},
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
+    )
+    blob_hash = hash(blob)
+    if blob_hash == _settings_blob_hash and SETTINGS_FILE.exists():
+        return
+    
     SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(settings, f, indent=2)
+    tmp = SETTINGS_FILE.with_suffix(".tmp")
+    tmp.write_bytes(blob)
+    os.replace(tmp, SETTINGS_FILE)
+    _settings_blob_hash = blob_hash
+
+
+# ============== Schema Cache ==============
+SCHEMA_CACHE_DIR = SETTINGS_FILE.parent / "schema"
+SCHEMA_CACHE_TTL = 24 * 3600  # seconds
+
+
+def schema_cache_path(url: str, db: str, server_version: str, model: str) -> Path:
+    key = hashlib.blake2b(
+        f"{url}|{db}|{server_version}|{model}".encode(), digest_size=16
+    ).hexdigest()
+    return SCHEMA_CACHE_DIR / db / f"{key}.json"
+
+
+def load_schema_cache(path: Path) -> dict | None:
+    try:
+        if time.time() - path.stat().st_mtime < SCHEMA_CACHE_TTL:
+            return _read_json(path)
+    except Exception:
+        pass
+    return None
+
+
+def save_schema_cache(path: Path, fields: dict):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(orjson.dumps(fields))
+    except OSError:
+        pass  # Cache is best-effort
+
+
+def importable_fields(meta) -> dict:
+    """Project a ModelMeta to the importable-field dict shown in the mapping UI."""
+    if not meta:
+        return {}
+    return {
+        f.name: {"label": f.label, "type": f.field_type.value, "required": f.required}
+        for f in meta.fields.values() if f.importable
+    }
+
+
+def field_arrays(fields_data: dict) -> SimpleNamespace:
+    """Split ``{name: {label, type, required}}`` into parallel arrays.
+    
+    Arrays are in label order, the order the field dropdown shows, so the
+    sort happens once per loaded schema. ``idx`` maps a field name to its
+    position in every array.
+    """
+    fields = SimpleNamespace(names=[], labels=[], types=[], required=array("b"), idx={})
+    ordered = sorted(fields_data.items(), key=lambda item: item[1]["label"])
+    for i, (name, info) in enumerate(ordered):
+        name = sys.intern(name)
+        fields.names.append(name)
+        fields.labels.append(info["label"])
+        fields.types.append(info.get("type", "char"))
+        fields.required.append(1 if info["required"] else 0)
+        fields.idx[name] = i
+    return fields
+
+
+def clear_schema_cache(db: str):
+    shutil.rmtree(SCHEMA_CACHE_DIR / db, ignore_errors=True)
+
+
+# ============== Import Tuning ==============
+IMPORT_BATCH_CANDIDATES = (200, 500, 1000)  # Tried in order when batch_size is auto (0)
+IMPORT_WORKERS = 4  # Concurrent create RPCs; keeps load on the Odoo server bounded
+ROLLBACK_CHUNK_SIZE = 1000  # IDs per unlink call
+
+
+# ============== Last Import Log ==============
+# "<model>\n" header followed by the created IDs as native int64s. IDs are
+# appended after every batch so a crash mid-import can still be rolled back.
+LAST_IMPORT_FILE = SETTINGS_FILE.parent / "last_import.bin"
+
+
+def start_last_import(model: str):
+    """Replace the log with an empty one for a new import of ``model``.
+    
+    Called once the new import has created its first records, so the
+    previous import stays undoable until then.
+    """
+    LAST_IMPORT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = LAST_IMPORT_FILE.with_suffix(".tmp")
+    tmp.write_bytes(model.encode("utf-8") + b"\n")
+    os.replace(tmp, LAST_IMPORT_FILE)
+
+
+def append_last_import(ids: array):
+    with open(LAST_IMPORT_FILE, "ab") as f:
+        f.write(ids.tobytes())
+
+
+def save_last_import(model: str, ids: array):
+    """Rewrite the log atomically, e.g. with the IDs a rollback left behind."""
+    if not ids:
+        clear_last_import()
+        return
+    LAST_IMPORT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = LAST_IMPORT_FILE.with_suffix(".tmp")
+    tmp.write_bytes(model.encode("utf-8") + b"\n" + ids.tobytes())
+    os.replace(tmp, LAST_IMPORT_FILE)
+
+
+def load_last_import() -> tuple[str, array]:
+    """Return ``(model, ids)`` from the log; a torn trailing ID is dropped."""
+    ids = array("q")
+    try:
+        data = LAST_IMPORT_FILE.read_bytes()
+    except OSError:
+        return "", ids
+    header, sep, body = data.partition(b"\n")
+    if not sep:
+        return "", ids
+    ids.frombytes(body[:len(body) - len(body) % ids.itemsize])
+    return header.decode("utf-8", "replace"), ids
+
+
+def clear_last_import():
+    LAST_IMPORT_FILE.unlink(missing_ok=True)
 
 
 # ============== App Config ==============
@@ -75,8 +277,13 @@ MODEL_LABELS = {
     "project.task": "Project Tasks",
 }
 
+# Model names like "res.partner" are not auto-interned; intern them once so
+# button properties and dict keys share one string object
+ODOO_APPS = {app: [sys.intern(m) for m in models] for app, models in ODOO_APPS.items()}
+MODEL_LABELS = {sys.intern(model): label for model, label in MODEL_LABELS.items()}
+
 # Field icons for dropdown display
-FIELD_ICONS = {
+FIELD_ICONS = MappingProxyType({
     # Specific field names
     "name": "≡",
     "display_name": "≡",
@@ -130,7 +337,7 @@ FIELD_ICONS = {
     "_datetime": "📅",
     "_selection": "▼",
     "_binary": "📎",
-}
+})
 
 
 # ============== Color Palette (Dark Theme) ==============
@@ -156,360 +363,174 @@ COLORS = {
 
 
 # ============== Global QSS Stylesheet ==============
-STYLESHEET = f"""
-* {{
-    font-family: 'Segoe UI', 'Inter', -apple-system, sans-serif;
-}}
-
-QMainWindow {{
-    background-color: {COLORS['bg_dark']};
-}}
-
-QWidget {{
-    color: {COLORS['text_primary']};
-    font-size: 13px;
-}}
-
-#sidebar {{
-    background-color: {COLORS['sidebar']};
-    border-right: 1px solid {COLORS['border']};
-}}
-
-QLabel#sectionLabel {{
-    color: {COLORS['text_muted']};
-    font-size: 10px;
-    font-weight: 600;
-    letter-spacing: 1px;
-    padding: 0px;
-}}
-
-QLabel#titleLabel {{
-    font-size: 26px;
-    font-weight: 600;
-    color: {COLORS['text_primary']};
-    padding: 0px;
-}}
-
-QLabel#subtitleLabel {{
-    font-size: 13px;
-    color: {COLORS['text_secondary']};
-    padding: 0px;
-}}
-
-QLabel#statusConnected {{
-    color: {COLORS['accent']};
-    font-size: 13px;
-    font-weight: 500;
-}}
-
-QLabel#statusDisconnected {{
-    color: {COLORS['text_muted']};
-    font-size: 13px;
-}}
-
-QLabel#statusError {{
-    color: {COLORS['error']};
-    font-size: 13px;
-}}
-
-QComboBox {{
-    background-color: {COLORS['input_bg']};
-    border: 1px solid {COLORS['border']};
-    border-radius: 8px;
-    padding: 12px 16px;
-    padding-right: 35px;
-    color: {COLORS['text_primary']};
-    font-size: 13px;
-    min-height: 18px;
-}}
-
-QComboBox:hover {{
-    border-color: {COLORS['border_light']};
-}}
-
-QComboBox:focus {{
-    border-color: {COLORS['accent']};
-}}
-
-QComboBox::drop-down {{
-    border: none;
-    width: 35px;
-}}
-
-QComboBox::down-arrow {{
-    image: none;
-    border-style: solid;
-    border-width: 5px 5px 0 5px;
-    border-color: {COLORS['text_secondary']} transparent transparent transparent;
-}}
-
-QComboBox QAbstractItemView {{
-    background-color: {COLORS['dropdown_bg']};
-    border: 1px solid {COLORS['border_light']};
-    border-radius: 8px;
-    padding: 6px;
-    selection-background-color: {COLORS['dropdown_hover']};
-    color: {COLORS['text_primary']};
-    outline: none;
-}}
-
-QComboBox QAbstractItemView::item {{
-    padding: 10px 14px;
-    border-radius: 4px;
-    min-height: 20px;
-}}
-
-QComboBox QAbstractItemView::item:hover {{
-    background-color: {COLORS['dropdown_hover']};
-}}
-
-QComboBox QAbstractItemView::item:selected {{
-    background-color: {COLORS['accent']};
-    color: white;
-}}
-
-QComboBox#fieldDropdown {{
-    background-color: {COLORS['dropdown_bg']};
-    border: none;
-    border-radius: 8px;
-    padding: 10px 14px;
-}}
-
-QLineEdit {{
-    background-color: {COLORS['input_bg']};
-    border: 1px solid {COLORS['border']};
-    border-radius: 8px;
-    padding: 12px 16px;
-    color: {COLORS['text_primary']};
-    font-size: 13px;
-}}
-
-QLineEdit:focus {{
-    border-color: {COLORS['accent']};
-}}
-
-QPushButton {{
-    border-radius: 6px;
-    padding: 10px 20px;
-    font-size: 13px;
-    font-weight: 500;
-}}
-
-QPushButton#primaryBtn {{
-    background-color: {COLORS['accent']};
-    color: white;
-    border: none;
-}}
-
-QPushButton#primaryBtn:hover {{
-    background-color: {COLORS['accent_hover']};
-}}
-
-QPushButton#primaryBtn:pressed {{
-    background-color: #14532d;
-}}
-
-QPushButton#primaryBtn:disabled {{
-    background-color: {COLORS['border']};
-    color: {COLORS['text_muted']};
-}}
-
-QPushButton#outlineBtn {{
-    background-color: transparent;
-    color: {COLORS['text_primary']};
-    border: 1px solid {COLORS['border_light']};
-}}
-
-QPushButton#outlineBtn:hover {{
-    background-color: {COLORS['input_bg']};
-    border-color: {COLORS['text_muted']};
-}}
-
-QPushButton#outlineBtn:pressed {{
-    background-color: {COLORS['border']};
-    border-color: {COLORS['accent']};
-}}
-
-QPushButton#outlineBtn:disabled {{
-    color: {COLORS['text_muted']};
-    border-color: {COLORS['border']};
-}}
-
-QPushButton#modelBtn {{
-    background-color: transparent;
-    color: {COLORS['text_secondary']};
-    border: none;
-    text-align: left;
-    padding: 14px 16px;
-    font-size: 13px;
-    border-radius: 8px;
-}}
-
-QPushButton#modelBtn:hover {{
-    background-color: {COLORS['input_bg']};
-    color: {COLORS['text_primary']};
-}}
-
-QPushButton#modelBtnActive {{
-    background-color: {COLORS['input_bg']};
-    color: {COLORS['text_primary']};
-    border: none;
-    text-align: left;
-    padding: 14px 16px;
-    font-size: 13px;
-    border-radius: 8px;
-}}
-
-QPushButton#iconBtn {{
-    background-color: transparent;
-    border: none;
-    padding: 12px;
-    border-radius: 8px;
-    color: {COLORS['text_muted']};
-    font-size: 18px;
-}}
-
-QPushButton#iconBtn:hover {{
-    background-color: {COLORS['input_bg']};
-}}
-
-QPushButton#addMappingBtn {{
-    background-color: transparent;
-    color: {COLORS['text_secondary']};
-    border: 1px solid {COLORS['border']};
-    border-radius: 6px;
-    padding: 10px 16px;
-    font-size: 13px;
-}}
-
-QPushButton#addMappingBtn:hover {{
-    background-color: {COLORS['input_bg']};
-    color: {COLORS['text_primary']};
-}}
-
-QProgressBar {{
-    background-color: {COLORS['border']};
-    border: none;
-    border-radius: 3px;
-    height: 6px;
-}}
-
-QProgressBar::chunk {{
-    background-color: {COLORS['accent']};
-    border-radius: 3px;
-}}
-
-QScrollArea {{
-    border: none;
-    background-color: transparent;
-}}
-
-QScrollBar:vertical {{
-    background-color: {COLORS['bg_dark']};
-    width: 10px;
-    border-radius: 5px;
-}}
-
-QScrollBar::handle:vertical {{
-    background-color: {COLORS['border_light']};
-    border-radius: 5px;
-    min-height: 40px;
-}}
-
-QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-    height: 0px;
-}}
-
-#tableHeader {{
-    background-color: {COLORS['sidebar']};
-    border: none;
-    border-radius: 8px 8px 0 0;
-}}
-
-#tableContainer {{
-    background-color: {COLORS['bg_card']};
-    border: none;
-    border-radius: 0 0 8px 8px;
-}}
-
-#footer {{
-    background-color: {COLORS['bg_card']};
-    border: none;
-    border-radius: 8px;
-}}
-"""
+# theme.qss holds ${color} placeholders filled from COLORS in a single pass
+STYLESHEET = Template(
+    (resources.files("migration_tool.gui") / "theme.qss").read_text(encoding="utf-8")
+).substitute(COLORS)
+
+
+def repolish(widget: QWidget):
+    """Re-apply the application stylesheet after a selector input changed."""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+def set_style_state(widget: QWidget, name: str, value: str):
+    """Set a dynamic property used by theme.qss selectors, repolishing only on change."""
+    if widget.property(name) != value:
+        widget.setProperty(name, value)
+        repolish(widget)
 
 
-# ============== Worker Thread for Background Tasks ==============
-class WorkerThread(QThread):
+# ============== Pooled Workers for Background Tasks ==============
+class WorkerSignals(QObject):
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
     progress = pyqtSignal(int, int, str)  # current, total, message
+
+
+class Worker(QRunnable):
+    """Background task run on the shared QThreadPool instead of a fresh QThread."""
     
     def __init__(self, func, *args, **kwargs):
         super().__init__()
         self.func = func
         self.args = args
         self.kwargs = kwargs
+        self.signals = WorkerSignals()
     
     def run(self):
         try:
             result = self.func(*self.args, **self.kwargs)
-            self.finished.emit(result)
+            self.signals.finished.emit(result)
         except Exception as e:
-            self.error.emit(str(e))
-
-
-# ============== Mapping Row Widget ==============
-class MappingRow(QWidget):
-    def __init__(self, file_col: str, sample_data: str, field_options: list, fields_data: dict = None, matched_field: str = "", is_odd: bool = True):
-        super().__init__()
-        self.file_col = file_col
-        self.fields_data = fields_data or {}
-        
-        bg_color = COLORS['row_odd'] if is_odd else COLORS['row_even']
-        self.setStyleSheet(f"background-color: {bg_color};")
-        
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(24, 16, 24, 16)
-        layout.setSpacing(0)
-        
-        file_label = QLabel(file_col)
-        file_label.setFixedWidth(200)
-        file_label.setStyleSheet(f"color: {COLORS['text_primary']}; font-size: 13px; font-weight: 500; background: transparent;")
-        layout.addWidget(file_label)
-        
-        sample_label = QLabel(sample_data[:40] if sample_data else "—")
-        sample_label.setFixedWidth(220)
-        sample_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 13px; background: transparent;")
-        layout.addWidget(sample_label)
-        
-        layout.addSpacing(20)
-        
-        self.dropdown = QComboBox()
-        self.dropdown.setObjectName("fieldDropdown")
-        self.dropdown.setView(QListView())
-        
-        # Add items with icons
-        self.dropdown.addItem("— Don't import —")
-        for option in field_options:
-            self.dropdown.addItem(option)
-        
-        if matched_field:
-            idx = self.dropdown.findText(matched_field)
-            if idx >= 0:
-                self.dropdown.setCurrentIndex(idx)
-        
-        self.dropdown.setMinimumWidth(200)
-        self.dropdown.setMaximumWidth(250)
-        layout.addWidget(self.dropdown)
-        layout.addStretch()
-    
-    def get_mapping(self) -> tuple:
-        field = self.dropdown.currentText()
-        if field == "— Don't import —":
-            return (self.file_col, None)
-        return (self.file_col, field)
+            self.signals.error.emit(str(e))
+
+
+# ============== Mapping Table Model ==============
+DONT_IMPORT = "— Don't import —"
+_SPACES_TO_UNDERSCORES = str.maketrans(" ", "_")  # File column -> field-name style key
+
+
+class MappingModel(QAbstractTableModel):
+    """Column mapping table: file column, sample value, mapped Odoo field.
+
+    Rows are stored as parallel lists so wide files cost three list slots
+    per column instead of a full widget tree per row.
+    """
+
+    COL_FILE, COL_SAMPLE, COL_FIELD = range(3)
+
+    def __init__(
+        self,
+        file_cols: list = None,
+        samples: list = None,
+        mapped: list = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.file_cols: list[str] = list(file_cols or [])
+        self.samples: list[str] = list(samples or [])
+        self.mapped: list[str | None] = list(mapped or [None] * len(self.file_cols))
+        self.icons: dict[str, QIcon] = {}  # field option text -> glyph icon
+
+    def set_rows(self, file_cols: list, samples: list, mapped: list):
+        self.beginResetModel()
+        self.file_cols = list(file_cols)
+        self.samples = list(samples)
+        self.mapped = list(mapped)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.file_cols)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else 3
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if col == self.COL_FILE:
+                return self.file_cols[row]
+            if col == self.COL_SAMPLE:
+                sample = self.samples[row]
+                return sample[:40] if sample else "—"
+            return self.mapped[row] or DONT_IMPORT
+        if role == Qt.ItemDataRole.DecorationRole and col == self.COL_FIELD:
+            return self.icons.get(self.mapped[row])
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return QColor(COLORS['row_odd'] if row % 2 == 0 else COLORS['row_even'])
+        if role == Qt.ItemDataRole.ForegroundRole:
+            color = 'text_secondary' if col == self.COL_SAMPLE else 'text_primary'
+            return QColor(COLORS[color])
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if (
+            not index.isValid()
+            or index.column() != self.COL_FIELD
+            or role != Qt.ItemDataRole.EditRole
+        ):
+            return False
+        self.mapped[index.row()] = None if not value or value == DONT_IMPORT else value
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        flags = Qt.ItemFlag.ItemIsEnabled
+        if index.column() == self.COL_FIELD:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def get_mappings(self) -> list[tuple]:
+        """Return ``(file_col, field)`` pairs for columns mapped to a field."""
+        return [(c, f) for c, f in zip(self.file_cols, self.mapped) if f]
+
+
+class FieldComboDelegate(QStyledItemDelegate):
+    """Creates the Odoo field combo only while a mapping cell is being edited.
+
+    Every editor shares the same field model and completer, so opening a
+    combo never re-allocates the field list.
+    """
+
+    def __init__(self, field_model: QStandardItemModel, completer: QCompleter, parent=None):
+        super().__init__(parent)
+        self._field_model = field_model
+        self._completer = completer
+
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        with QSignalBlocker(combo):
+            combo.setObjectName("fieldDropdown")
+            # Uniform, batched items let the popup skip per-item size hints
+            view = QListView()
+            view.setUniformItemSizes(True)
+            view.setLayoutMode(QListView.LayoutMode.Batched)
+            view.setBatchSize(50)
+            combo.setView(view)
+            combo.setMaxVisibleItems(15)
+            combo.setModel(self._field_model)
+            combo.setModelColumn(0)
+            combo.setEditable(True)
+            combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+            combo.setCompleter(self._completer)
+        combo.activated.connect(lambda _: self.commitData.emit(combo))
+        return combo
+
+    def setEditorData(self, editor, index):
+        idx = editor.findText(index.data(Qt.ItemDataRole.EditRole))
+        with QSignalBlocker(editor):
+            editor.setCurrentIndex(max(idx, 0))
+
+    def setModelData(self, editor, model, index):
+        # Ignore free text typed into the search box that matches no field
+        if editor.findText(editor.currentText()) >= 0:
+            model.setData(index, editor.currentText(), Qt.ItemDataRole.EditRole)
 
 
 # ============== Main Window ==============
@@ -519,7 +540,6 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Odoo Migration Tool")
         self.setMinimumSize(900, 600)
         self.resize(1000, 700)
-        self.setStyleSheet(STYLESHEET)
         
         # Center window on screen
         screen = QApplication.primaryScreen().geometry()
@@ -528,31 +548,60 @@ class MainWindow(QMainWindow):
         self.move(x, y)
         
         # State
-        self.client: Optional[OdooClient] = None
-        self.inspector: Optional[SchemaInspector] = None
+        self.client: OdooClient | None = None
+        self.inspector: SchemaInspector | None = None
+        self.server_version = ""
+        self._schema_lock = threading.Lock()
         self.settings = load_settings()
-        self.fields_data: dict = {}
+        self.fields = field_arrays({})
         self.file_columns: list = []
         self.file_records: list = []
+        self.file_samples: list[str] = []  # First-row value per file column
         self.current_model = ""
         self.file_path = ""
-        self.mapping_rows: list = []
-        self.worker: Optional[WorkerThread] = None
-        
-        # New: Template manager
-        self.template_manager = TemplateManager()
+        self._cached_result = None  # Parsed file, reused by validate/import
+        self.field_options: list[str] = []
+        self.icon_map: dict[str, str] = {}
+        self._icon_cache: dict[str, QIcon] = {}
+        self._match_index: dict[str, str] = {}
+        self._label_to_name: dict[str, str] = {}  # option text -> field name
+        
+        # Shared field list for every mapping combo
+        self.field_model = QStandardItemModel(self)
+        self.field_completer = QCompleter(self.field_model, self)
+        self.field_completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.field_completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        self.field_completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        self.worker: Worker | None = None
+        
+        # Reuse pooled threads; cap concurrent Odoo XML-RPC calls
+        self.thread_pool = QThreadPool.globalInstance()
+        self.thread_pool.setMaxThreadCount(4)
         
         # New: Rollback support - track created IDs
-        self.last_import_ids: list[int] = []
+        self.last_import_ids: array = array("q")  # 8 bytes per ID
         self.last_import_model: str = ""
+        self._import_model: str = ""
         
         # New: Preview data (cleaned)
         self.preview_data: list[dict] = []
         
         # New: Quality analysis
-        self.quality_stats: Optional[QualityStats] = None
-        self.field_validator = FieldValidator()
-        self.quality_analyzer = QualityAnalyzer()
+        self.quality_stats: QualityStats | None = None
+        self._quality_key: tuple | None = None  # (path, mtime, size, model) last analyzed
+        # File load and model switch both request analysis; coalesce them
+        self.quality_timer = QTimer(self)
+        self.quality_timer.setSingleShot(True)
+        self.quality_timer.setInterval(150)
+        self.quality_timer.timeout.connect(self._analyze_quality)
+        
+        # Progress updates are coalesced and painted at most ~30 times a second
+        self._pending_progress: tuple | None = None
+        self._shown_progress: tuple | None = None
+        self.progress_flush_timer = QTimer(self)
+        self.progress_flush_timer.setSingleShot(True)
+        self.progress_flush_timer.setInterval(33)
+        self.progress_flush_timer.timeout.connect(self._flush_progress)
         
         # Build UI
         central = QWidget()
@@ -574,14 +623,45 @@ class MainWindow(QMainWindow):
         
         # Load saved settings
         self._load_settings()
+        
+        # An import from an earlier session can still be undone
+        self.last_import_model, self.last_import_ids = load_last_import()
+        if self.last_import_ids:
+            self.rollback_btn.setEnabled(True)
+            count, model = len(self.last_import_ids), self.last_import_model
+            self._set_status(f"Last import ({count} {model} records) can be undone")
+    
+    @cached_property
+    def template_manager(self) -> "TemplateManager":
+        from migration_tool.core.templates import TemplateManager
+        return TemplateManager()
+    
+    @cached_property
+    def field_validator(self) -> "FieldValidator":
+        from migration_tool.core.validation_rules import FieldValidator
+        return FieldValidator()
+    
+    @cached_property
+    def quality_analyzer(self) -> "QualityAnalyzer":
+        from migration_tool.core.quality_stats import QualityAnalyzer
+        return QualityAnalyzer()
+    
+    # Reader and cleaner are stateless; one of each serves every worker
+    @cached_property
+    def reader(self) -> "DataReader":
+        from migration_tool.core.reader import DataReader
+        return DataReader()
+    
+    @cached_property
+    def cleaner(self) -> "DataCleaner":
+        from migration_tool.core.cleaner import DataCleaner
+        return DataCleaner()
     
     def _load_settings(self):
-        if 'connection' in self.settings:
-            c = self.settings['connection']
-            self.url_input.setText(c.get('url', ''))
-            self.db_input.setText(c.get('database', ''))
-            self.user_input.setText(c.get('username', ''))
-            self.pass_input.setText(c.get('password', ''))
+        self.url_input.setText(self.settings.url)
+        self.db_input.setText(self.settings.database)
+        self.user_input.setText(self.settings.username)
+        self.pass_input.setText(self.settings.password)
     
     def _create_sidebar(self) -> QWidget:
         sidebar = QWidget()
@@ -597,7 +677,7 @@ class MainWindow(QMainWindow):
         status_layout.setSpacing(12)
         
         self.conn_dot = QLabel("●")
-        self.conn_dot.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 16px;")
+        self.conn_dot.setObjectName("connDot")
         status_layout.addWidget(self.conn_dot)
         
         self.conn_status = QLabel("Disconnected")
@@ -616,7 +696,8 @@ class MainWindow(QMainWindow):
         
         self.app_combo = QComboBox()
         self.app_combo.setView(QListView())
-        self.app_combo.addItems(list(ODOO_APPS.keys()))
+        with QSignalBlocker(self.app_combo):
+            self.app_combo.addItems(list(ODOO_APPS.keys()))
         self.app_combo.currentTextChanged.connect(self._on_app_changed)
         layout.addWidget(self.app_combo)
         layout.addSpacing(30)
@@ -630,6 +711,8 @@ class MainWindow(QMainWindow):
         self.model_buttons_layout = QVBoxLayout()
         self.model_buttons_layout.setSpacing(2)
         self.model_buttons = []
+        self._model_btn_pool: list[QPushButton] = []
+        self._active_model_btn: QPushButton | None = None
         layout.addLayout(self.model_buttons_layout)
         
         layout.addStretch()
@@ -650,6 +733,13 @@ class MainWindow(QMainWindow):
         settings_btn.clicked.connect(lambda: self.content_stack.setCurrentIndex(1))
         icon_layout.addWidget(settings_btn)
         
+        refresh_btn = QPushButton("⟳")
+        refresh_btn.setObjectName("iconBtn")
+        refresh_btn.setFixedSize(44, 44)
+        refresh_btn.setToolTip("Refresh schema")
+        refresh_btn.clicked.connect(self._refresh_schema)
+        icon_layout.addWidget(refresh_btn)
+        
         icon_layout.addStretch()
         layout.addLayout(icon_layout)
         
@@ -660,7 +750,7 @@ class MainWindow(QMainWindow):
     
     def _create_import_view(self) -> QWidget:
         content = QWidget()
-        content.setStyleSheet(f"background-color: {COLORS['bg_dark']};")
+        content.setObjectName("bgDark")
         
         layout = QVBoxLayout(content)
         layout.setContentsMargins(50, 40, 50, 35)
@@ -680,7 +770,7 @@ class MainWindow(QMainWindow):
         # File info row
         file_row = QHBoxLayout()
         self.file_info = QLabel("📄 No file loaded")
-        self.file_info.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 13px;")
+        self.file_info.setObjectName("fileInfo")
         file_row.addWidget(self.file_info)
         file_row.addStretch()
         
@@ -694,7 +784,7 @@ class MainWindow(QMainWindow):
         
         # Quality Stats Dashboard
         self.quality_panel = QWidget()
-        self.quality_panel.setStyleSheet(f"background-color: {COLORS['bg_card']}; border: 1px solid {COLORS['border']}; border-radius: 8px;")
+        self.quality_panel.setObjectName("qualityPanel")
         self.quality_panel.setFixedHeight(60)
         self.quality_panel.setVisible(False)  # Hidden until file loaded
         
@@ -703,10 +793,10 @@ class MainWindow(QMainWindow):
         quality_layout.setSpacing(30)
         
         # Stats labels
-        self.stat_valid = self._create_stat_badge("✓ Valid", "0", COLORS['accent'])
-        self.stat_errors = self._create_stat_badge("✗ Errors", "0", COLORS['error'])
-        self.stat_warnings = self._create_stat_badge("⚠ Warnings", "0", "#f59e0b")
-        self.stat_duplicates = self._create_stat_badge("⊘ Duplicates", "0", "#8b5cf6")
+        self.stat_valid = self._create_stat_badge("✓ Valid", "0", "valid")
+        self.stat_errors = self._create_stat_badge("✗ Errors", "0", "errors")
+        self.stat_warnings = self._create_stat_badge("⚠ Warnings", "0", "warnings")
+        self.stat_duplicates = self._create_stat_badge("⊘ Duplicates", "0", "duplicates")
         
         quality_layout.addWidget(self.stat_valid)
         quality_layout.addWidget(self.stat_errors)
@@ -716,7 +806,7 @@ class MainWindow(QMainWindow):
         
         # Quality score
         self.quality_score_label = QLabel("Score: --")
-        self.quality_score_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 13px; font-weight: 600;")
+        self.quality_score_label.setObjectName("qualityScore")
         quality_layout.addWidget(self.quality_score_label)
         
         layout.addWidget(self.quality_panel)
@@ -733,13 +823,13 @@ class MainWindow(QMainWindow):
         
         for text, width in [("FILE COLUMN", 200), ("SAMPLE DATA", 220)]:
             lbl = QLabel(text)
-            lbl.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 11px; font-weight: 600; letter-spacing: 0.5px; background: transparent;")
+            lbl.setObjectName("tableHeaderLabel")
             lbl.setFixedWidth(width)
             header_layout.addWidget(lbl)
         
         header_layout.addSpacing(20)
         lbl = QLabel("ODOO FIELD")
-        lbl.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 11px; font-weight: 600; letter-spacing: 0.5px; background: transparent;")
+        lbl.setObjectName("tableHeaderLabel")
         header_layout.addWidget(lbl)
         header_layout.addStretch()
         
@@ -753,19 +843,26 @@ class MainWindow(QMainWindow):
         table_layout.setContentsMargins(0, 0, 0, 0)
         table_layout.setSpacing(0)
         
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        
-        self.rows_widget = QWidget()
-        self.rows_widget.setStyleSheet("background-color: transparent;")
-        self.rows_layout = QVBoxLayout(self.rows_widget)
-        self.rows_layout.setContentsMargins(0, 0, 0, 0)
-        self.rows_layout.setSpacing(0)
-        self.rows_layout.addStretch()
-        
-        scroll.setWidget(self.rows_widget)
-        table_layout.addWidget(scroll)
+        self.mapping_model = MappingModel(parent=self)
+        self.table = QTableView()
+        self.table.setObjectName("mappingTable")
+        self.table.setModel(self.mapping_model)
+        self.table.setItemDelegateForColumn(
+            MappingModel.COL_FIELD,
+            FieldComboDelegate(self.field_model, self.field_completer, self.table),
+        )
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.AllEditTriggers)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.table.setShowGrid(False)
+        self.table.setWordWrap(False)
+        self.table.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.table.horizontalHeader().hide()
+        self.table.verticalHeader().hide()
+        self.table.verticalHeader().setDefaultSectionSize(52)
+        self.table.setColumnWidth(MappingModel.COL_FILE, 224)
+        self.table.setColumnWidth(MappingModel.COL_SAMPLE, 240)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        table_layout.addWidget(self.table)
         
         layout.addWidget(table_container, 1)
         layout.addSpacing(15)
@@ -774,7 +871,6 @@ class MainWindow(QMainWindow):
         footer = QWidget()
         footer.setObjectName("footer")
         footer.setFixedHeight(70)
-        footer.setStyleSheet(f"background-color: {COLORS['bg_card']}; border-top: 1px solid {COLORS['border']};")
         
         footer_layout = QHBoxLayout(footer)
         footer_layout.setContentsMargins(24, 12, 24, 12)
@@ -790,7 +886,7 @@ class MainWindow(QMainWindow):
         
         # Progress text
         self.progress_text = QLabel("")
-        self.progress_text.setStyleSheet(f"color: {COLORS['accent']}; font-size: 12px; font-weight: 500;")
+        self.progress_text.setObjectName("progressText")
         self.progress_text.setMinimumWidth(100)
         footer_layout.addWidget(self.progress_text)
         
@@ -798,7 +894,7 @@ class MainWindow(QMainWindow):
         
         # Status
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 12px;")
+        self.status_label.setObjectName("statusLabel")
         footer_layout.addWidget(self.status_label)
         
         footer_layout.addSpacing(20)
@@ -820,13 +916,22 @@ class MainWindow(QMainWindow):
         self.import_btn.clicked.connect(self._start_import)
         footer_layout.addWidget(self.import_btn)
         
+        self.rollback_btn = QPushButton("Undo")
+        self.rollback_btn.setObjectName("outlineBtn")
+        self.rollback_btn.setFixedSize(90, 36)
+        self.rollback_btn.setEnabled(False)
+        self.rollback_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.rollback_btn.setToolTip("Delete the records created by the last import")
+        self.rollback_btn.clicked.connect(self._rollback_import)
+        footer_layout.addWidget(self.rollback_btn)
+        
         layout.addWidget(footer)
         
         return content
     
     def _create_settings_view(self) -> QWidget:
         content = QWidget()
-        content.setStyleSheet(f"background-color: {COLORS['bg_dark']};")
+        content.setObjectName("bgDark")
         
         layout = QVBoxLayout(content)
         layout.setContentsMargins(50, 40, 50, 35)
@@ -890,33 +995,52 @@ class MainWindow(QMainWindow):
     # ============== Event Handlers ==============
     
     def _on_app_changed(self, app_name: str):
-        # Clear existing model buttons
-        for btn in self.model_buttons:
-            btn.deleteLater()
-        self.model_buttons.clear()
-        
-        # Add new model buttons
-        if app_name in ODOO_APPS:
-            for i, model in enumerate(ODOO_APPS[app_name]):
-                label = MODEL_LABELS.get(model, model)
-                btn = QPushButton(f"›   {label}")
-                btn.setObjectName("modelBtn")
-                btn.setProperty("model", model)
-                btn.clicked.connect(lambda checked, m=model, l=label: self._select_model(m, l))
-                self.model_buttons_layout.addWidget(btn)
-                self.model_buttons.append(btn)
-    
-    def _select_model(self, model: str, label: str):
-        # Update button styles
-        for btn in self.model_buttons:
-            if btn.property("model") == model:
-                btn.setObjectName("modelBtnActive")
-                btn.setText(f"✓   {label}")
+        models = ODOO_APPS.get(app_name, [])
+        
+        # Reuse pooled model buttons instead of recreating them
+        for i, model in enumerate(models):
+            if i < len(self._model_btn_pool):
+                btn = self._model_btn_pool[i]
             else:
+                btn = QPushButton()
+                btn.clicked.connect(
+                    lambda checked, b=btn: self._select_model(
+                        b.property("model"), b.property("label")
+                    )
+                )
+                self.model_buttons_layout.addWidget(btn)
+                self._model_btn_pool.append(btn)
+            
+            label = MODEL_LABELS.get(model, model)
+            btn.setText(f"›   {label}")
+            btn.setProperty("model", model)
+            btn.setProperty("label", label)
+            if btn.objectName() != "modelBtn":
                 btn.setObjectName("modelBtn")
-                lbl = MODEL_LABELS.get(btn.property("model"), btn.property("model"))
-                btn.setText(f"›   {lbl}")
-            btn.setStyleSheet(btn.styleSheet())  # Force refresh
+                repolish(btn)
+            btn.setVisible(True)
+        
+        # Hide leftover buttons from a larger app
+        for btn in self._model_btn_pool[len(models):]:
+            btn.setVisible(False)
+        self.model_buttons = self._model_btn_pool[:len(models)]
+        self._active_model_btn = None  # Pooled buttons were reset above
+        
+        self._prefetch_models(models)
+    
+    def _select_model(self, model: str, label: str, refresh: bool = False):
+        # Update button styles: only the previous and new active buttons change
+        btn = next((b for b in self.model_buttons if b.property("model") == model), None)
+        old = self._active_model_btn
+        if old is not None and old is not btn:
+            old.setObjectName("modelBtn")
+            old.setText(f"›   {old.property('label')}")
+            repolish(old)
+        if btn is not None:
+            btn.setObjectName("modelBtnActive")
+            btn.setText(f"✓   {label}")
+            repolish(btn)
+        self._active_model_btn = btn
         
         self.current_model = model
         
@@ -927,28 +1051,83 @@ class MainWindow(QMainWindow):
         self._set_status(f"Loading {label}...")
         
         # Load fields in background
-        def load_fields():
-            meta = self.inspector.get_model(model)
-            return {
-                f.name: {"label": f.label, "type": f.field_type.value, "required": f.required}
-                for f in meta.fields.values() if f.importable
-            } if meta else {}
-        
-        self.worker = WorkerThread(load_fields)
-        self.worker.finished.connect(self._on_fields_loaded)
-        self.worker.error.connect(lambda e: self._set_status(f"Error: {e[:40]}", error=True))
-        self.worker.start()
+        self.worker = Worker(self._load_model_fields, model, refresh)
+        self.worker.signals.finished.connect(self._on_fields_loaded)
+        self.worker.signals.error.connect(
+            lambda e: self._set_status(f"Error: {e[:40]}", error=True)
+        )
+        self.thread_pool.start(self.worker)
+    
+    def _load_model_fields(self, model: str, refresh: bool = False) -> SimpleNamespace:
+        """Return a model's importable fields as label-sorted ``field_arrays``.
+        
+        Runs on a pool thread, using the on-disk schema cache. The lock keeps
+        concurrent prefetch and selection tasks from sharing the XML-RPC proxy
+        at the same time.
+        """
+        client, inspector = self.client, self.inspector
+        cache_path = schema_cache_path(client.url, client.db, self.server_version, model)
+        
+        with self._schema_lock:
+            fields = None if refresh else load_schema_cache(cache_path)
+            if fields is None:
+                fields = importable_fields(inspector.get_model(model, refresh=refresh))
+                if fields:
+                    save_schema_cache(cache_path, fields)
+        return field_arrays(fields)
     
-    def _on_fields_loaded(self, fields_data: dict):
-        self.fields_data = fields_data
-        self._set_status(f"Loaded {len(fields_data)} fields")
+    def _prefetch_models(self, models: list[str]):
+        """Warm the schema cache for the given models in the background."""
+        if not (self.client and self.inspector):
+            return
+        
+        from migration_tool.core.schema import SchemaInspector
+        
+        client, cache = self.client, self.inspector.cache
+        paths = {
+            m: schema_cache_path(client.url, client.db, self.server_version, m) for m in models
+        }
+        
+        def prefetch():
+            pending = [m for m in models if load_schema_cache(paths[m]) is None]
+            if not pending:
+                return
+            # Own client so the prefetch never shares a proxy with selection
+            worker_client = dataclasses.replace(client)
+            worker_client._uid = client._uid
+            inspector = SchemaInspector(worker_client, cache=cache, auto_cache=False)
+            try:
+                # fields_get for every pending model in one multicall
+                schemas = inspector.preload_models(pending)
+            except Exception:
+                return  # Prefetch is best-effort; selection reports errors
+            for model in pending:
+                fields = importable_fields(schemas.get(model))
+                if fields:
+                    save_schema_cache(paths[model], fields)
+        
+        self.thread_pool.start(Worker(prefetch), -1)  # Below user-triggered tasks
+    
+    def _on_fields_loaded(self, fields: SimpleNamespace):
+        self.fields = fields
+        # Options and mapping rows both change; repaint the table once for both
+        self.table.setUpdatesEnabled(False)
+        try:
+            self._build_field_model()
+            if self.file_columns:
+                self._build_mappings()
+        finally:
+            self.table.setUpdatesEnabled(True)
+        self._set_status(f"Loaded {len(self.fields.names)} fields")
         if self.file_columns:
-            self._build_mappings()
+            self.quality_timer.start()  # Required fields changed
         
         # Refresh template list for this model
         self._refresh_templates()
     
     def _connect(self):
+        from migration_tool.odoo import OdooClient
+        
         self._set_status("Connecting...")
         
         def do_connect():
@@ -957,43 +1136,72 @@ class MainWindow(QMainWindow):
                 db=self.db_input.text(),
                 username=self.user_input.text(),
                 password=self.pass_input.text(),
+                protocol="jsonrpc",
             )
             version = client.version()
             client.authenticate()
             return client, version
         
-        self.worker = WorkerThread(do_connect)
-        self.worker.finished.connect(self._on_connected)
-        self.worker.error.connect(self._on_connect_error)
-        self.worker.start()
+        self.worker = Worker(do_connect)
+        self.worker.signals.finished.connect(self._on_connected)
+        self.worker.signals.error.connect(self._on_connect_error)
+        self.thread_pool.start(self.worker)
     
     def _on_connected(self, result):
+        from migration_tool.core.schema import SchemaInspector, SchemaCache
+        
         self.client, version = result
         self.inspector = SchemaInspector(self.client, cache=SchemaCache())
         
-        self.conn_dot.setStyleSheet(f"color: {COLORS['accent']}; font-size: 16px;")
+        # Drop cached schemas when the server was upgraded since the last visit
+        self.server_version = version.get('server_version', '')
+        marker = SCHEMA_CACHE_DIR / self.client.db / ".version"
+        try:
+            if marker.read_text() != self.server_version:
+                clear_schema_cache(self.client.db)
+        except OSError:
+            pass
+        try:
+            marker.parent.mkdir(parents=True, exist_ok=True)
+            marker.write_text(self.server_version)
+        except OSError:
+            pass
+        
+        set_style_state(self.conn_dot, "state", "connected")
         v = version.get('server_version', '?').split('.')[0]
         self.conn_status.setText(f"Connected: Odoo v{v}")
         self.conn_status.setObjectName("statusConnected")
-        self.conn_status.setStyleSheet(self.conn_status.styleSheet())
+        repolish(self.conn_status)
         
         self._set_status("Connected successfully")
         self.content_stack.setCurrentIndex(0)
+        self._prefetch_models(ODOO_APPS.get(self.app_combo.currentText(), []))
+    
+    def _refresh_schema(self):
+        """Discard cached field schemas and reload the current model."""
+        if not self.client:
+            self._set_status("Connect to Odoo first", error=True)
+            return
+        clear_schema_cache(self.client.db)
+        if self.current_model:
+            label = MODEL_LABELS.get(self.current_model, self.current_model)
+            self._select_model(self.current_model, label, refresh=True)
+        else:
+            self._set_status("Schema cache cleared")
     
     def _on_connect_error(self, error: str):
-        self.conn_dot.setStyleSheet(f"color: {COLORS['error']}; font-size: 16px;")
+        set_style_state(self.conn_dot, "state", "error")
         self.conn_status.setText("Connection Failed")
         self.conn_status.setObjectName("statusError")
+        repolish(self.conn_status)
         self._set_status("Connection failed", error=True)
         self._show_error("Connection Failed", f"Could not connect to Odoo:\n\n{error}")
     
     def _save_settings(self):
-        self.settings['connection'] = {
-            'url': self.url_input.text(),
-            'database': self.db_input.text(),
-            'username': self.user_input.text(),
-            'password': self.pass_input.text(),
-        }
+        self.settings.url = self.url_input.text()
+        self.settings.database = self.db_input.text()
+        self.settings.username = self.user_input.text()
+        self.settings.password = self.pass_input.text()
         save_settings(self.settings)
         self._set_status("Settings saved")
     
@@ -1008,107 +1216,166 @@ class MainWindow(QMainWindow):
     
     def _load_file(self, path: str):
         self._set_status("Loading file...")
+        self._cached_result = None
+        reader = self.reader
         
         def do_load():
-            reader = DataReader()
             result = reader.read_file(Path(path))
-            columns = [c for c in result.data.columns if not c.startswith("_")]
-            records = result.data.head(5).to_dict("records")
-            return columns, records, result.total_rows
-        
-        self.worker = WorkerThread(do_load)
-        self.worker.finished.connect(self._on_file_loaded)
-        self.worker.error.connect(self._on_file_error)
-        self.worker.start()
+            df = result.data
+            # Internal columns (e.g. __source_row__) start with "_"
+            columns = df.columns[~df.columns.astype(str).str.startswith("_")].tolist()
+            # First-row sample strings for the mapping table, straight from
+            # the row's values; a few record dicts only for quality checks
+            if len(df):
+                samples = [str(v) for v in df[columns].iloc[0].tolist()]
+            else:
+                samples = [""] * len(columns)
+            records = df.iloc[:5].to_dict("records")
+            return columns, records, samples, result.total_rows, result
+        
+        self.worker = Worker(do_load)
+        self.worker.signals.finished.connect(self._on_file_loaded)
+        self.worker.signals.error.connect(self._on_file_error)
+        self.thread_pool.start(self.worker)
     
     def _on_file_error(self, error: str):
         self._set_status("File load failed", error=True)
         self._show_error("File Load Failed", f"Could not load file:\n\n{error}")
     
     def _on_file_loaded(self, result):
-        self.file_columns, self.file_records, total_rows = result
+        (
+            self.file_columns, self.file_records, self.file_samples,
+            total_rows, self._cached_result,
+        ) = result
         self.file_info.setText(f"📄 {Path(self.file_path).name} • {total_rows} rows • {len(self.file_columns)} columns")
-        self.file_info.setStyleSheet(f"color: {COLORS['text_primary']}; font-size: 13px;")
+        set_style_state(self.file_info, "loaded", "true")
         
         # Run quality analysis
-        self._analyze_quality()
+        self.quality_timer.start()
         
         self._set_status("File loaded")
         self.validate_btn.setEnabled(True)
         self.import_btn.setEnabled(True)
         
-        if self.fields_data:
+        if self.fields.names:
             self._build_mappings()
     
-    def _build_mappings(self):
-        # Clear existing rows
-        for row in self.mapping_rows:
-            row.deleteLater()
-        self.mapping_rows.clear()
+    def _icon_for(self, symbol: str) -> QIcon:
+        """Render a field glyph to an icon once and reuse it."""
+        icon = self._icon_cache.get(symbol)
+        if icon is None:
+            pixmap = QPixmap(20, 20)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setPen(QColor(COLORS['text_primary']))
+            painter.setFont(QFont("Segoe UI Emoji", 12))
+            painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, symbol)
+            painter.end()
+            icon = self._icon_cache[symbol] = QIcon(pixmap)
+        return icon
+    
+    def _build_field_model(self):
+        """Rebuild the shared field options once per loaded model."""
+        # Resolve each field's icon once: by name, else by type
+        fields = self.fields
+        self.icon_map = {
+            name: FIELD_ICONS.get(name) or FIELD_ICONS.get(f"_{ftype}", "≡")
+            for name, ftype in zip(fields.names, fields.types)
+        }
         
-        # Build field options with icons
+        # Glyphs are pre-rendered icons; item text stays plain. A label shared
+        # by several fields gets the technical name so each stays selectable.
+        label_counts = Counter(fields.labels)
         options = []
-        for name, info in sorted(self.fields_data.items(), key=lambda x: x[1]["label"]):
-            # Get icon for this field
-            icon = FIELD_ICONS.get(name, "")
-            if not icon:
-                # Try by type
-                field_type = info.get("type", "char")
-                icon = FIELD_ICONS.get(f"_{field_type}", "≡")
-            
-            prefix = "* " if info["required"] else ""
-            options.append(f"{icon}  {prefix}{info['label']}")
-        
-        sample = self.file_records[0] if self.file_records else {}
+        items = [QStandardItem(DONT_IMPORT)]
+        self.mapping_model.icons.clear()
+        for i in range(len(fields.names)):  # Already in label order
+            prefix = "* " if fields.required[i] else ""
+            label = fields.labels[i]
+            if label_counts[label] > 1:
+                label = f"{label} ({fields.names[i]})"
+            option = f"{prefix}{label}"
+            icon = self._icon_for(self.icon_map[fields.names[i]])
+            options.append(option)
+            items.append(QStandardItem(icon, option))
+            self.mapping_model.icons[option] = icon
+        self.field_options = options
+        
+        # Name / lowercased name / lowercased label / column-key label -> option
+        # text, first field wins; normalized once here, not per column
+        self._match_index = {}
+        self._label_to_name = dict(zip(options, fields.names))
+        for option, name, label in zip(options, fields.names, fields.labels):
+            label_l = label.lower()
+            for key in (name, name.lower(), label_l, label_l.translate(_SPACES_TO_UNDERSCORES)):
+                self._match_index.setdefault(key, option)
+        
+        # One clear + one bulk insert instead of a rowsInserted signal per field
+        self.field_model.clear()
+        self.field_model.invisibleRootItem().appendRows(items)
+    
+    def _build_mappings(self):
+        matched = [self._find_match(col) or None for col in self.file_columns]
         
-        for i, col in enumerate(self.file_columns):
-            matched = self._find_match(col)
-            sample_val = str(sample.get(col, ""))
-            
-            row = MappingRow(col, sample_val, options, self.fields_data, matched, is_odd=(i % 2 == 0))
-            self.rows_layout.insertWidget(i, row)
-            self.mapping_rows.append(row)
+        self.mapping_model.set_rows(self.file_columns, self.file_samples, matched)
+        self._restore_last_template()
     
-    def _find_match(self, col: str) -> str:
+    def _find_match(self, col: object) -> str:
         """Find matching Odoo field for a file column, including x_ prefix support."""
-        col_l = col.lower().strip().replace(" ", "_")
+        index = self._match_index
+        col = str(col)  # Excel headers can be numbers or NaN
+        col_l = col.strip().lower().translate(_SPACES_TO_UNDERSCORES)
         
-        # Build list of possible matches to try
-        candidates = [col, col_l]
+        match = index.get(col) or index.get(col_l)
         # Also try x_ prefixed version for custom fields
-        if not col_l.startswith("x_"):
-            candidates.append(f"x_{col_l}")
-        
-        for name, info in self.fields_data.items():
-            name_l = name.lower()
-            label_l = info["label"].lower()
-            
-            # Check if any candidate matches
-            for candidate in candidates:
-                if name == candidate or name_l == candidate or label_l == candidate:
-                    # Get icon
-                    icon = FIELD_ICONS.get(name, "")
-                    if not icon:
-                        field_type = info.get("type", "char")
-                        icon = FIELD_ICONS.get(f"_{field_type}", "≡")
-                    prefix = "* " if info["required"] else ""
-                    return f"{icon}  {prefix}{info['label']}"
-        return ""
+        if not match and not col_l.startswith("x_"):
+            match = index.get(f"x_{col_l}")
+        return match or ""
+    
+    def _field_mapping(self) -> dict[str, str]:
+        """Map file columns to Odoo field names from the selected options."""
+        label_to_name = self._label_to_name
+        return {
+            file_col: label_to_name[option]
+            for file_col, option in self.mapping_model.get_mappings()
+            if option in label_to_name
+        }
+    
+    def _read_mapped(self, mapping: dict):
+        """Apply a mapping to the parsed file, reading it only if not cached."""
+        reader = self.reader
+        if self._cached_result is not None:
+            return reader.apply_mapping(self._cached_result, mapping)
+        return reader.read_file(Path(self.file_path), mapping=mapping)
     
     def _validate(self):
         self._set_status("Validating...")
+        self.validate_btn.setEnabled(False)
+        mapping = self._field_mapping()
+        cleaner = self.cleaner
         
-        try:
-            mapping = {r.file_col: r.get_mapping()[1] for r in self.mapping_rows if r.get_mapping()[1]}
-            reader = DataReader()
-            result = reader.read_file(Path(self.file_path), mapping=mapping)
-            cleaner = DataCleaner()
-            df = cleaner.clean(result.data)
-            self._set_status(f"Validation successful: {len(df)} valid records")
-        except Exception as e:
-            self._set_status(f"Validation failed: {str(e)[:40]}", error=True)
+        def do_validate():
+            result = self._read_mapped(mapping)
+            return len(cleaner.clean(result.data))
+        
+        self.worker = Worker(do_validate)
+        self.worker.signals.finished.connect(self._on_validate_finished)
+        self.worker.signals.error.connect(self._on_validate_error)
+        self.thread_pool.start(self.worker)
+    
+    def _on_validate_finished(self, count: int):
+        self.validate_btn.setEnabled(True)
+        self._set_status(f"Validation successful: {count} valid records")
+    
+    def _on_validate_error(self, error: str):
+        self.validate_btn.setEnabled(True)
+        self._set_status(f"Validation failed: {error[:40]}", error=True)
     
     def _start_import(self):
+        from migration_tool.core.deduplicator import Deduplicator
+        from migration_tool.odoo import OdooAPIError
+        from migration_tool.odoo.adapters import get_adapter, ReferenceCache
+        
         if not self.client:
             self._set_status("Connect to Odoo first", error=True)
             return
@@ -1122,85 +1389,222 @@ class MainWindow(QMainWindow):
         self._set_status("Importing...")
         
         # Get mappings
-        mapping = {}
-        for row in self.mapping_rows:
-            file_col, field = row.get_mapping()
-            if field:
-                # Extract field name from label
-                for name, info in self.fields_data.items():
-                    if field.replace("* ", "") == info["label"]:
-                        mapping[file_col] = name
-                        break
+        mapping = self._field_mapping()
+        cleaner = self.cleaner
+        
+        client, model = self.client, self.current_model
+        self._import_model = model
+        done_lock = threading.Lock()
+        done = [0]
         
         def do_import():
-            reader = DataReader()
-            result = reader.read_file(Path(self.file_path), mapping=mapping)
-            cleaner = DataCleaner()
-            records = cleaner.clean(result.data).to_dict("records")
-            
+            result = self._read_mapped(mapping)
             cache = ReferenceCache()
             adapter = get_adapter(self.current_model, self.client, cache)
             
-            prepared = []
-            for r in records:
-                p = adapter.prepare_record(r)
-                if p:
-                    prepared.append(p)
+            # Column-wise coercion and reference lookup; dicts only at the end
+            records = adapter.prepare_frame(cleaner.clean(result.data)).to_dict("records")
+            
+            # Drop repeated rows and rows already in Odoo before any create;
+            # only models with a known natural key are deduplicated
+            skipped = 0
+            if model in Deduplicator.DEFAULT_KEYS:
+                dedupe = Deduplicator(client).find_duplicates(records, model)
+                records, skipped = dedupe.unique_records, dedupe.total_duplicates
+            
+            prepared = [p for p in adapter.prepare_records(records) if p]
             
-            BATCH = 50
             total = len(prepared)
-            created = 0
-            created_ids = []  # Track IDs for rollback
+            created_ids = array("q")  # Track IDs for rollback, also logged to disk
+            
+            def record_ids(ids: list[int]):
+                if not ids:
+                    return
+                if not created_ids:
+                    # Keep the previous import's log until this one has
+                    # created something, so a failed import can't lose it
+                    start_last_import(model)
+                batch = array("q", ids)
+                created_ids.extend(batch)
+                append_last_import(batch)
             
-            for b_start in range(0, total, BATCH):
-                b_end = min(b_start + BATCH, total)
-                batch = prepared[b_start:b_end]
-                # Create records one by one to get IDs
-                for record in batch:
+            def create_chunk(chunk: list) -> list[int]:
+                try:
+                    # One multi-create RPC per batch
+                    ids = client.create_batch(model, chunk, chunk_size=len(chunk))
+                except OdooAPIError:
+                    # Retry this batch record by record so one bad row
+                    # does not discard the rest
+                    ids = []
+                    for record in chunk:
+                        try:
+                            record_id = client.create(model, record)
+                            if record_id:
+                                ids.append(record_id)
+                        except Exception:
+                            pass  # Continue on error
+                with done_lock:
+                    done[0] += len(chunk)
+                    created = done[0]
+                message = f"Importing Records... {created}/{total}"
+                worker.signals.progress.emit(created, total, message)
+                return ids
+            
+            # Calibrate: time the first batches at each candidate size and
+            # keep the fastest per-record rate for the rest of the import
+            pos = 0
+            batch_size = self.settings.batch_size
+            if not batch_size:
+                best_rate = 0.0
+                for size in IMPORT_BATCH_CANDIDATES:
+                    chunk = prepared[pos:pos + size]
+                    if not chunk:
+                        break
+                    started = time.perf_counter()
+                    record_ids(create_chunk(chunk))
+                    rate = len(chunk) / max(time.perf_counter() - started, 1e-6)
+                    pos += len(chunk)
+                    if rate > best_rate:
+                        best_rate, batch_size = rate, size
+                self.settings.batch_size = batch_size or IMPORT_BATCH_CANDIDATES[0]
+                batch_size = self.settings.batch_size
+            
+            # Overlap round trips: up to IMPORT_WORKERS batches in flight
+            chunks = [prepared[i:i + batch_size] for i in range(pos, total, batch_size)]
+            error = None
+            with ThreadPoolExecutor(max_workers=IMPORT_WORKERS) as ex:
+                futures = [ex.submit(create_chunk, chunk) for chunk in chunks]
+                for future in as_completed(futures):
+                    if future.cancelled():
+                        continue
                     try:
-                        record_id = self.client.create(self.current_model, record)
-                        if record_id:
-                            created_ids.append(record_id)
-                            created += 1
-                    except Exception:
-                        pass  # Continue on error
+                        ids = future.result()
+                    except Exception as exc:
+                        # Stop batches not yet started; keep logging the
+                        # ones that finish so they can still be rolled back
+                        if error is None:
+                            error = exc
+                            for pending in futures:
+                                pending.cancel()
+                        continue
+                    record_ids(ids)
+            if error is not None:
+                raise error
             
-            return created, total, created_ids
-        
-        self.worker = WorkerThread(do_import)
-        self.worker.finished.connect(self._on_import_finished)
-        self.worker.error.connect(self._on_import_error)
-        self.worker.start()
-        
-        # Progress timer
-        self.progress_timer = QTimer()
-        self.progress_timer.timeout.connect(self._update_progress)
-        self.progress_timer.start(100)
+            return len(created_ids), total, created_ids, skipped
+        
+        worker = self.worker = Worker(do_import)
+        self.worker.signals.finished.connect(self._on_import_finished)
+        self.worker.signals.error.connect(self._on_import_error)
+        self.worker.signals.progress.connect(self._queue_progress)
+        self.thread_pool.start(self.worker)
+        self._pending_progress = self._shown_progress = None
     
-    def _update_progress(self):
-        # Animated progress for now
-        v = self.progress_bar.value()
-        if v < 95:
-            self.progress_bar.setValue(v + 1)
-            self.progress_text.setText(f"{v+1}% Importing Records...")
+    def _queue_progress(self, current: int, total: int, message: str):
+        """Record the latest progress; the flush timer paints it."""
+        self._pending_progress = (current, total, message)
+        if not self.progress_flush_timer.isActive():
+            self.progress_flush_timer.start()
+    
+    def _flush_progress(self):
+        progress = self._pending_progress
+        if progress is None or progress == self._shown_progress:
+            return
+        current, total, message = progress
+        pct = current * 100 // total if total else 0
+        self.progress_bar.setValue(pct)
+        self.progress_text.setText(f"{pct}% {message}")
+        self._shown_progress = progress
     
     def _on_import_finished(self, result):
-        self.progress_timer.stop()
-        created, total, _ = result
+        self.progress_flush_timer.stop()
+        created, total, created_ids, skipped = result
+        self.last_import_ids = created_ids
+        self.last_import_model = self._import_model
+        self.rollback_btn.setEnabled(bool(created_ids))
         
         self.progress_bar.setValue(100)
         self.progress_text.setText(f"100% Complete: {created}/{total}")
-        self._set_status(f"Import successful: {created} records created")
+        message = f"Import successful: {created} records created"
+        if skipped:
+            message += f", {skipped} duplicates skipped"
+        self._set_status(message)
         self.import_btn.setEnabled(True)
         self.validate_btn.setEnabled(True)
     
     def _on_import_error(self, error: str):
-        self.progress_timer.stop()
+        self.progress_flush_timer.stop()
+        # Batches created before the failure are in the log; allow undoing them
+        self.last_import_model, self.last_import_ids = load_last_import()
+        self.rollback_btn.setEnabled(bool(self.last_import_ids))
         self._set_status("Import failed", error=True)
         self.import_btn.setEnabled(True)
         self.validate_btn.setEnabled(True)
         self._show_error("Import Failed", f"Could not complete import:\n\n{error}")
     
+    def _rollback_import(self):
+        """Delete the records created by the last import, in chunks."""
+        if not self.last_import_ids:
+            return
+        if not self.client:
+            self._set_status("Connect to Odoo first", error=True)
+            return
+        
+        ids, model = self.last_import_ids, self.last_import_model
+        reply = QMessageBox.question(
+            self, "Undo Import",
+            f"Delete the {len(ids)} {model} records created by the last import?",
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        
+        self.rollback_btn.setEnabled(False)
+        self.import_btn.setEnabled(False)
+        self._set_status("Rolling back...")
+        client = self.client
+        
+        def do_rollback():
+            # Bounded unlink calls keep each request within server limits;
+            # on failure the IDs not yet deleted are handed back for a retry
+            total = len(ids)
+            for i in range(0, total, ROLLBACK_CHUNK_SIZE):
+                try:
+                    client.unlink(model, ids[i:i + ROLLBACK_CHUNK_SIZE].tolist())
+                except Exception as e:
+                    return i, ids[i:], str(e)
+                done = min(i + ROLLBACK_CHUNK_SIZE, total)
+                worker.signals.progress.emit(done, total, f"Deleting Records... {done}/{total}")
+            return total, array("q"), ""
+        
+        worker = self.worker = Worker(do_rollback)
+        self.worker.signals.finished.connect(self._on_rollback_finished)
+        self.worker.signals.error.connect(self._on_import_error)
+        self.worker.signals.progress.connect(self._queue_progress)
+        self.thread_pool.start(self.worker)
+        self._pending_progress = self._shown_progress = None
+    
+    def _on_rollback_finished(self, result):
+        self.progress_flush_timer.stop()
+        deleted, remaining, error = result
+        self.last_import_ids = remaining
+        save_last_import(self.last_import_model, remaining)
+        self.rollback_btn.setEnabled(bool(remaining))
+        self.import_btn.setEnabled(True)
+        
+        if error:
+            self._set_status(
+                f"Rollback incomplete: {deleted} deleted, {len(remaining)} left", error=True
+            )
+            self._show_error(
+                "Rollback Incomplete",
+                f"Deleted {deleted} records; {len(remaining)} remain.\n"
+                f"Press Undo again to retry.\n\n{error}",
+            )
+        else:
+            self.progress_bar.setValue(100)
+            self.progress_text.setText(f"100% Deleted: {deleted}")
+            self._set_status(f"Rollback complete: {deleted} records deleted")
+    
     def _show_error(self, title: str, message: str):
         """Show an error dialog to the user."""
         QMessageBox.critical(self, title, message)
@@ -1210,12 +1614,15 @@ class MainWindow(QMainWindow):
         QMessageBox.warning(self, title, message)
     
     def _set_status(self, text: str, error: bool = False):
-        color = COLORS['error'] if error else COLORS['text_secondary']
         self.status_label.setText(text)
-        self.status_label.setStyleSheet(f"color: {color}; font-size: 13px;")
+        set_style_state(self.status_label, "statusKind", "error" if error else "info")
     
-    def _create_stat_badge(self, label: str, value: str, color: str) -> QWidget:
-        """Create a stat badge widget for the quality dashboard."""
+    def _create_stat_badge(self, label: str, value: str, kind: str) -> QWidget:
+        """Create a stat badge widget for the quality dashboard.
+        
+        ``kind`` selects the value color from the ``QLabel#statValue[badge=...]``
+        rules in theme.qss.
+        """
         widget = QWidget()
         layout = QHBoxLayout(widget)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -1223,11 +1630,11 @@ class MainWindow(QMainWindow):
         
         value_lbl = QLabel(value)
         value_lbl.setObjectName("statValue")
-        value_lbl.setStyleSheet(f"color: {color}; font-size: 18px; font-weight: 700; background: transparent;")
+        value_lbl.setProperty("badge", kind)
         layout.addWidget(value_lbl)
         
         label_lbl = QLabel(label)
-        label_lbl.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 12px; background: transparent;")
+        label_lbl.setObjectName("statLabel")
         layout.addWidget(label_lbl)
         
         widget.value_label = value_lbl  # Store reference for updates
@@ -1243,13 +1650,24 @@ class MainWindow(QMainWindow):
         if not self.file_records:
             return
         
+        # Same file contents and model as last time: stats are still valid
+        try:
+            stat = os.stat(self.file_path)
+            key = (self.file_path, stat.st_mtime_ns, stat.st_size, self.current_model)
+        except (OSError, TypeError):
+            key = None
+        if key is not None and key == self._quality_key:
+            return
+        
         # Validate fields
         validation_results = self.field_validator.validate_records(self.file_records)
         
         # Get required fields from current model
         required_fields = []
-        if self.fields_data:
-            required_fields = [name for name, info in self.fields_data.items() if info.get("required")]
+        if self.fields.names:
+            required_fields = [
+                name for name, req in zip(self.fields.names, self.fields.required) if req
+            ]
         
         # Analyze quality
         self.quality_stats = self.quality_analyzer.analyze(
@@ -1257,6 +1675,7 @@ class MainWindow(QMainWindow):
             required_fields=required_fields,
             validation_results=validation_results,
         )
+        self._quality_key = key
         
         # Update dashboard
         self._update_quality_dashboard()
@@ -1275,17 +1694,17 @@ class MainWindow(QMainWindow):
         self._update_stat_badge(self.stat_warnings, stats.warning_rows)
         self._update_stat_badge(self.stat_duplicates, stats.duplicate_rows)
         
-        # Quality score with color
+        # Quality score with color band
         score = stats.quality_score
         if score >= 90:
-            score_color = COLORS['accent']
+            band = "high"
         elif score >= 70:
-            score_color = "#f59e0b"
+            band = "medium"
         else:
-            score_color = COLORS['error']
+            band = "low"
         
         self.quality_score_label.setText(f"Score: {score:.0f}%")
-        self.quality_score_label.setStyleSheet(f"color: {score_color}; font-size: 13px; font-weight: 600;")
+        set_style_state(self.quality_score_label, "scoreBand", band)
 
     
     # ============== Template Methods ==============
@@ -1300,9 +1719,20 @@ class MainWindow(QMainWindow):
             templates = self.template_manager.list_templates(model=self.current_model)
             for t in templates:
                 self.template_combo.addItem(f"📄 {t.name}")
+                if t.name == self.settings.last_template:
+                    self.template_combo.setCurrentIndex(self.template_combo.count() - 1)
         
         self.template_combo.blockSignals(False)
     
+    def _restore_last_template(self):
+        """Reapply the template loaded in an earlier session, if it fits this model."""
+        name = self.settings.last_template
+        if not name or not self.current_model:
+            return
+        template = self.template_manager.load_template(name)
+        if template and template.model == self.current_model:
+            self._apply_template(template)
+    
     def _on_template_selected(self, text: str):
         """Load selected template mappings."""
         if text.startswith("📄 "):
@@ -1310,19 +1740,18 @@ class MainWindow(QMainWindow):
             template = self.template_manager.load_template(name)
             if template:
                 self._apply_template(template)
+                self.settings.last_template = name
+                save_settings(self.settings)
     
     def _apply_template(self, template):
         """Apply template mappings to current rows."""
-        for row in self.mapping_rows:
-            file_col = row.file_col
+        model = self.mapping_model
+        name_to_option = {name: option for option, name in self._label_to_name.items()}
+        for row, file_col in enumerate(model.file_cols):
             if file_col in template.mappings:
-                target_field = template.mappings[file_col]
-                # Find matching dropdown item
-                for i in range(row.dropdown.count()):
-                    item_text = row.dropdown.itemText(i)
-                    if target_field in item_text:
-                        row.dropdown.setCurrentIndex(i)
-                        break
+                option = name_to_option.get(template.mappings[file_col])
+                if option:
+                    model.setData(model.index(row, MappingModel.COL_FIELD), option)
         self._set_status(f"Loaded template: {template.name}")
     
     def _save_template(self):
@@ -1339,15 +1768,7 @@ class MainWindow(QMainWindow):
             return
         
         # Gather mappings
-        mappings = {}
-        for row in self.mapping_rows:
-            file_col, field = row.get_mapping()
-            if field:
-                # Extract field name from label
-                for fname, info in self.fields_data.items():
-                    if info["label"] in field:
-                        mappings[file_col] = fname
-                        break
+        mappings = self._field_mapping()
         
         self.template_manager.save_template(
             name=name,
@@ -1361,6 +1782,7 @@ class MainWindow(QMainWindow):
 
 def main():
     app = QApplication(sys.argv)
+    app.setStyleSheet(STYLESHEET)
     font = QFont("Segoe UI", 10)
     app.setFont(font)
     
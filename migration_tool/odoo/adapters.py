@@ -5,35 +5,223 @@ Provides model-specific logic for handling Odoo model nuances,
 including Many2one field resolution, default values, and validation.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, ClassVar, Iterable, TypedDict
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from dataclasses import dataclass, field
 
+import pandas as pd
+
 from migration_tool.odoo.client import OdooClient
 
 
-@dataclass
+class _ClientKey:
+    """Hashable handle on a client, identified by server, database and user."""
+    
+    __slots__ = ("client", "key")
+    
+    def __init__(self, client: OdooClient):
+        self.client = client
+        self.key = (client.url, client.db, client.username)
+    
+    def __hash__(self) -> int:
+        return hash(self.key)
+    
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ClientKey) and self.key == other.key
+
+
+# Per-connection lookups shared by every adapter instance. Failures raise and
+# are therefore not cached.
+
+@lru_cache(maxsize=32)
+def _model_fields(conn: _ClientKey, model: str) -> frozenset[str]:
+    """Field names that exist on a model."""
+    return frozenset(conn.client.fields_get(model, attributes=["name"]))
+
+
+@lru_cache(maxsize=32)
+def _default_category(conn: _ClientKey) -> int | None:
+    """A root product category to use when a product has none."""
+    all_categ = conn.client.search(
+        "product.category",
+        [("parent_id", "=", False)],
+        limit=1
+    )
+    return all_categ[0] if all_categ else None
+
+
+@lru_cache(maxsize=32)
+def _default_uom(conn: _ClientKey) -> int | None:
+    """The "Units" unit of measure to use when a product has none."""
+    units_uom = conn.client.search(
+        "uom.uom",
+        [("name", "=", "Units")],
+        limit=1
+    )
+    if units_uom:
+        return units_uom[0]
+    # Try "Unit(s)" for older versions
+    units_uom = conn.client.search(
+        "uom.uom",
+        ["|", ("name", "ilike", "unit"), ("name", "ilike", "unité")],
+        limit=1
+    )
+    return units_uom[0] if units_uom else None
+
+
+@dataclass(slots=True)
 class ReferenceCache:
-    """Cache for resolved references to avoid repeated API calls."""
+    """
+    Cache for resolved references to avoid repeated API calls.
     
-    _cache: dict[str, dict[str, int]] = field(default_factory=dict)
+    Only found IDs are stored: a missing value may be created later in
+    the import. Bounded to maxsize entries (least recently used evicted
+    first) and safe to share between threads.
+    """
+    
+    maxsize: int = 100_000
+    _cache: OrderedDict[tuple[str, str], int] = field(default_factory=OrderedDict)
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False, compare=False)
+    
+    @staticmethod
+    def normalize(key: Any) -> str:
+        """Case-fold string keys; stringify anything else."""
+        return key.lower() if isinstance(key, str) else str(key)
     
     def get(self, model: str, key: str) -> int | None:
-        """Get cached reference ID."""
-        return self._cache.get(model, {}).get(key.lower() if isinstance(key, str) else str(key))
+        """Get cached reference ID, None if not cached."""
+        return self.get_normalized(model, self.normalize(key))
     
     def set(self, model: str, key: str, record_id: int) -> None:
         """Cache a reference ID."""
-        if model not in self._cache:
-            self._cache[model] = {}
-        self._cache[model][key.lower() if isinstance(key, str) else str(key)] = record_id
+        self.set_normalized(model, self.normalize(key), record_id)
+    
+    def get_normalized(self, model: str, key: str) -> int | None:
+        """Like get(), for a key already passed through normalize()."""
+        cache_key = (model, key)
+        with self._lock:
+            record_id = self._cache.get(cache_key)
+            if record_id is not None:
+                self._cache.move_to_end(cache_key)
+            return record_id
+    
+    def set_normalized(self, model: str, key: str, record_id: int) -> None:
+        """Like set(), for a key already passed through normalize()."""
+        cache_key = (model, key)
+        with self._lock:
+            self._cache[cache_key] = record_id
+            self._cache.move_to_end(cache_key)
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
     
     def clear(self, model: str | None = None) -> None:
         """Clear cache for a model or all models."""
-        if model:
-            self._cache.pop(model, None)
-        else:
-            self._cache.clear()
+        with self._lock:
+            if model:
+                for cache_key in [k for k in self._cache if k[0] == model]:
+                    del self._cache[cache_key]
+            else:
+                self._cache.clear()
+
+
+def _has_empty(record: dict[str, Any]) -> bool:
+    """Whether any value is None or an empty string; stops at the first one."""
+    return any(value is None or value == "" for value in record.values())
+
+
+def _to_int(value: Any, fallback: int) -> int:
+    """
+    Parse an integer field value, or return fallback if it is not one.
+    
+    Integral values ("3", "3.0", 3.0) convert; fractional ones ("3.7")
+    fall back rather than being truncated. Shared by prepare_record and
+    prepare_frame so both paths give the same result.
+    """
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        return fallback
+    return int(number) if number.is_integer() else fallback
+
+
+def _build_coercer(
+    bool_fields: frozenset[str],
+    int_fields: dict[str, int],
+    float_fields: dict[str, float],
+) -> Callable[[dict[str, Any]], None]:
+    """
+    Generate straight-line code coercing an adapter's typed fields in place.
+    
+    Unrolling the field loops at class creation removes the per-record
+    iteration over field names and fallbacks.
+    """
+    lines = ["def _coerce(p):"]
+    namespace: dict[str, Any] = {"_to_int": _to_int}
+    for name in sorted(bool_fields):
+        lines += [
+            f"    if {name!r} in p:",
+            f"        p[{name!r}] = bool(p[{name!r}])",
+        ]
+    numeric = [(n, int, f) for n, f in int_fields.items()]
+    numeric += [(n, float, f) for n, f in float_fields.items()]
+    for i, (name, caster, fallback) in enumerate(sorted(numeric, key=lambda n: n[0])):
+        namespace[f"_fallback{i}"] = fallback
+        if caster is int:
+            lines += [
+                f"    if {name!r} in p:",
+                f"        p[{name!r}] = _to_int(p[{name!r}], _fallback{i})",
+            ]
+            continue
+        lines += [
+            f"    if {name!r} in p:",
+            "        try:",
+            f"            p[{name!r}] = {caster.__name__}(p[{name!r}])",
+            "        except (ValueError, TypeError):",
+            f"            p[{name!r}] = _fallback{i}",
+        ]
+    lines.append("    return None")
+    exec(compile("\n".join(lines), "<adapter-coerce>", "exec"), namespace)
+    return namespace["_coerce"]
+
+
+class PartnerRecord(TypedDict, total=False):
+    """Shape of a prepared res.partner record (hot, coerced fields)."""
+    
+    name: str
+    is_company: bool
+    active: bool
+    customer_rank: int
+    supplier_rank: int
+    country_id: int | bool
+    state_id: int | bool
+    parent_id: int | bool
+
+
+class ProductRecord(TypedDict, total=False):
+    """Shape of a prepared product.template record (hot, coerced fields)."""
+    
+    name: str
+    detailed_type: str
+    active: bool
+    sale_ok: bool
+    purchase_ok: bool
+    list_price: float
+    standard_price: float
+    weight: float
+    volume: float
+    categ_id: int | bool
+    uom_id: int | bool
+    uom_po_id: int | bool
 
 
 class BaseAdapter(ABC):
@@ -47,11 +235,45 @@ class BaseAdapter(ABC):
     - Pre/post processing
     """
     
+    __slots__ = ("client", "cache", "_resolved", "_batch_misses")
+    
     # Override in subclasses
     MODEL_NAME: str = ""
     REQUIRED_FIELDS: list[str] = []
     REFERENCE_FIELDS: dict[str, tuple[str, str]] = {}  # field -> (model, search_field)
     
+    # Type coercions shared by prepare_record and prepare_frame
+    BOOL_FIELDS: frozenset[str] = frozenset()
+    INT_FIELDS: dict[str, int] = {}  # field -> fallback for unparsable values
+    FLOAT_FIELDS: dict[str, float] = {}  # field -> fallback for unparsable values
+    DEFAULTS: dict[str, Any] = {}  # field -> value filled in when missing
+    RECORD_TYPE: ClassVar[type | None] = None  # TypedDict of the prepared record
+    
+    # Values per search_read when resolving references in bulk
+    REFERENCE_LOOKUP_CHUNK = 1000
+    
+    # Bulk lookups run on a thread pool once a batch needs this many distinct ones
+    PARALLEL_LOOKUP_MIN = 3
+    REFERENCE_LOOKUP_WORKERS = 8
+    
+    # Distinct (model, value, field) lookups remembered per adapter (hits only)
+    RESOLVE_CACHE_SIZE = 8192
+    
+    # Derived from REFERENCE_FIELDS once per class by __init_subclass__
+    _REF_PLAN: tuple[tuple[str, tuple[str, str]], ...] = ()
+    _REF_FIELD_SET: frozenset[str] = frozenset()
+    
+    # Generated from BOOL/INT/FLOAT_FIELDS once per class by __init_subclass__
+    _coerce: ClassVar[Callable[[dict[str, Any]], None]]
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._REF_PLAN = tuple(cls.REFERENCE_FIELDS.items())
+        cls._REF_FIELD_SET = frozenset(cls.REFERENCE_FIELDS)
+        cls._coerce = staticmethod(  # type: ignore[assignment]
+            _build_coercer(cls.BOOL_FIELDS, cls.INT_FIELDS, cls.FLOAT_FIELDS)
+        )
+    
     def __init__(self, client: OdooClient, cache: ReferenceCache | None = None):
         """
         Initialize adapter.
@@ -62,6 +284,10 @@ class BaseAdapter(ABC):
         """
         self.client = client
         self.cache = cache or ReferenceCache()
+        # Held on the instance so it is released with the adapter
+        self._resolved: dict[tuple[str, Any, str], int] = {}
+        # (model, normalized value) pairs not found during one prepare_records call
+        self._batch_misses: set[tuple[str, str]] | None = None
     
     @abstractmethod
     def prepare_record(self, record: dict[str, Any]) -> dict[str, Any]:
@@ -76,43 +302,261 @@ class BaseAdapter(ABC):
         """
         pass
     
-    def resolve_references(self, record: dict[str, Any]) -> dict[str, Any]:
+    def _resolve(self, model: str, value: Any, search_field: str) -> int:
+        """
+        Look a reference up via the client, 0 if not found.
+        
+        Hits are remembered (up to RESOLVE_CACHE_SIZE); misses are asked
+        again, since the record may be created later in the import.
+        """
+        key = (model, value, search_field)
+        ref_id = self._resolved.get(key)
+        if ref_id is None:
+            ref_id = self.client.resolve_reference(model, value, search_field) or 0
+            if ref_id:
+                if len(self._resolved) >= self.RESOLVE_CACHE_SIZE:
+                    self._resolved.pop(next(iter(self._resolved)), None)
+                self._resolved[key] = ref_id
+        return ref_id
+    
+    def prepare_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply column-wise coercions and reference resolution to a whole frame.
+        
+        Runs the type coercions declared in BOOL_FIELDS / INT_FIELDS /
+        FLOAT_FIELDS as vectorized column operations and resolves each
+        distinct Many2one value once. Empty cells stay empty so
+        prepare_record still drops them; prepare_record remains the
+        per-row step for model-specific logic.
+        
+        Args:
+            df: Cleaned dataframe with Odoo field names as columns
+            
+        Returns:
+            New dataframe ready for per-record preparation
+        """
+        df = df.copy()
+        
+        # Warm the cache for all reference columns at once; tolist() gives
+        # plain Python values (np.int64 IDs would not pass as int)
+        self._prefetch_values(
+            (self.REFERENCE_FIELDS[column], df[column].dropna().unique().tolist())
+            for column in df.columns if column in self.REFERENCE_FIELDS
+        )
+        
+        for column in df.columns:
+            series = df[column]
+            present = series.notna() & (series != "")
+            
+            if column in self.BOOL_FIELDS:
+                coerced = series.astype(bool)
+            elif column in self.INT_FIELDS:
+                # Once per distinct value, with prepare_record's parsing rules
+                fallback = self.INT_FIELDS[column]
+                coerced = series.map({
+                    value: _to_int(value, fallback)
+                    for value in series[present].unique().tolist()
+                })
+            elif column in self.FLOAT_FIELDS:
+                numbers = pd.to_numeric(series.where(present), errors="coerce")
+                coerced = numbers.fillna(self.FLOAT_FIELDS[column]).astype(float)
+            elif column in self.REFERENCE_FIELDS:
+                ref_model, search_field = self.REFERENCE_FIELDS[column]
+                lookup = {
+                    value: self._resolve_value(ref_model, search_field, value)
+                    for value in series[present].unique().tolist()
+                }
+                coerced = series.map(lookup)
+            else:
+                continue
+            
+            df[column] = coerced.astype(object).where(present, None)
+        
+        return df
+    
+    def _resolve_value(self, ref_model: str, search_field: str, value: Any) -> int | bool:
+        """Resolve one Many2one value to an ID via the cache or API, False if not found."""
+        # Skip if already an integer ID
+        if isinstance(value, int):
+            return value
+        
+        # Check cache first
+        key = ReferenceCache.normalize(value)
+        cached_id = self.cache.get_normalized(ref_model, key)
+        if cached_id is not None:
+            return cached_id
+        
+        # A value already missed in this batch is not asked about again
+        misses = self._batch_misses
+        if misses is not None and (ref_model, key) in misses:
+            return False
+        
+        # Resolve via API
+        ref_id = self._resolve(ref_model, value, search_field)
+        if ref_id:
+            self.cache.set_normalized(ref_model, key, ref_id)
+        elif misses is not None:
+            misses.add((ref_model, key))
+        # Set to False (Odoo's null for Many2one) if not found
+        return ref_id or False
+    
+    def prepare_records(self, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Prepare a batch of records, resolving their references in bulk first.
+        
+        Args:
+            records: Raw records
+            
+        Returns:
+            Prepared records, in input order
+        """
+        self.resolve_references_bulk(records)
+        # Misses are shared within the batch only; later batches may find them
+        self._batch_misses = set()
+        try:
+            return [self.prepare_record(record) for record in records]
+        finally:
+            self._batch_misses = None
+    
+    def resolve_references_bulk(self, records: list[dict[str, Any]]) -> None:
+        """
+        Warm the reference cache for every Many2one value in a batch.
+        
+        Issues one search_read per distinct (model, search field) lookup
+        (per chunk of values) instead of one lookup per record; with
+        PARALLEL_LOOKUP_MIN or more lookups they run on a thread pool.
+        Values without an exact match are left to the per-record fallback
+        in resolve_references.
+        
+        Args:
+            records: Records with string references
+        """
+        self._prefetch_plan(self._REF_PLAN, records)
+    
+    def _prefetch_plan(
+        self,
+        plan: tuple[tuple[str, tuple[str, str]], ...],
+        records: list[dict[str, Any]],
+    ) -> None:
+        """Cache IDs for the uncached values of each planned field across records."""
+        self._prefetch_values(
+            (lookup, (record.get(field_name) for record in records))
+            for field_name, lookup in plan
+        )
+    
+    def _prefetch_values(
+        self,
+        lookup_values: Iterable[tuple[tuple[str, str], Iterable[Any]]],
+    ) -> None:
+        """Cache IDs for uncached string values, per (model, search field) lookup."""
+        lookups = self._pending_lookups(lookup_values)
+        
+        if len(lookups) < self.PARALLEL_LOOKUP_MIN:
+            for (ref_model, search_field), values in lookups:
+                rows = self._fetch_references(ref_model, search_field, values)
+                self._cache_rows(ref_model, search_field, rows)
+            return
+        
+        # Independent models: overlap the round-trips, write the cache from this thread
+        workers = min(len(lookups), self.REFERENCE_LOOKUP_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = {
+                ex.submit(self._fetch_references, ref_model, search_field, values):
+                    (ref_model, search_field)
+                for (ref_model, search_field), values in lookups
+            }
+            for future in as_completed(futures):
+                self._cache_rows(*futures[future], future.result())
+    
+    async def resolve_references_async(self, records: list[dict[str, Any]]) -> None:
+        """
+        Async counterpart of resolve_references_bulk for use from an event loop.
+        
+        Lookups are awaited concurrently with asyncio.gather; each runs the
+        blocking client call via asyncio.to_thread, so the loop is never
+        blocked and the client's per-thread connections are reused.
+        
+        Args:
+            records: Records with string references
+        """
+        lookups = self._pending_lookups(
+            (lookup, (record.get(field_name) for record in records))
+            for field_name, lookup in self._REF_PLAN
+        )
+        results = await asyncio.gather(*(
+            asyncio.to_thread(self._fetch_references, ref_model, search_field, values)
+            for (ref_model, search_field), values in lookups
+        ))
+        for ((ref_model, search_field), _), rows in zip(lookups, results):
+            self._cache_rows(ref_model, search_field, rows)
+    
+    def _pending_lookups(
+        self,
+        lookup_values: Iterable[tuple[tuple[str, str], Iterable[Any]]],
+    ) -> list[tuple[tuple[str, str], list[str]]]:
+        """Group uncached string values by (model, search field), dropping empty groups."""
+        # Fields sharing a lookup (e.g. uom_id / uom_po_id) are merged into one query
+        wanted: dict[tuple[str, str], set[str]] = {}
+        for lookup, field_values in lookup_values:
+            ref_model = lookup[0]
+            values = wanted.setdefault(lookup, set())
+            for value in field_values:
+                if isinstance(value, str) and value and self.cache.get(ref_model, value) is None:
+                    values.add(value)
+        return [(lookup, list(values)) for lookup, values in wanted.items() if values]
+    
+    def _fetch_references(
+        self, ref_model: str, search_field: str, values: list[str]
+    ) -> list[dict[str, Any]]:
+        """Exact-match search_read for values in chunks; stops at the first failure."""
+        rows: list[dict[str, Any]] = []
+        for i in range(0, len(values), self.REFERENCE_LOOKUP_CHUNK):
+            chunk = values[i:i + self.REFERENCE_LOOKUP_CHUNK]
+            try:
+                rows += self.client.search_read(
+                    ref_model, [(search_field, "in", chunk)], [search_field], order="id"
+                )
+            except Exception:
+                break  # Best effort; resolve_references still looks values up one by one
+        return rows
+    
+    def _cache_rows(self, ref_model: str, search_field: str, rows: list[dict[str, Any]]) -> None:
+        """Store fetched IDs by their search value."""
+        for row in rows:
+            value = row.get(search_field)
+            if not isinstance(value, str):
+                continue
+            key = ReferenceCache.normalize(value)
+            # Lowest ID wins, as with resolve_reference's limit=1 search
+            if self.cache.get_normalized(ref_model, key) is None:
+                self.cache.set_normalized(ref_model, key, row["id"])
+    
+    def resolve_references(
+        self,
+        record: dict[str, Any],
+        *,
+        inplace: bool = False,
+    ) -> dict[str, Any]:
         """
         Resolve all Many2one references in a record.
         
         Args:
             record: Record with string references
+            inplace: Mutate ``record`` instead of copying it; for callers
+                that already own a fresh dict (e.g. prepare_record)
             
         Returns:
             Record with resolved integer IDs
         """
-        resolved = record.copy()
-        
-        for field_name, (ref_model, search_field) in self.REFERENCE_FIELDS.items():
-            if field_name in resolved and resolved[field_name]:
-                value = resolved[field_name]
-                
-                # Skip if already an integer ID
-                if isinstance(value, int):
-                    continue
-                
-                # Check cache first
-                cached_id = self.cache.get(ref_model, str(value))
-                if cached_id:
-                    resolved[field_name] = cached_id
-                    continue
-                
-                # Resolve via API
-                ref_id = self.client.resolve_reference(
-                    ref_model, value, search_field
-                )
-                
-                if ref_id:
-                    self.cache.set(ref_model, str(value), ref_id)
-                    resolved[field_name] = ref_id
-                else:
-                    # Set to False (Odoo's null for Many2one) if not found
-                    resolved[field_name] = False
+        resolved = record if inplace else record.copy()
+        
+        # Only visit reference fields the record actually carries
+        ref_fields = self.REFERENCE_FIELDS
+        for field_name in self._REF_FIELD_SET & resolved.keys():
+            value = resolved[field_name]
+            if value:
+                ref_model, search_field = ref_fields[field_name]
+                resolved[field_name] = self._resolve_value(ref_model, search_field, value)
         
         return resolved
     
@@ -123,12 +567,26 @@ class BaseAdapter(ABC):
         Returns:
             List of missing field names
         """
-        missing = []
-        for field_name in self.REQUIRED_FIELDS:
-            value = record.get(field_name)
-            if value is None or value == "" or value is False:
-                missing.append(field_name)
-        return missing
+        return self.validate_required_bulk([record])[0]
+    
+    def validate_required_bulk(self, records: list[dict[str, Any]]) -> list[list[str]]:
+        """
+        Check a batch of records for missing required fields.
+        
+        A field is missing when it is absent, None, "" or False (0 counts
+        as a value).
+        
+        Returns:
+            Missing field names per record, in input order
+        """
+        required = self.REQUIRED_FIELDS
+        return [
+            [
+                f for f in required
+                if (v := r.get(f)) is None or v is False or v == ""
+            ]
+            for r in records
+        ]
     
     def apply_defaults(
         self,
@@ -151,7 +609,7 @@ class BaseAdapter(ABC):
                 result[field_name] = default_value
         return result
     
-    def clean_empty_values(self, record: dict[str, Any]) -> dict[str, Any]:
+    def clean_empty_values(self, record: dict[str, Any], *, copy: bool = True) -> dict[str, Any]:
         """
         Remove empty string values and convert to appropriate Odoo values.
         
@@ -159,20 +617,44 @@ class BaseAdapter(ABC):
         - Many2one: False instead of empty string
         - Char: Empty string is fine
         - Integer/Float: 0 instead of empty string
+        
+        With copy=False a record without empty values is returned as is;
+        only use it when the result is not mutated.
         """
-        cleaned = {}
-        for key, value in record.items():
-            if value == "":
-                continue  # Skip empty strings
-            if value is None:
-                continue  # Skip None values
-            cleaned[key] = value
-        return cleaned
+        if not copy and not _has_empty(record):
+            return record
+        return self._normalize(record)
+    
+    def _normalize(
+        self,
+        record: dict[str, Any],
+        defaults: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Copy a record once, dropping empty values and filling defaults.
+        
+        Fuses clean_empty_values and apply_defaults so prepare_record
+        allocates a single dict per record.
+        """
+        if _has_empty(record):
+            out = {
+                key: value for key, value in record.items()
+                if value is not None and value != ""
+            }
+        else:
+            # Clean rows (the common case) take the C-level copy
+            out = record.copy()
+        if defaults:
+            for field_name, default_value in defaults.items():
+                out.setdefault(field_name, default_value)
+        return out
 
 
 class PartnerAdapter(BaseAdapter):
     """Adapter for res.partner model."""
     
+    __slots__ = ()
+    
     MODEL_NAME = "res.partner"
     REQUIRED_FIELDS = ["name"]
     REFERENCE_FIELDS = {
@@ -184,27 +666,20 @@ class PartnerAdapter(BaseAdapter):
         "user_id": ("res.users", "login"),
         "company_id": ("res.company", "name"),
     }
+    BOOL_FIELDS = frozenset({"is_company", "active"})
+    INT_FIELDS = {"customer_rank": 0, "supplier_rank": 0}
+    RECORD_TYPE = PartnerRecord
     
     def prepare_record(self, record: dict[str, Any]) -> dict[str, Any]:
         """Prepare partner record for import."""
         # Clean empty values
-        prepared = self.clean_empty_values(record)
-        
-        # Ensure boolean fields are proper booleans
-        for bool_field in ["is_company", "active"]:
-            if bool_field in prepared:
-                prepared[bool_field] = bool(prepared[bool_field])
+        prepared = self._normalize(record)
         
-        # Ensure rank fields are integers
-        for rank_field in ["customer_rank", "supplier_rank"]:
-            if rank_field in prepared:
-                try:
-                    prepared[rank_field] = int(prepared[rank_field])
-                except (ValueError, TypeError):
-                    prepared[rank_field] = 0
+        # Booleans and integer ranks
+        self._coerce(prepared)
         
         # Resolve references
-        prepared = self.resolve_references(prepared)
+        self.resolve_references(prepared, inplace=True)
         
         return prepared
 
@@ -212,6 +687,8 @@ class PartnerAdapter(BaseAdapter):
 class ProductAdapter(BaseAdapter):
     """Adapter for product.template and product.product models."""
     
+    __slots__ = ("_valid_fields",)
+    
     MODEL_NAME = "product.template"
     REQUIRED_FIELDS = ["name"]
     REFERENCE_FIELDS = {
@@ -220,71 +697,40 @@ class ProductAdapter(BaseAdapter):
         "uom_po_id": ("uom.uom", "name"),
         "company_id": ("res.company", "name"),
     }
+    BOOL_FIELDS = frozenset({"active", "sale_ok", "purchase_ok"})
+    FLOAT_FIELDS = {"list_price": 0.0, "standard_price": 0.0, "weight": 0.0, "volume": 0.0}
+    DEFAULTS = {"detailed_type": "consu"}
+    RECORD_TYPE = ProductRecord
     
     def prepare_record(self, record: dict[str, Any]) -> dict[str, Any]:
         """Prepare product record for import."""
-        prepared = self.clean_empty_values(record)
+        # Product type defaults to consumable
+        prepared = self._normalize(record, self.DEFAULTS)
         
-        # Get valid fields from Odoo (cached after first call)
+        # Get valid fields from Odoo (shared per connection)
         if not hasattr(self, '_valid_fields'):
             try:
-                fields_info = self.client.fields_get(self.MODEL_NAME, attributes=["type"])
-                self._valid_fields = set(fields_info.keys())
+                self._valid_fields = _model_fields(_ClientKey(self.client), self.MODEL_NAME)
             except Exception:
                 self._valid_fields = None
         
-        # Set product type defaults
-        if "detailed_type" not in prepared:
-            prepared["detailed_type"] = "consu"  # Consumable by default
-        
-        # Ensure boolean fields
-        for bool_field in ["active", "sale_ok", "purchase_ok"]:
-            if bool_field in prepared:
-                prepared[bool_field] = bool(prepared[bool_field])
-        
-        # Ensure numeric fields
-        for num_field in ["list_price", "standard_price", "weight", "volume"]:
-            if num_field in prepared:
-                try:
-                    prepared[num_field] = float(prepared[num_field])
-                except (ValueError, TypeError):
-                    prepared[num_field] = 0.0
+        # Booleans and prices/measures
+        self._coerce(prepared)
         
         # Resolve references
-        prepared = self.resolve_references(prepared)
+        self.resolve_references(prepared, inplace=True)
         
-        # Default category if not set (CACHED for performance)
+        # Default category if not set (shared per connection)
         if "categ_id" not in prepared or not prepared["categ_id"]:
-            if not hasattr(self, '_default_categ_id'):
-                all_categ = self.client.search(
-                    "product.category",
-                    [("parent_id", "=", False)],
-                    limit=1
-                )
-                self._default_categ_id = all_categ[0] if all_categ else None
-            if self._default_categ_id:
-                prepared["categ_id"] = self._default_categ_id
+            default_categ_id = _default_category(_ClientKey(self.client))
+            if default_categ_id:
+                prepared["categ_id"] = default_categ_id
         
-        # Default UoM if not set (CACHED for performance)
+        # Default UoM if not set (shared per connection)
         if "uom_id" not in prepared or not prepared["uom_id"]:
-            if not hasattr(self, '_default_uom_id'):
-                units_uom = self.client.search(
-                    "uom.uom",
-                    [("name", "=", "Units")],
-                    limit=1
-                )
-                if units_uom:
-                    self._default_uom_id = units_uom[0]
-                else:
-                    # Try "Unit(s)" for older versions
-                    units_uom = self.client.search(
-                        "uom.uom",
-                        ["|", ("name", "ilike", "unit"), ("name", "ilike", "unité")],
-                        limit=1
-                    )
-                    self._default_uom_id = units_uom[0] if units_uom else None
-            if self._default_uom_id:
-                prepared["uom_id"] = self._default_uom_id
+            default_uom_id = _default_uom(_ClientKey(self.client))
+            if default_uom_id:
+                prepared["uom_id"] = default_uom_id
         
         # Set uom_po_id to same as uom_id if not specified
         if "uom_po_id" not in prepared or not prepared["uom_po_id"]:
@@ -301,6 +747,8 @@ class ProductAdapter(BaseAdapter):
 class CategoryAdapter(BaseAdapter):
     """Adapter for product.category model with hierarchy support."""
     
+    __slots__ = ()
+    
     MODEL_NAME = "product.category"
     REQUIRED_FIELDS = ["name"]
     REFERENCE_FIELDS = {
@@ -309,7 +757,7 @@ class CategoryAdapter(BaseAdapter):
     
     def prepare_record(self, record: dict[str, Any]) -> dict[str, Any]:
         """Prepare category record for import."""
-        prepared = self.clean_empty_values(record)
+        prepared = self._normalize(record)
         
         # Handle hierarchical category paths (e.g., "Parent / Child / Grandchild")
         if "complete_name" in prepared and "name" not in prepared:
@@ -320,7 +768,7 @@ class CategoryAdapter(BaseAdapter):
             # Set parent if hierarchy exists
             if len(parts) > 1:
                 parent_path = " / ".join(parts[:-1])
-                parent_id = self.client.resolve_reference(
+                parent_id = self._resolve(
                     "product.category",
                     parent_path,
                     "complete_name"
@@ -330,8 +778,7 @@ class CategoryAdapter(BaseAdapter):
             
             del prepared["complete_name"]
         
-        prepared = self.resolve_references(prepared)
-        return prepared
+        return self.resolve_references(prepared, inplace=True)
     
     def create_with_hierarchy(self, complete_name: str) -> int:
         """
@@ -344,27 +791,33 @@ class CategoryAdapter(BaseAdapter):
             ID of the leaf category
         """
         parts = [p.strip() for p in complete_name.split(" / ")]
-        parent_id: int | None = None
+        prefixes = [" / ".join(parts[:i + 1]) for i in range(len(parts))]
         
-        for i, part in enumerate(parts):
-            current_path = " / ".join(parts[:i + 1])
-            
-            # Check if exists
-            existing = self.client.search(
+        # Look up every level of the path in one round-trip
+        existing = {
+            row["complete_name"]: row["id"]
+            for row in self.client.search_read(
                 "product.category",
-                [("complete_name", "=", current_path)],
-                limit=1
+                [("complete_name", "in", prefixes)],
+                ["complete_name"],
             )
+        }
+        
+        parent_id: int | None = None
+        for part, current_path in zip(parts, prefixes):
+            if current_path in existing:
+                parent_id = existing[current_path]
+                continue
             
-            if existing:
-                parent_id = existing[0]
-            else:
-                # Create it
-                values: dict[str, Any] = {"name": part}
-                if parent_id:
-                    values["parent_id"] = parent_id
-                parent_id = self.client.create("product.category", values)
-                self.cache.set("product.category", current_path, parent_id)  # type: ignore
+            # Create only the missing levels, chained to the previous one
+            values: dict[str, Any] = {"name": part}
+            if parent_id:
+                values["parent_id"] = parent_id
+            parent_id = self.client.create("product.category", values)
+            existing[current_path] = parent_id
+        
+        for current_path, record_id in existing.items():
+            self.cache.set("product.category", current_path, record_id)
         
         return parent_id  # type: ignore
 
@@ -372,42 +825,32 @@ class CategoryAdapter(BaseAdapter):
 class UoMAdapter(BaseAdapter):
     """Adapter for uom.uom model."""
     
+    __slots__ = ()
+    
     MODEL_NAME = "uom.uom"
     REQUIRED_FIELDS = ["name", "category_id", "uom_type"]
     REFERENCE_FIELDS = {
         "category_id": ("uom.category", "name"),
     }
+    FLOAT_FIELDS = {"factor": 1.0, "factor_inv": 1.0, "rounding": 0.01}
+    DEFAULTS = {"uom_type": "reference"}
     
     def prepare_record(self, record: dict[str, Any]) -> dict[str, Any]:
         """Prepare UoM record for import."""
-        prepared = self.clean_empty_values(record)
-        
         # Default to reference UoM type
-        if "uom_type" not in prepared:
-            prepared["uom_type"] = "reference"
-        
-        # Ensure factor is a float
-        for factor_field in ["factor", "factor_inv"]:
-            if factor_field in prepared:
-                try:
-                    prepared[factor_field] = float(prepared[factor_field])
-                except (ValueError, TypeError):
-                    prepared[factor_field] = 1.0
+        prepared = self._normalize(record, self.DEFAULTS)
         
-        # Ensure rounding is a float
-        if "rounding" in prepared:
-            try:
-                prepared["rounding"] = float(prepared["rounding"])
-            except (ValueError, TypeError):
-                prepared["rounding"] = 0.01
+        # Ensure factor and rounding are floats
+        self._coerce(prepared)
         
-        prepared = self.resolve_references(prepared)
-        return prepared
+        return self.resolve_references(prepared, inplace=True)
 
 
 class AccountAdapter(BaseAdapter):
     """Adapter for account.account model."""
     
+    __slots__ = ()
+    
     MODEL_NAME = "account.account"
     REQUIRED_FIELDS = ["name", "code"]
     REFERENCE_FIELDS = {
@@ -415,6 +858,7 @@ class AccountAdapter(BaseAdapter):
         "currency_id": ("res.currency", "name"),
         "group_id": ("account.group", "code_prefix_start"),
     }
+    BOOL_FIELDS = frozenset({"reconcile"})
     
     # Account type mapping for common types
     ACCOUNT_TYPE_MAP = {
@@ -431,7 +875,7 @@ class AccountAdapter(BaseAdapter):
     
     def prepare_record(self, record: dict[str, Any]) -> dict[str, Any]:
         """Prepare account record for import."""
-        prepared = self.clean_empty_values(record)
+        prepared = self._normalize(record)
         
         # Normalize account type
         if "account_type" in prepared:
@@ -440,11 +884,9 @@ class AccountAdapter(BaseAdapter):
                 prepared["account_type"] = self.ACCOUNT_TYPE_MAP[type_value]
         
         # Ensure reconcile is boolean
-        if "reconcile" in prepared:
-            prepared["reconcile"] = bool(prepared["reconcile"])
+        self._coerce(prepared)
         
-        prepared = self.resolve_references(prepared)
-        return prepared
+        return self.resolve_references(prepared, inplace=True)
 
 
 class JournalEntryAdapter(BaseAdapter):
@@ -456,6 +898,8 @@ class JournalEntryAdapter(BaseAdapter):
     for opening balances with proper review.
     """
     
+    __slots__ = ("_safety_confirmed",)
+    
     MODEL_NAME = "account.move"
     REQUIRED_FIELDS = ["journal_id", "date", "line_ids"]
     REFERENCE_FIELDS = {
@@ -464,6 +908,11 @@ class JournalEntryAdapter(BaseAdapter):
         "currency_id": ("res.currency", "name"),
         "company_id": ("res.company", "name"),
     }
+    LINE_REFERENCE_FIELDS = {
+        "account_id": ("account.account", "code"),
+        "partner_id": ("res.partner", "name"),
+    }
+    DEFAULTS = {"move_type": "entry"}
     
     def __init__(self, client: OdooClient, cache: ReferenceCache | None = None):
         super().__init__(client, cache)
@@ -477,6 +926,28 @@ class JournalEntryAdapter(BaseAdapter):
         """
         self._safety_confirmed = True
     
+    def prepare_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Prepare journal entry frame; requires confirm_safety() like prepare_record."""
+        if not self._safety_confirmed:
+            raise RuntimeError(
+                "Journal entry import requires explicit confirmation. "
+                "Call confirm_safety() first. This action affects financial data!"
+            )
+        return super().prepare_frame(df)
+    
+    def resolve_references_bulk(self, records: list[dict[str, Any]]) -> None:
+        """Warm the cache for header references and for every line of every entry."""
+        super().resolve_references_bulk(records)
+        self._prefetch_line_references([
+            line
+            for record in records if isinstance(record.get("line_ids"), list)
+            for line in record["line_ids"]
+        ])
+    
+    def _prefetch_line_references(self, lines: list[dict[str, Any]]) -> None:
+        """One search_read per line reference field (per chunk) for a set of lines."""
+        self._prefetch_plan(tuple(self.LINE_REFERENCE_FIELDS.items()), lines)
+    
     def prepare_record(self, record: dict[str, Any]) -> dict[str, Any]:
         """Prepare journal entry record for import."""
         if not self._safety_confirmed:
@@ -485,47 +956,32 @@ class JournalEntryAdapter(BaseAdapter):
                 "Call confirm_safety() first. This action affects financial data!"
             )
         
-        prepared = self.clean_empty_values(record)
-        
         # Set move type for opening balance
-        if "move_type" not in prepared:
-            prepared["move_type"] = "entry"
+        prepared = self._normalize(record, self.DEFAULTS)
         
         # Resolve header-level references
-        prepared = self.resolve_references(prepared)
+        self.resolve_references(prepared, inplace=True)
         
         # Process line items
         if "line_ids" in prepared and isinstance(prepared["line_ids"], list):
-            processed_lines = []
-            for line in prepared["line_ids"]:
-                processed_line = self._prepare_move_line(line)
-                # Use Odoo's command format: (0, 0, values) for create
-                processed_lines.append((0, 0, processed_line))
-            prepared["line_ids"] = processed_lines
+            lines = prepared["line_ids"]
+            # Resolve accounts/partners for all lines at once, not per line
+            self._prefetch_line_references(lines)
+            # Use Odoo's command format: (0, 0, values) for create
+            prepared["line_ids"] = [(0, 0, self._prepare_move_line(line)) for line in lines]
         
         return prepared
     
     def _prepare_move_line(self, line: dict[str, Any]) -> dict[str, Any]:
         """Prepare a journal entry line."""
-        prepared = self.clean_empty_values(line)
-        
-        # Resolve account
-        if "account_id" in prepared and not isinstance(prepared["account_id"], int):
-            account_id = self.client.resolve_reference(
-                "account.account",
-                prepared["account_id"],
-                "code"
-            )
-            prepared["account_id"] = account_id or False
-        
-        # Resolve partner
-        if "partner_id" in prepared and not isinstance(prepared["partner_id"], int):
-            partner_id = self.client.resolve_reference(
-                "res.partner",
-                prepared["partner_id"],
-                "name"
-            )
-            prepared["partner_id"] = partner_id or False
+        prepared = self._normalize(line)
+        
+        # Resolve account and partner (served from the prefetched cache)
+        for field_name, (ref_model, search_field) in self.LINE_REFERENCE_FIELDS.items():
+            if field_name in prepared:
+                prepared[field_name] = self._resolve_value(
+                    ref_model, search_field, prepared[field_name]
+                )
         
         # Ensure debit/credit are floats
         for amount_field in ["debit", "credit"]:
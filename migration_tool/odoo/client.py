@@ -3,13 +3,41 @@ Odoo XML-RPC Client
 
 Provides a clean interface for communicating with Odoo via XML-RPC API.
 Supports authentication, CRUD operations, batch processing, and retry logic.
+The JSON-RPC endpoint can be used instead for smaller payloads.
 """
 
+import json
 import time
+import random
+import ssl
+import datetime
+import itertools
+import threading
+import http.client
 import xmlrpc.client
-from typing import Any
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, ClassVar, Iterable, Iterator, Literal, Sequence, TypeVar
+from urllib.parse import urlsplit
 from dataclasses import dataclass, field
 
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used when orjson is missing
+    orjson = None
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Errors after which the pooled connection is unusable and the proxies are rebuilt;
+# other transient errors (timeouts) are retried on the warm connection
+_STALE_CONNECTION_ERRORS = (
+    ConnectionResetError,  # includes http.client.RemoteDisconnected
+    BrokenPipeError,
+    ssl.SSLError,
+)
+
 
 class OdooConnectionError(Exception):
     """Raised when connection to Odoo fails."""
@@ -22,6 +50,7 @@ class OdooAPIError(Exception):
     def __init__(self, message: str, fault_code: int | None = None):
         super().__init__(message)
         self.fault_code = fault_code
+        self.created_ids: list[int] = []  # Set by create_batch when some chunks succeeded
 
 
 class OdooAuthenticationError(OdooConnectionError):
@@ -29,13 +58,139 @@ class OdooAuthenticationError(OdooConnectionError):
     pass
 
 
+def _json_default(value: Any) -> Any:
+    """Serialize values JSON has no type for, using Odoo's string formats."""
+    if isinstance(value, datetime.datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, datetime.date):
+        return value.strftime("%Y-%m-%d")
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, default=_json_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    return json.dumps(payload, default=_json_default).encode("utf-8")
+
+
+def _json_loads(body: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _rpc_kwargs(**options: Any) -> dict[str, Any]:
+    """Keyword arguments for an RPC call, without the options left unset (None)."""
+    return {name: value for name, value in options.items() if value is not None}
+
+
+class JsonRpcUnavailableError(ConnectionError):
+    """Raised when the server has no ``/jsonrpc`` endpoint (HTTP 404)."""
+    pass
+
+
+class JsonRpcTransport:
+    """
+    Minimal transport for Odoo's ``/jsonrpc`` endpoint.
+    
+    Each thread keeps one HTTP connection open (keep-alive), so batched
+    calls reuse a single TCP/TLS connection. Server errors are raised as
+    ``xmlrpc.client.Fault`` so callers handle both protocols alike.
+    """
+    
+    def __init__(self, url: str, timeout: int = 120):
+        parts = urlsplit(url)
+        self._https = parts.scheme == "https"
+        self._host = parts.netloc
+        self._path = f"{parts.path.rstrip('/')}/jsonrpc"
+        self._timeout = timeout
+        self._local = threading.local()
+        self._ids = itertools.count(1)
+    
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn_cls = http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+            conn = self._local.conn = conn_cls(self._host, timeout=self._timeout)
+        return conn
+    
+    def call(self, service: str, method: str, *args: Any) -> Any:
+        """Call ``service.method(*args)`` and return the result."""
+        body = _json_dumps({
+            "jsonrpc": "2.0",
+            "method": "call",
+            "params": {"service": service, "method": method, "args": list(args)},
+            "id": next(self._ids),
+        })
+        conn = self._connection()
+        try:
+            conn.request("POST", self._path, body, {"Content-Type": "application/json"})
+            response = conn.getresponse()
+            data = response.read()
+        except (http.client.HTTPException, OSError) as e:
+            conn.close()
+            self._local.conn = None
+            raise ConnectionError(f"JSON-RPC request failed: {e}") from e
+        
+        if response.status == 404:
+            raise JsonRpcUnavailableError(f"JSON-RPC endpoint not found at {self._path}")
+        if response.status != 200:
+            raise ConnectionError(f"JSON-RPC request failed: HTTP {response.status}")
+        
+        reply = _json_loads(data)
+        error = reply.get("error")
+        if error:
+            details = error.get("data") or {}
+            raise xmlrpc.client.Fault(
+                error.get("code", 0),
+                details.get("message") or error.get("message", "Unknown error"),
+            )
+        return reply.get("result")
+
+
+class KeepAliveTransport(xmlrpc.client.Transport):
+    """
+    XML-RPC transport that keeps its HTTP/1.1 connection open between calls.
+    
+    The connection is created once per transport (one transport per
+    proxy, one proxy per thread) and reused until the server closes it;
+    ``timeout`` applies to the socket, which the stock transport leaves
+    unbounded.
+    """
+    
+    def __init__(self, timeout: int = 120, **kwargs: Any):
+        super().__init__(headers=[("Connection", "keep-alive")], **kwargs)
+        self.timeout = timeout
+    
+    def make_connection(self, host: Any) -> http.client.HTTPConnection:
+        conn = super().make_connection(host)
+        conn.timeout = self.timeout
+        return conn
+
+
+class SafeKeepAliveTransport(xmlrpc.client.SafeTransport):
+    """HTTPS variant of KeepAliveTransport; TLS sessions are reused with the socket."""
+    
+    def __init__(self, timeout: int = 120, **kwargs: Any):
+        super().__init__(headers=[("Connection", "keep-alive")], **kwargs)
+        self.timeout = timeout
+    
+    def make_connection(self, host: Any) -> http.client.HTTPSConnection:
+        conn = super().make_connection(host)
+        conn.timeout = self.timeout
+        return conn
+
+
 @dataclass
 class OdooClient:
     """
     XML-RPC client for Odoo API communication.
     
     Provides methods for authentication, CRUD operations, and batch processing
-    with built-in retry logic and dry-run support.
+    with built-in retry logic and dry-run support. Set ``protocol="jsonrpc"``
+    to talk to the ``/jsonrpc`` endpoint instead of XML-RPC.
     
     Example:
         >>> client = OdooClient(
@@ -55,11 +210,42 @@ class OdooClient:
     timeout: int = 120
     retry_attempts: int = 3
     retry_delay: float = 2.0
+    retry_max_delay: float = 30.0
+    retry_jitter: float = 1.0  # 0 = fixed backoff, 1 = full decorrelated jitter
+    protocol: Literal["xmlrpc", "jsonrpc"] = "xmlrpc"
+    
+    # Reference values resolved per system.multicall request
+    REFERENCE_MULTICALL_CHUNK: ClassVar[int] = 200
+    
+    # Concurrent requests used by map() and other parallel fan-outs
+    MAX_PARALLEL_CALLS: ClassVar[int] = 8
+    
+    # Resolved (model, search_field, value) references remembered per client
+    REF_CACHE_SIZE: ClassVar[int] = 8192
+    
+    # Distinct fields_get requests remembered per client
+    FIELDS_GET_CACHE_SIZE: ClassVar[int] = 128
+    
+    # Field attributes fetched to validate dry-run creates
+    CREATE_CHECK_ATTRIBUTES: ClassVar[list[str]] = ["type", "required", "readonly"]
     
     # Internal state
     _uid: int | None = field(default=None, init=False, repr=False)
     _common: xmlrpc.client.ServerProxy | None = field(default=None, init=False, repr=False)
     _models: xmlrpc.client.ServerProxy | None = field(default=None, init=False, repr=False)
+    _local: threading.local = field(default_factory=threading.local, init=False, repr=False)
+    _multicall_supported: bool = field(default=True, init=False, repr=False)
+    _jsonrpc: JsonRpcTransport | None = field(default=None, init=False, repr=False)
+    _fields_get_cache: dict[tuple[Any, ...], dict[str, dict[str, Any]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _ref_cache: dict[tuple[str, str, str], int] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # Models whose fields_get failed in _is_text_field; not retried until clear_fields_cache
+    _fields_get_failed: set[str] = field(default_factory=set, init=False, repr=False)
+    # Guards eviction and invalidation of both caches across _parallel/map workers
+    _cache_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
     
     def __post_init__(self) -> None:
         """Normalize URL and initialize proxies."""
@@ -68,20 +254,72 @@ class OdooClient:
     
     def _init_proxies(self) -> None:
         """Initialize XML-RPC server proxies."""
+        if self.protocol == "jsonrpc":
+            self._jsonrpc = JsonRpcTransport(self.url, self.timeout)
+            self._multicall_supported = False  # XML-RPC only
         try:
-            self._common = xmlrpc.client.ServerProxy(
-                f"{self.url}/xmlrpc/2/common",
-                allow_none=True,
-                context=None,
-            )
-            self._models = xmlrpc.client.ServerProxy(
-                f"{self.url}/xmlrpc/2/object",
-                allow_none=True,
-                context=None,
-            )
+            self._common = self._server_proxy("common")
+            self._models = self._server_proxy("object")
+            self._local.models = self._models
         except Exception as e:
             raise OdooConnectionError(f"Failed to initialize XML-RPC proxies: {e}") from e
     
+    def _server_proxy(self, service: str) -> xmlrpc.client.ServerProxy:
+        """Create a proxy for an XML-RPC service on a keep-alive transport."""
+        if self.url.startswith("https"):
+            transport_cls = SafeKeepAliveTransport
+        else:
+            transport_cls = KeepAliveTransport
+        return xmlrpc.client.ServerProxy(
+            f"{self.url}/xmlrpc/2/{service}",
+            transport=transport_cls(timeout=self.timeout),
+            allow_none=True,
+        )
+    
+    def _object_proxy(self) -> xmlrpc.client.ServerProxy:
+        """
+        Get the object endpoint proxy for the calling thread.
+        
+        ServerProxy keeps one HTTP connection and is not thread-safe, so each
+        thread that executes calls gets its own proxy.
+        """
+        proxy = getattr(self._local, "models", None)
+        if proxy is None:
+            if self._models is None:
+                self._init_proxies()
+                return self._models  # type: ignore
+            proxy = self._local.models = self._server_proxy("object")
+        return proxy
+    
+    def _call_common(self, method: str, *args: Any) -> Any:
+        """Call a method of the ``common`` service over the configured protocol."""
+        if self._jsonrpc is not None:
+            try:
+                return self._jsonrpc.call("common", method, *args)
+            except JsonRpcUnavailableError:
+                self._fallback_to_xmlrpc()
+        return getattr(self._common, method)(*args)
+    
+    def _call_object(self, model: str, method: str, args: list[Any], kwargs: dict[str, Any]) -> Any:
+        """Call ``execute_kw`` on the ``object`` service over the configured protocol."""
+        if self._jsonrpc is not None:
+            try:
+                return self._jsonrpc.call(
+                    "object", "execute_kw",
+                    self.db, self.uid, self.password, model, method, args, kwargs,
+                )
+            except JsonRpcUnavailableError:
+                self._fallback_to_xmlrpc()
+        return self._object_proxy().execute_kw(
+            self.db, self.uid, self.password, model, method, args, kwargs
+        )
+    
+    def _fallback_to_xmlrpc(self) -> None:
+        """Switch to the XML-RPC proxies when the server lacks ``/jsonrpc``."""
+        self._jsonrpc = None
+        self.protocol = "xmlrpc"
+        self._multicall_supported = True
+    
     @property
     def uid(self) -> int:
         """Get authenticated user ID, raising if not authenticated."""
@@ -109,9 +347,7 @@ class OdooClient:
             if self._common is None:
                 self._init_proxies()
             
-            uid = self._common.authenticate(  # type: ignore
-                self.db, self.username, self.password, {}
-            )
+            uid = self._call_common("authenticate", self.db, self.username, self.password, {})
             
             if not uid:
                 raise OdooAuthenticationError(
@@ -133,7 +369,7 @@ class OdooClient:
         try:
             if self._common is None:
                 self._init_proxies()
-            return self._common.version()  # type: ignore
+            return self._call_common("version")
         except Exception as e:
             raise OdooConnectionError(f"Failed to get version: {e}") from e
     
@@ -171,21 +407,11 @@ class OdooClient:
     ) -> Any:
         """Execute with retry logic for transient failures."""
         last_error: Exception | None = None
+        delay = self.retry_delay
         
         for attempt in range(self.retry_attempts):
             try:
-                if self._models is None:
-                    self._init_proxies()
-                
-                result = self._models.execute_kw(  # type: ignore
-                    self.db,
-                    self.uid,
-                    self.password,
-                    model,
-                    method,
-                    list(args),
-                    kwargs or {}
-                )
+                result = self._call_object(model, method, list(args), kwargs or {})
                 return result
                 
             except xmlrpc.client.Fault as e:
@@ -198,8 +424,10 @@ class OdooClient:
             except (ConnectionError, TimeoutError, OSError) as e:
                 last_error = e
                 if attempt < self.retry_attempts - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
-                    self._init_proxies()  # Reinitialize connection
+                    delay = self._next_retry_delay(delay)
+                    time.sleep(delay)
+                    if isinstance(e, _STALE_CONNECTION_ERRORS):
+                        self._init_proxies()  # Reinitialize connection
                 continue
                 
             except Exception as e:
@@ -209,6 +437,116 @@ class OdooClient:
             f"Failed after {self.retry_attempts} attempts: {last_error}"
         )
     
+    def _next_retry_delay(self, previous: float) -> float:
+        """
+        Exponential backoff with decorrelated jitter, capped at retry_max_delay.
+        
+        Randomizing between the base delay and three times the previous one
+        keeps workers that failed together from retrying in lockstep.
+        retry_jitter narrows that range from below: at 0 the delay is
+        always three times the previous one.
+        """
+        high = previous * 3
+        low = high - self.retry_jitter * (high - self.retry_delay)
+        return min(self.retry_max_delay, random.uniform(low, high))
+    
+    def execute_kw_multi(
+        self,
+        calls: list[tuple[str, str, list[Any], dict[str, Any]]],
+    ) -> list[Any]:
+        """
+        Execute several model methods in a single round trip.
+        
+        Uses XML-RPC ``system.multicall`` when the server supports it and
+        falls back to sequential calls otherwise (remembered per client).
+        
+        Args:
+            calls: List of (model, method, args, kwargs) tuples
+            
+        Returns:
+            Results in the same order as calls
+            
+        Raises:
+            OdooAPIError: If any of the calls fails
+        """
+        if not calls:
+            return []
+        
+        if self._multicall_supported:
+            multicall = xmlrpc.client.MultiCall(self._object_proxy())
+            for model, method, args, kwargs in calls:
+                multicall.execute_kw(
+                    self.db, self.uid, self.password, model, method, list(args), kwargs or {}
+                )
+            try:
+                results = multicall()
+            except xmlrpc.client.Fault:
+                # Server has no system.multicall; don't try again
+                self._multicall_supported = False
+            except _STALE_CONNECTION_ERRORS:
+                self._init_proxies()
+            except (ConnectionError, TimeoutError, OSError):
+                pass
+            else:
+                try:
+                    return list(results)
+                except xmlrpc.client.Fault as e:
+                    raise OdooAPIError(
+                        f"Odoo API error in multicall: {e.faultString}",
+                        fault_code=e.faultCode,
+                    ) from e
+        
+        return [
+            self.execute(model, method, *args, **(kwargs or {}))
+            for model, method, args, kwargs in calls
+        ]
+    
+    def map(
+        self,
+        model: str,
+        method: str,
+        arg_list: Iterable[Sequence[Any]],
+        *,
+        kwargs: dict[str, Any] | None = None,
+        max_workers: int | None = None,
+    ) -> list[Any]:
+        """
+        Execute one independent call per argument tuple, in parallel.
+        
+        Calls run on a thread pool; each thread uses its own proxy (or
+        JSON-RPC connection), so requests overlap on the network. Faults
+        surface as OdooAPIError, as with execute().
+        
+        Args:
+            model: Model name
+            method: Method to call for every item
+            arg_list: Positional arguments of each call
+            kwargs: Keyword arguments shared by all calls
+            max_workers: Concurrent requests (default MAX_PARALLEL_CALLS)
+            
+        Returns:
+            Results in the same order as arg_list
+        """
+        shared_kwargs = kwargs or {}
+        return self._parallel(
+            lambda args: self.execute(model, method, *args, **shared_kwargs),
+            list(arg_list),
+            max_workers,
+        )
+    
+    def _parallel(
+        self,
+        fn: Callable[[T], R],
+        items: list[T],
+        max_workers: int | None = None,
+    ) -> list[R]:
+        """Apply fn to items on a thread pool, preserving order; the first error is raised."""
+        workers = min(max_workers or self.MAX_PARALLEL_CALLS, len(items))
+        if workers <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(fn, items))
+    
     # -------------------------------------------------------------------------
     # High-Level CRUD Operations
     # -------------------------------------------------------------------------
@@ -234,13 +572,9 @@ class OdooClient:
         Returns:
             List of record IDs
         """
-        kwargs: dict[str, Any] = {"offset": offset}
-        if limit is not None:
-            kwargs["limit"] = limit
-        if order is not None:
-            kwargs["order"] = order
-            
-        return self.execute(model, "search", domain, **kwargs)
+        return self.execute(
+            model, "search", domain, **_rpc_kwargs(offset=offset or None, limit=limit, order=order)
+        )
     
     def search_count(self, model: str, domain: list[Any]) -> int:
         """Count records matching the domain."""
@@ -290,15 +624,60 @@ class OdooClient:
         Returns:
             List of record dictionaries
         """
-        kwargs: dict[str, Any] = {"offset": offset}
-        if fields is not None:
-            kwargs["fields"] = fields
-        if limit is not None:
-            kwargs["limit"] = limit
-        if order is not None:
-            kwargs["order"] = order
-            
-        return self.execute(model, "search_read", domain, **kwargs)
+        return self.execute(
+            model, "search_read", domain,
+            **_rpc_kwargs(fields=fields, offset=offset or None, limit=limit, order=order),
+        )
+    
+    def read_all(
+        self,
+        model: str,
+        domain: list[Any],
+        fields: list[str] | None = None,
+        page_size: int = 1000,
+        order: str = "id",
+        pipeline_depth: int = 2,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over every record matching the domain, one page per request.
+        
+        The page count comes from a single search_count; up to
+        ``pipeline_depth`` pages are fetched at once and records are yielded
+        in ``order``. Records created or deleted while iterating can shift
+        page boundaries, so read from a quiet model or narrow the domain.
+        
+        Args:
+            model: Model name
+            domain: Odoo domain filter
+            fields: Fields to read (None = all fields)
+            page_size: Records per search_read request
+            order: Sort order; must be stable for offset paging
+            pipeline_depth: Pages in flight at once (1 = strictly sequential)
+        
+        Yields:
+            Record dictionaries
+        """
+        total = self.search_count(model, domain)
+        offsets = range(0, total, page_size)
+        
+        def fetch(offset: int) -> list[dict[str, Any]]:
+            return self.search_read(
+                model, domain, fields, offset=offset, limit=page_size, order=order
+            )
+        
+        if pipeline_depth <= 1 or len(offsets) <= 1:
+            for offset in offsets:
+                yield from fetch(offset)
+            return
+        
+        with ThreadPoolExecutor(max_workers=pipeline_depth) as ex:
+            in_flight: deque[Future[list[dict[str, Any]]]] = deque()
+            for offset in offsets:
+                if len(in_flight) >= pipeline_depth:
+                    yield from in_flight.popleft().result()
+                in_flight.append(ex.submit(fetch, offset))
+            while in_flight:
+                yield from in_flight.popleft().result()
     
     def create(
         self,
@@ -322,7 +701,10 @@ class OdooClient:
             self._validate_create_values(model, values)
             return None
         
-        return self.execute(model, "create", values)
+        try:
+            return self.execute(model, "create", values)
+        finally:
+            self.invalidate_ref_cache(model)
     
     def create_batch(
         self,
@@ -330,35 +712,78 @@ class OdooClient:
         records: list[dict[str, Any]],
         chunk_size: int = 500,
         dry_run: bool = False,
+        pipeline_depth: int = 2,
     ) -> list[int]:
         """
         Create multiple records in batches.
         
+        Up to ``pipeline_depth`` chunks are in flight at once, so the next
+        chunk is serialized and sent while the server processes the
+        previous one. IDs are returned in record order. If a chunk fails,
+        no further chunks are sent, but chunks already in flight complete;
+        the IDs of every chunk that succeeded are attached to the raised
+        OdooAPIError as ``created_ids``.
+        
         Args:
             model: Model name
             records: List of value dictionaries
             chunk_size: Records per batch
             dry_run: If True, validate but don't create
+            pipeline_depth: Chunks in flight at once (1 = strictly sequential)
             
         Returns:
             List of created record IDs (empty if dry_run)
         """
         if dry_run:
-            for record in records:
-                self._validate_create_values(model, record)
+            # One fields_get per distinct field set, fetched in parallel
+            samples = list({frozenset(record): record for record in records}.values())
+            fields_infos = self.map(
+                model, "fields_get", [[list(record)] for record in samples],
+                kwargs={"attributes": self.CREATE_CHECK_ATTRIBUTES},
+            )
+            for record, fields_info in zip(samples, fields_infos):
+                self._validate_create_values(model, record, fields_info)
             return []
         
         created_ids: list[int] = []
         
-        for i in range(0, len(records), chunk_size):
-            chunk = records[i:i + chunk_size]
-            # Odoo supports multi-create with list of dicts
-            ids = self.execute(model, "create", chunk)
+        def collect(ids: Any) -> None:
             if isinstance(ids, list):
                 created_ids.extend(ids)
             else:
                 created_ids.append(ids)
         
+        # Odoo supports multi-create with list of dicts
+        chunks = [records[i:i + chunk_size] for i in range(0, len(records), chunk_size)]
+        try:
+            if pipeline_depth <= 1 or len(chunks) <= 1:
+                for chunk in chunks:
+                    collect(self.execute(model, "create", chunk))
+                return created_ids
+            
+            with ThreadPoolExecutor(max_workers=pipeline_depth) as ex:
+                in_flight: deque[Future[Any]] = deque()
+                try:
+                    for chunk in chunks:
+                        if len(in_flight) >= pipeline_depth:
+                            # Oldest first keeps IDs in order; an error stops new submissions
+                            collect(in_flight.popleft().result())
+                        in_flight.append(ex.submit(self.execute, model, "create", chunk))
+                    while in_flight:
+                        collect(in_flight.popleft().result())
+                except OdooAPIError:
+                    # Chunks sent after the failed one still create records
+                    for future in in_flight:
+                        if future.exception() is None:
+                            collect(future.result())
+                    raise
+        except OdooAPIError as e:
+            e.created_ids = created_ids
+            raise
+        finally:
+            # Even a failed batch may have created records
+            self.invalidate_ref_cache(model)
+        
         return created_ids
     
     def write(
@@ -378,7 +803,10 @@ class OdooClient:
         Returns:
             True if successful
         """
-        return self.execute(model, "write", ids, values)
+        try:
+            return self.execute(model, "write", ids, values)
+        finally:
+            self.invalidate_ref_cache(model)
     
     def unlink(self, model: str, ids: list[int]) -> bool:
         """
@@ -391,7 +819,10 @@ class OdooClient:
         Returns:
             True if successful
         """
-        return self.execute(model, "unlink", ids)
+        try:
+            return self.execute(model, "unlink", ids)
+        finally:
+            self.invalidate_ref_cache(model)
     
     # -------------------------------------------------------------------------
     # Utility Methods
@@ -412,15 +843,39 @@ class OdooClient:
             attributes: Field attributes to return
             
         Returns:
-            Dictionary of field definitions
+            Dictionary of field definitions (cached per client; treat as read-only)
         """
-        kwargs: dict[str, Any] = {}
-        if attributes is not None:
-            kwargs["attributes"] = attributes
-            
+        key = (
+            model,
+            frozenset(fields) if fields is not None else None,
+            frozenset(attributes) if attributes is not None else None,
+        )
+        cached = self._fields_get_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        kwargs = _rpc_kwargs(attributes=attributes)
         if fields is not None:
-            return self.execute(model, "fields_get", fields, **kwargs)
-        return self.execute(model, "fields_get", **kwargs)
+            result = self.execute(model, "fields_get", fields, **kwargs)
+        else:
+            result = self.execute(model, "fields_get", **kwargs)
+        
+        with self._cache_lock:
+            if len(self._fields_get_cache) >= self.FIELDS_GET_CACHE_SIZE:
+                self._fields_get_cache.pop(next(iter(self._fields_get_cache)), None)
+            self._fields_get_cache[key] = result
+        return result
+    
+    def clear_fields_cache(self, model: str | None = None) -> None:
+        """Forget cached fields_get results for a model, or for all models."""
+        with self._cache_lock:
+            if model is None:
+                self._fields_get_cache.clear()
+                self._fields_get_failed.clear()
+                return
+            self._fields_get_failed.discard(model)
+            for key in [k for k in self._fields_get_cache if k[0] == model]:
+                del self._fields_get_cache[key]
     
     def name_search(
         self,
@@ -478,19 +933,22 @@ class OdooClient:
         self,
         model: str,
         values: dict[str, Any],
+        fields_info: dict[str, dict[str, Any]] | None = None,
     ) -> None:
         """
         Validate values for create operation.
         
         This is used in dry-run mode to check if values are valid
-        without actually creating records.
+        without actually creating records. ``fields_info`` may be passed
+        when the caller already fetched it.
         """
         # Get required fields
-        fields_info = self.fields_get(
-            model,
-            list(values.keys()),
-            ["type", "required", "readonly"],
-        )
+        if fields_info is None:
+            fields_info = self.fields_get(
+                model,
+                list(values.keys()),
+                self.CREATE_CHECK_ATTRIBUTES,
+            )
         
         # Check for missing required fields
         for field_name, field_info in fields_info.items():
@@ -517,7 +975,8 @@ class OdooClient:
             domain: Additional domain filter
             
         Returns:
-            Record ID if found, None otherwise
+            Record ID if found, None otherwise (hits are cached unless a
+            domain is given; misses are always looked up again)
         """
         if isinstance(value, int):
             return value
@@ -525,19 +984,158 @@ class OdooClient:
         if not value:
             return None
         
-        # Try exact match first
-        search_domain: list[Any] = [(search_field, "=", value)]
-        if domain:
-            search_domain.extend(domain)
+        if search_field == "id" and value.isdigit():
+            return int(value)
+        
+        key = (model, search_field, value)
+        if domain is None:
+            cached = self._ref_cache.get(key)
+            if cached is not None:
+                return cached
         
-        ids = self.search(model, search_domain, limit=1)
-        if ids:
-            return ids[0]
+        searches = self._reference_searches(model, value, search_field, domain)
         
-        # Try case-insensitive match
-        search_domain = [(search_field, "=ilike", value)]
-        if domain:
-            search_domain.extend(domain)
+        # Both searches in one round trip when multicall is available
+        if len(searches) > 1 and self._multicall_supported:
+            ids = next(filter(None, self.execute_kw_multi(list(searches))), [])
+        else:
+            # Try exact match first, then case-insensitive
+            for _, _, args, kwargs in searches:
+                ids = self.search(model, *args, **kwargs)
+                if ids:
+                    break
         
-        ids = self.search(model, search_domain, limit=1)
-        return ids[0] if ids else None
+        record_id = ids[0] if ids else None
+        if domain is None:
+            self._remember_reference(key, record_id)
+        return record_id
+    
+    def _remember_reference(self, key: tuple[str, str, str], record_id: int | None) -> None:
+        """
+        Store a resolved reference, evicting the oldest beyond REF_CACHE_SIZE.
+        
+        Misses are not stored: the record may be created later in the
+        session, by this client or anyone else.
+        """
+        if record_id is None:
+            return
+        with self._cache_lock:
+            if len(self._ref_cache) >= self.REF_CACHE_SIZE:
+                self._ref_cache.pop(next(iter(self._ref_cache)), None)
+            self._ref_cache[key] = record_id
+    
+    def invalidate_ref_cache(self, model: str | None = None) -> None:
+        """
+        Forget resolved references for a model, or for all models.
+        
+        Called after every create, write and unlink on the model, since
+        renamed or deleted records would otherwise resolve to stale IDs.
+        """
+        with self._cache_lock:
+            if model is None:
+                self._ref_cache.clear()
+                return
+            for key in [k for k in self._ref_cache if k[0] == model]:
+                del self._ref_cache[key]
+    
+    def resolve_references_bulk(
+        self,
+        model: str,
+        values: list[str | int],
+        search_field: str = "name",
+        domain: list[Any] | None = None,
+    ) -> dict[str | int, int | None]:
+        """
+        Resolve many reference values with as few round trips as possible.
+        
+        Each value gets the same exact-then-case-insensitive lookup as
+        resolve_reference; with multicall, up to REFERENCE_MULTICALL_CHUNK
+        values are resolved per request.
+        
+        Args:
+            model: Target model (e.g., "res.country")
+            values: Values to search (IDs, names, or codes)
+            search_field: Field to search by
+            domain: Additional domain filter
+            
+        Returns:
+            Mapping of each non-empty value to its record ID, or None if not found
+        """
+        resolved: dict[str | int, int | None] = {}
+        pending = []
+        for value in dict.fromkeys(values):
+            cached = (
+                self._ref_cache.get((model, search_field, value)) if domain is None else None
+            )
+            if isinstance(value, int):
+                resolved[value] = value
+            elif search_field == "id" and value and value.isdigit():
+                resolved[value] = int(value)
+            elif value and cached is not None:
+                resolved[value] = cached
+            elif value:
+                pending.append(value)
+        
+        if not self._multicall_supported:
+            # No multicall (e.g. JSON-RPC): overlap the per-value lookups instead
+            ids = self._parallel(
+                lambda value: self.resolve_reference(model, value, search_field, domain),
+                pending,
+            )
+            resolved.update(zip(pending, ids))
+            return resolved
+        
+        per_value = 2 if self._is_text_field(model, search_field) else 1
+        for i in range(0, len(pending), self.REFERENCE_MULTICALL_CHUNK):
+            chunk = pending[i:i + self.REFERENCE_MULTICALL_CHUNK]
+            calls = [
+                call for value in chunk
+                for call in self._reference_searches(model, value, search_field, domain)
+            ]
+            results = self.execute_kw_multi(calls)
+            for j, value in enumerate(chunk):
+                offset = j * per_value
+                ids = next(filter(None, results[offset:offset + per_value]), [])
+                resolved[value] = ids[0] if ids else None
+                if domain is None:
+                    self._remember_reference((model, search_field, value), resolved[value])
+        return resolved
+    
+    def _reference_searches(
+        self,
+        model: str,
+        value: str,
+        search_field: str,
+        domain: list[Any] | None,
+    ) -> tuple[tuple[str, str, list[Any], dict[str, Any]], ...]:
+        """
+        The ``search`` calls for one reference value.
+        
+        An exact match, followed by a case-insensitive one for text fields
+        only; ``=ilike`` on numbers, dates or relations cannot match anything
+        the exact search missed.
+        """
+        extra = list(domain or [])
+        operators = ("=", "=ilike") if self._is_text_field(model, search_field) else ("=",)
+        return tuple(
+            (model, "search", [[(search_field, operator, value), *extra]], {"limit": 1})
+            for operator in operators
+        )
+    
+    def _is_text_field(self, model: str, field_name: str) -> bool:
+        """
+        Whether a field holds free text, from the cached fields_get.
+        
+        Unknown fields (e.g. dotted paths) and failed lookups count as text,
+        which keeps the case-insensitive fallback. A failed lookup is
+        remembered per model, so later references skip its retries.
+        """
+        if model in self._fields_get_failed:
+            return True
+        try:
+            fields_info = self.fields_get(model, attributes=["type"])
+        except (OdooAPIError, OdooConnectionError):
+            self._fields_get_failed.add(model)
+            return True
+        info = fields_info.get(field_name)
+        return info is None or info.get("type") in ("char", "text")
@@ -0,0 +1,201 @@
+"""
+Shared helpers for Odoo schemas
+
+Fast conversion of validated schemas to Odoo value dictionaries and JSON,
+and unvalidated construction of schemas from pre-cleaned rows.
+"""
+
+import types
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Mapping,
+    Self,
+    Sequence,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def to_odoo_values(model: BaseModel, exclude: frozenset[str] = frozenset()) -> dict[str, Any]:
+    """
+    Equivalent of ``model.model_dump(exclude=exclude, exclude_none=True)`` for flat schemas.
+    
+    Reads the instance ``__dict__`` (declared fields only; private
+    attributes live elsewhere) instead of going through Pydantic's generic
+    serializer. Extra fields (``extra="allow"``) are included like
+    model_dump does; nested models are not converted, so schemas with
+    model-typed fields must handle those themselves.
+    
+    Args:
+        model: Validated schema instance
+        exclude: Field names to leave out
+    
+    Returns:
+        Field values without None entries
+    """
+    values = {
+        name: value
+        for name, value in model.__dict__.items()
+        if value is not None and name not in exclude
+    }
+    extra = model.__pydantic_extra__
+    if extra:
+        values.update(
+            (name, value) for name, value in extra.items()
+            if value is not None and name not in exclude
+        )
+    return values
+
+
+def share_choice_strings(
+    df: "pd.DataFrame", choices: Mapping[str, tuple[str, ...]]
+) -> "pd.DataFrame":
+    """
+    Replace selection values in dataframe columns with the shared choice strings.
+    
+    Readers create one string object per cell; mapping each cell to the
+    single (interned) string of its choice cuts memory on large frames.
+    Values that are not valid choices are left as they are.
+    
+    Args:
+        df: Rows with Odoo field names as columns
+        choices: Field name -> allowed values (e.g. ``ProductType.__args__``)
+    
+    Returns:
+        Copy of the dataframe
+    """
+    df = df.copy()
+    for column, values in choices.items():
+        if column in df.columns:
+            shared = {value: value for value in values}
+            df[column] = df[column].map(shared).fillna(df[column])
+    return df
+
+
+# Cell text read as True by generated row constructors
+_TRUE_STRINGS = frozenset({"1", "true", "yes", "y", "t"})
+
+
+def _cell_caster(annotation: Any) -> str | None:
+    """Expression template converting a CSV cell ``v`` for a field annotation."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else None
+    if annotation is str:
+        return "v.strip()"
+    if annotation is bool:
+        return "v.strip().lower() in _TRUE_STRINGS"
+    if annotation in (int, float):
+        return f"{annotation.__name__}(v)"
+    return None
+
+
+@lru_cache(maxsize=64)
+def compile_row_constructor(
+    cls: type[BaseModel],
+    headers: tuple[str, ...],
+) -> Callable[[Sequence[str]], BaseModel]:
+    """
+    Generate a function building ``cls`` instances from CSV row tuples.
+    
+    The function is straight-line code for this header layout: each
+    non-empty cell of a known column (field name or alias) is converted
+    by the field's type (str stripped, int/float parsed, bool from
+    yes/true/1) and passed to ``model_construct``. Unknown columns are
+    skipped. Like ``from_trusted``, no validators run, so use it only for
+    rows cleaned upstream; unparsable numbers raise ValueError.
+    
+    Args:
+        cls: Schema class to construct
+        headers: Column names of the rows, as read by csv.reader
+    
+    Returns:
+        Function taking one row (sequence of cell strings)
+    """
+    by_name = {name: name for name in cls.model_fields}
+    by_name.update(
+        (info.alias, name) for name, info in cls.model_fields.items() if info.alias
+    )
+    
+    lines = ["def _construct(row):", "    values = {}"]
+    for index, header in enumerate(headers):
+        name = by_name.get(header)
+        if name is None:
+            continue
+        caster = _cell_caster(cls.model_fields[name].annotation) or "v"
+        lines += [
+            f"    v = row[{index}]",
+            "    if v:",
+            f"        values[{name!r}] = {caster}",
+        ]
+    lines.append("    return _model_construct(**values)")
+    
+    namespace: dict[str, Any] = {
+        "_model_construct": cls.model_construct,
+        "_TRUE_STRINGS": _TRUE_STRINGS,
+    }
+    exec(compile("\n".join(lines), f"<row-constructor {cls.__name__}>", "exec"), namespace)
+    return namespace["_construct"]
+
+
+class TrustedConstructMixin:
+    """
+    Adds ``from_trusted`` to create schemas.
+    
+    Mix in before the schema's BaseModel base.
+    """
+    
+    @classmethod
+    def from_trusted(cls, data: Mapping[str, Any]) -> Self:
+        """
+        Build an instance from already-cleaned data without validation.
+        
+        Uses ``model_construct``, so no field or model validators run:
+        values are stored as given (defaults fill missing fields, unknown
+        keys become extras). Only pass rows that were normalized upstream,
+        e.g. by DataCleaner; raw input must go through normal validation.
+        
+        Args:
+            data: Field values keyed by field name
+        
+        Returns:
+            Unvalidated schema instance
+        """
+        return cls.model_construct(**data)  # type: ignore[attr-defined]
+
+
+class OdooJsonMixin:
+    """
+    Adds JSON round-tripping to create schemas.
+    
+    Mix in before the schema's BaseModel base; set ODOO_EXCLUDE to the
+    fields to_odoo_dict leaves out.
+    """
+    
+    ODOO_EXCLUDE: ClassVar[frozenset[str]] = frozenset()
+    
+    def to_odoo_json(self) -> bytes:
+        """
+        Serialize the Odoo values (as in to_odoo_dict) straight to JSON.
+        
+        Pydantic's serializer writes the JSON directly, skipping the
+        intermediate dict when the next stage serializes anyway.
+        """
+        return self.model_dump_json(  # type: ignore[attr-defined, no-any-return]
+            exclude=set(self.ODOO_EXCLUDE) or None, exclude_none=True
+        ).encode("utf-8")
+    
+    @classmethod
+    def from_odoo_json(cls, data: bytes | str) -> Self:
+        """Validate a schema instance directly from JSON."""
+        return cls.model_validate_json(data)  # type: ignore[attr-defined, no-any-return]
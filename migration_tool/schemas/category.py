@@ -4,9 +4,12 @@ Pydantic Schemas for product.category
 Validation schemas for product category data with hierarchy support.
 """
 
+from functools import lru_cache
 from typing import Any
 from pydantic import BaseModel, Field, field_validator
 
+from migration_tool.schemas.base import to_odoo_values
+
 
 class CategoryBaseSchema(BaseModel):
     """Base schema for product category fields."""
@@ -48,15 +51,16 @@ class CategorySchema(CategoryBaseSchema):
     parent_path: str | None = Field(default=None, description="Parent path for hierarchy")
 
 
+_COMPUTED_FIELDS = frozenset({"complete_name"})
+
+
 class CategoryCreateSchema(CategoryBaseSchema):
     """Schema for creating new categories."""
     
     def to_odoo_dict(self) -> dict[str, Any]:
         """Convert to dictionary for Odoo create/write."""
-        data = self.model_dump(exclude_none=True)
-        # Remove complete_name as it's computed
-        data.pop("complete_name", None)
-        return data
+        # Leave out complete_name as it's computed
+        return to_odoo_values(self, exclude=_COMPUTED_FIELDS)
     
     @classmethod
     def from_complete_name(cls, complete_name: str) -> "CategoryCreateSchema":
@@ -68,15 +72,30 @@ class CategoryCreateSchema(CategoryBaseSchema):
             >>> cat.name
             'Phones'
         """
-        parts = [p.strip() for p in complete_name.split(" / ")]
-        name = parts[-1]
-        parent_path = " / ".join(parts[:-1]) if len(parts) > 1 else None
+        name, parent_path = _split_path(complete_name)
         
         return cls(
             name=name,
             parent_id=parent_path,
             complete_name=complete_name,
         )
+    
+    model_config = {
+        "frozen": True,
+    }
+
+
+@lru_cache(maxsize=4096)
+def _split_path(complete_name: str) -> tuple[str, str | None]:
+    """
+    Split a category path into its stripped leaf name and normalized parent path.
+    
+    Cached because catalog imports repeat the same paths thousands of times.
+    """
+    if " / " not in complete_name:
+        return complete_name.strip(), None
+    parts = [p.strip() for p in complete_name.split(" / ")]
+    return parts[-1], " / ".join(parts[:-1])
 
 
 class CategoryImportRow(BaseModel):
@@ -4,17 +4,58 @@ Pydantic Schemas for res.partner
 Validation schemas for customer and vendor data.
 """
 
-from typing import Any
-from pydantic import BaseModel, Field, EmailStr, field_validator, model_validator
+import re
+from functools import lru_cache
+from typing import Annotated, Any, ClassVar, Final
+from pydantic import (
+    BaseModel,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+    computed_field,
+    field_validator,
+    model_validator,
+)
+
+from migration_tool.schemas.base import OdooJsonMixin, TrustedConstructMixin, to_odoo_values
+
+try:
+    import email_validator
+except ImportError:  # Optional: installed with pydantic[email]
+    email_validator = None
+
+
+# Cheap per-row format check; strict_email() does full RFC validation where needed
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+# Stripped, non-empty partner name
+PartnerName = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=256)]
+
+
+@lru_cache(maxsize=16384)
+def strict_email(email: str) -> str:
+    """
+    Fully validate an email address and return its normalized form.
+    
+    Runs the email-validator package (without DNS checks), cached per
+    distinct address since imports repeat the same emails and domains.
+    
+    Raises:
+        ValueError: If the address is invalid
+        ImportError: If email-validator is not installed
+    """
+    if email_validator is None:
+        raise ImportError("email-validator is required: pip install 'pydantic[email]'")
+    return email_validator.validate_email(email, check_deliverability=False).normalized
 
 
 class PartnerBaseSchema(BaseModel):
     """Base schema for partner fields."""
     
-    name: str = Field(..., min_length=1, max_length=256, description="Partner name")
+    name: PartnerName = Field(..., description="Partner name")
     
     # Contact information
-    email: EmailStr | None = Field(default=None, description="Email address")
+    email: str | None = Field(default=None, description="Email address")
     phone: str | None = Field(default=None, max_length=32, description="Phone number")
     mobile: str | None = Field(default=None, max_length=32, description="Mobile number")
     website: str | None = Field(default=None, max_length=256, description="Website URL")
@@ -29,7 +70,6 @@ class PartnerBaseSchema(BaseModel):
     
     # Classification
     is_company: bool = Field(default=False, description="Is a company (vs individual)")
-    company_type: str | None = Field(default=None, description="'company' or 'person'")
     customer_rank: int = Field(default=0, ge=0, description="Customer rank (0 = not customer)")
     supplier_rank: int = Field(default=0, ge=0, description="Supplier rank (0 = not supplier)")
     
@@ -51,31 +91,30 @@ class PartnerBaseSchema(BaseModel):
     @field_validator("email", mode="before")
     @classmethod
     def validate_email(cls, v: Any) -> Any:
-        """Allow empty strings as None."""
+        """Allow empty strings as None; otherwise require an address-like format."""
         if v == "" or v is None:
             return None
+        if not isinstance(v, str) or _EMAIL_RE.fullmatch(v) is None:
+            raise ValueError(f"Invalid email address: {v!r}")
         return v
     
-    @field_validator("name", mode="before")
+    @model_validator(mode="before")
     @classmethod
-    def validate_name(cls, v: Any) -> str:
-        """Ensure name is stripped and not empty."""
-        if v is None:
-            raise ValueError("Name is required")
-        name = str(v).strip()
-        if not name:
-            raise ValueError("Name cannot be empty")
-        return name
-    
-    @model_validator(mode="after")
-    def set_company_type(self) -> "PartnerBaseSchema":
-        """Set company_type based on is_company if not provided."""
-        if self.company_type is None:
-            self.company_type = "company" if self.is_company else "person"
-        return self
+    def drop_company_type(cls, data: Any) -> Any:
+        """Drop company_type from the input (e.g. Odoo reads); it is computed from is_company."""
+        if isinstance(data, dict) and "company_type" in data:
+            data = {key: value for key, value in data.items() if key != "company_type"}
+        return data
+    
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def company_type(self) -> str:
+        """'company' or 'person', derived from is_company."""
+        return "company" if self.is_company else "person"
 
     model_config = {
         "extra": "allow",  # Allow extra fields for flexibility
+        "coerce_numbers_to_str": True,  # Numeric cells (names, zips, refs) arrive as int/float
     }
 
 
@@ -87,8 +126,18 @@ class PartnerSchema(PartnerBaseSchema):
     create_date: str | None = Field(default=None, description="Creation date")
 
 
-class PartnerCreateSchema(PartnerBaseSchema):
-    """Schema for creating new partners."""
+_COMPUTED_FIELDS = frozenset({"company_type"})
+
+
+class PartnerCreateSchema(TrustedConstructMixin, OdooJsonMixin, PartnerBaseSchema):
+    """
+    Schema for creating new partners.
+    
+    Unknown keys are ignored (validation only walks declared fields);
+    pass extra columns through the matching ImportRow schema instead.
+    """
+    
+    ODOO_EXCLUDE: ClassVar[frozenset[str]] = _COMPUTED_FIELDS
     
     # Additional fields commonly used in creation
     lang: str | None = Field(default=None, description="Language code")
@@ -104,12 +153,13 @@ class PartnerCreateSchema(PartnerBaseSchema):
         
         Removes None values and internal fields.
         """
-        data = self.model_dump(exclude_none=True)
-        
-        # Remove fields that shouldn't be sent to Odoo
-        data.pop("company_type", None)  # Computed field
-        
-        return data
+        # Leave out fields that shouldn't be sent to Odoo
+        return to_odoo_values(self, exclude=self.ODOO_EXCLUDE)
+
+    model_config = {
+        "extra": "ignore",
+        "frozen": True,
+    }
 
 
 class PartnerImportRow(BaseModel):
@@ -142,3 +192,13 @@ class PartnerImportRow(BaseModel):
         "extra": "allow",
         "populate_by_name": True,
     }
+
+
+# Built once at import; validate_partner_row(row) replaces PartnerImportRow(**row) in row loops
+PARTNER_ROW_ADAPTER: Final = TypeAdapter(PartnerImportRow)
+validate_partner_row = PARTNER_ROW_ADAPTER.validate_python
+
+# Whole batches in one call (list of dicts or JSON array bytes), e.g. a file's rows
+PARTNER_ROWS_ADAPTER: Final = TypeAdapter(list[PartnerImportRow])
+validate_partner_rows = PARTNER_ROWS_ADAPTER.validate_python
+validate_partner_rows_json = PARTNER_ROWS_ADAPTER.validate_json
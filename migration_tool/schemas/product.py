@@ -4,17 +4,54 @@ Pydantic Schemas for product.template and product.product
 Validation schemas for product data.
 """
 
-from typing import Any, Literal
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Any, Final, Literal, Mapping, Self
+
+import pandas as pd
+from pydantic import BaseModel, Field, StringConstraints, TypeAdapter, field_validator
+
+from migration_tool.schemas.base import OdooJsonMixin, TrustedConstructMixin, to_odoo_values
 
 
 ProductType = Literal["consu", "service", "product"]
+TrackingType = Literal["none", "serial", "lot"]
+
+# Stripped, non-empty product name
+ProductName = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=256)]
+
+# Selection fields for share_choice_strings
+PRODUCT_CHOICES = {
+    "detailed_type": ProductType.__args__,
+    "tracking": TrackingType.__args__,
+}
+
+# Coerced by ProductBaseSchema.validate_numeric (per row) or coerce_product_numerics (per frame)
+PRODUCT_NUMERIC_FIELDS = ("list_price", "standard_price", "weight", "volume")
+
+
+def coerce_product_numerics(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Apply validate_numeric's coercion to whole dataframe columns.
+    
+    Empty or unparsable values become 0.0, as in the per-field validator,
+    so rows can then go through ProductCreateSchema.validate_cleaned.
+    
+    Args:
+        df: Product rows with Odoo field names as columns
+    
+    Returns:
+        Copy of the dataframe with float64 numeric columns
+    """
+    df = df.copy()
+    for column in PRODUCT_NUMERIC_FIELDS:
+        if column in df.columns:
+            df[column] = pd.to_numeric(df[column], errors="coerce").fillna(0.0).astype("float64")
+    return df
 
 
 class ProductBaseSchema(BaseModel):
     """Base schema for product fields."""
     
-    name: str = Field(..., min_length=1, max_length=256, description="Product name")
+    name: ProductName = Field(..., description="Product name")
     
     # Identification
     default_code: str | None = Field(
@@ -46,7 +83,7 @@ class ProductBaseSchema(BaseModel):
     purchase_ok: bool = Field(default=True, description="Can be purchased")
     
     # Inventory
-    tracking: Literal["none", "serial", "lot"] = Field(
+    tracking: TrackingType = Field(
         default="none", description="Tracking type"
     )
     weight: float = Field(default=0.0, ge=0, description="Weight in kg")
@@ -60,17 +97,7 @@ class ProductBaseSchema(BaseModel):
     # Status
     active: bool = Field(default=True, description="Active status")
     
-    @field_validator("name", mode="before")
-    @classmethod
-    def validate_name(cls, v: Any) -> str:
-        if v is None:
-            raise ValueError("Product name is required")
-        name = str(v).strip()
-        if not name:
-            raise ValueError("Product name cannot be empty")
-        return name
-    
-    @field_validator("list_price", "standard_price", "weight", "volume", mode="before")
+    @field_validator(*PRODUCT_NUMERIC_FIELDS, mode="before")
     @classmethod
     def validate_numeric(cls, v: Any) -> float:
         if v is None or v == "":
@@ -82,6 +109,7 @@ class ProductBaseSchema(BaseModel):
 
     model_config = {
         "extra": "allow",
+        "coerce_numbers_to_str": True,
     }
 
 
@@ -120,8 +148,13 @@ class ProductProductSchema(ProductBaseSchema):
     )
 
 
-class ProductCreateSchema(ProductBaseSchema):
-    """Schema for creating new products."""
+class ProductCreateSchema(TrustedConstructMixin, OdooJsonMixin, ProductBaseSchema):
+    """
+    Schema for creating new products.
+    
+    Unknown keys are ignored (validation only walks declared fields);
+    pass extra columns through the matching ImportRow schema instead.
+    """
     
     # Image (base64 encoded)
     image_1920: str | None = Field(default=None, description="Main product image (base64)")
@@ -131,8 +164,29 @@ class ProductCreateSchema(ProductBaseSchema):
     
     def to_odoo_dict(self) -> dict[str, Any]:
         """Convert to dictionary for Odoo create/write."""
-        data = self.model_dump(exclude_none=True)
-        return data
+        return to_odoo_values(self)
+    
+    @classmethod
+    def validate_cleaned(cls, data: Mapping[str, Any]) -> Self:
+        """
+        Build an instance from a row produced by coerce_product_numerics.
+        
+        Only checks that the numeric fields are non-negative floats, then
+        skips field validation like from_trusted.
+        
+        Raises:
+            ValueError: If a numeric field was not coerced or is negative
+        """
+        for name in PRODUCT_NUMERIC_FIELDS:
+            value = data.get(name, 0.0)
+            if not isinstance(value, float) or value < 0:
+                raise ValueError(f"{name} must be a non-negative float, got {value!r}")
+        return cls.from_trusted(data)
+
+    model_config = {
+        "extra": "ignore",
+        "frozen": True,
+    }
 
 
 class ProductImportRow(BaseModel):
@@ -156,3 +210,13 @@ class ProductImportRow(BaseModel):
         "extra": "allow",
         "populate_by_name": True,
     }
+
+
+# Built once at import; validate_product_row(row) replaces ProductImportRow(**row) in row loops
+PRODUCT_ROW_ADAPTER: Final = TypeAdapter(ProductImportRow)
+validate_product_row = PRODUCT_ROW_ADAPTER.validate_python
+
+# Whole batches in one call (list of dicts or JSON array bytes), e.g. a file's rows
+PRODUCT_ROWS_ADAPTER: Final = TypeAdapter(list[ProductImportRow])
+validate_product_rows = PRODUCT_ROWS_ADAPTER.validate_python
+validate_product_rows_json = PRODUCT_ROWS_ADAPTER.validate_json
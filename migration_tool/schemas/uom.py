@@ -4,17 +4,25 @@ Pydantic Schemas for uom.uom
 Validation schemas for Unit of Measure data.
 """
 
-from typing import Any, Literal
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Any, Final, Literal
+from pydantic import BaseModel, Field, StringConstraints, TypeAdapter, field_validator
+
+from migration_tool.schemas.base import OdooJsonMixin, TrustedConstructMixin, to_odoo_values
 
 
 UoMType = Literal["bigger", "reference", "smaller"]
 
+# Stripped, non-empty unit name
+UoMName = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=64)]
+
+# Selection fields for share_choice_strings
+UOM_CHOICES = {"uom_type": UoMType.__args__}
+
 
 class UoMBaseSchema(BaseModel):
     """Base schema for UoM fields."""
     
-    name: str = Field(..., min_length=1, max_length=64, description="Unit name")
+    name: UoMName = Field(..., description="Unit name")
     
     # Category
     category_id: int | str | None = Field(
@@ -44,16 +52,6 @@ class UoMBaseSchema(BaseModel):
     # Status
     active: bool = Field(default=True, description="Active status")
     
-    @field_validator("name", mode="before")
-    @classmethod
-    def validate_name(cls, v: Any) -> str:
-        if v is None:
-            raise ValueError("UoM name is required")
-        name = str(v).strip()
-        if not name:
-            raise ValueError("UoM name cannot be empty")
-        return name
-    
     @field_validator("factor", "factor_inv", "rounding", mode="before")
     @classmethod
     def validate_positive_float(cls, v: Any) -> float:
@@ -67,6 +65,7 @@ class UoMBaseSchema(BaseModel):
 
     model_config = {
         "extra": "allow",
+        "coerce_numbers_to_str": True,
     }
 
 
@@ -76,13 +75,22 @@ class UoMSchema(UoMBaseSchema):
     id: int | None = Field(default=None, description="Odoo record ID")
 
 
-class UoMCreateSchema(UoMBaseSchema):
-    """Schema for creating new UoMs."""
+class UoMCreateSchema(TrustedConstructMixin, OdooJsonMixin, UoMBaseSchema):
+    """
+    Schema for creating new UoMs.
+    
+    Unknown keys are ignored (validation only walks declared fields);
+    pass extra columns through the matching ImportRow schema instead.
+    """
     
     def to_odoo_dict(self) -> dict[str, Any]:
         """Convert to dictionary for Odoo create/write."""
-        data = self.model_dump(exclude_none=True)
-        return data
+        return to_odoo_values(self)
+
+    model_config = {
+        "extra": "ignore",
+        "frozen": True,
+    }
 
 
 class UoMCategorySchema(BaseModel):
@@ -116,3 +124,13 @@ class UoMImportRow(BaseModel):
         "extra": "allow",
         "populate_by_name": True,
     }
+
+
+# Built once at import; validate_uom_row(row) replaces UoMImportRow(**row) in row loops
+UOM_ROW_ADAPTER: Final = TypeAdapter(UoMImportRow)
+validate_uom_row = UOM_ROW_ADAPTER.validate_python
+
+# Whole batches in one call (list of dicts or JSON array bytes), e.g. a file's rows
+UOM_ROWS_ADAPTER: Final = TypeAdapter(list[UoMImportRow])
+validate_uom_rows = UOM_ROWS_ADAPTER.validate_python
+validate_uom_rows_json = UOM_ROWS_ADAPTER.validate_json
@@ -0,0 +1,13 @@
+"""
+Shared test fixtures.
+"""
+
+import pytest
+
+from migration_tool.core.reader import DataReader
+
+
+@pytest.fixture(scope="session")
+def reader():
+    """DataReader keeps no state between reads, so one instance serves the session."""
+    return DataReader()
@@ -0,0 +1,351 @@
+"""
+Tests for the Odoo model adapters.
+"""
+
+import asyncio
+from typing import get_type_hints
+
+import pandas as pd
+import pytest
+
+from migration_tool.odoo.adapters import (
+    CategoryAdapter,
+    JournalEntryAdapter,
+    PartnerAdapter,
+    ProductAdapter,
+    ReferenceCache,
+    get_adapter,
+)
+
+
+class FakeClient:
+    """Records search_read calls and answers from a fixed country table."""
+    
+    COUNTRIES = {"Belgium": 21, "France": 75}
+    
+    url, db, username = "http://odoo.test", "test", "admin"
+    
+    def __init__(self):
+        self.search_reads = []
+        self.resolved = []
+        self.created = {}  # Records created after the batch was read
+    
+    def search_read(self, model, domain, fields=None, **kwargs):
+        self.search_reads.append((model, domain))
+        (_, _, values), = domain
+        return [{"id": self.COUNTRIES[v], "name": v} for v in values if v in self.COUNTRIES]
+    
+    def resolve_reference(self, model, value, search_field="name"):
+        self.resolved.append(value)
+        return self.created.get(value)
+
+
+class TestPartnerAdapter:
+    """Tests for PartnerAdapter reference handling."""
+    
+    @pytest.fixture
+    def client(self):
+        return FakeClient()
+    
+    @pytest.fixture
+    def adapter(self, client):
+        return PartnerAdapter(client, ReferenceCache())
+    
+    def test_prepare_records_resolves_references_in_bulk(self, adapter, client):
+        """Test one search_read serves every record sharing a reference value."""
+        records = [
+            {"name": "A", "country_id": "Belgium"},
+            {"name": "B", "country_id": "France"},
+            {"name": "C", "country_id": "Belgium"},
+        ]
+        
+        prepared = adapter.prepare_records(records)
+        
+        assert [r["country_id"] for r in prepared] == [21, 75, 21]
+        assert len(client.search_reads) == 1
+        assert client.resolved == []
+    
+    def test_independent_lookups_each_queried_once(self, adapter, client):
+        """Test a batch touching several reference models issues one query per model."""
+        records = [
+            {"name": "A", "country_id": "Belgium", "state_id": "Flanders", "parent_id": "Acme"},
+            {"name": "B", "country_id": "France", "state_id": "Flanders", "parent_id": "Acme"},
+        ]
+        
+        adapter.resolve_references_bulk(records)
+        
+        assert sorted(model for model, _ in client.search_reads) == [
+            "res.country", "res.country.state", "res.partner",
+        ]
+        assert adapter.cache.get("res.country", "France") == 75
+    
+    def test_resolve_references_async_warms_cache(self, adapter, client):
+        """Test the async bulk path fills the cache like the sync one."""
+        records = [{"name": "A", "country_id": "Belgium"}, {"name": "B", "country_id": "France"}]
+        
+        asyncio.run(adapter.resolve_references_async(records))
+        
+        assert adapter.cache.get("res.country", "Belgium") == 21
+        assert adapter.cache.get("res.country", "France") == 75
+        assert len(client.search_reads) == 1
+    
+    def test_unmatched_reference_falls_back_per_record(self, adapter, client):
+        """Test values without an exact match still go through resolve_reference."""
+        prepared = adapter.prepare_records([{"name": "A", "country_id": "Atlantis"}])
+        
+        assert prepared[0]["country_id"] is False
+        assert client.resolved == ["Atlantis"]
+    
+    def test_unresolved_value_is_looked_up_once(self, adapter, client):
+        """Test a value that cannot be resolved is not retried for every record."""
+        records = [{"name": n, "country_id": "Atlantis"} for n in ("A", "B", "C")]
+        
+        prepared = adapter.prepare_records(records)
+        
+        assert all(r["country_id"] is False for r in prepared)
+        assert client.resolved == ["Atlantis"]
+    
+    def test_prepare_record_drops_empty_values_without_mutating_input(self, adapter):
+        """Test normalization copies once and skips None / empty strings."""
+        record = {"name": "A", "email": "", "phone": None}
+        
+        prepared = adapter.prepare_record(record)
+        
+        assert "email" not in prepared
+        assert "phone" not in prepared
+        assert record == {"name": "A", "email": "", "phone": None}
+    
+    def test_clean_empty_values_without_copy_reuses_clean_record(self, adapter):
+        """Test copy=False skips the rebuild only when nothing needs dropping."""
+        clean = {"name": "A", "is_company": True}
+        dirty = {"name": "A", "email": ""}
+        
+        assert adapter.clean_empty_values(clean, copy=False) is clean
+        assert adapter.clean_empty_values(clean) is not clean
+        assert adapter.clean_empty_values(dirty, copy=False) == {"name": "A"}
+    
+    def test_prepare_record_coerces_typed_fields(self, adapter):
+        """Test generated coercion casts booleans and ranks, with fallbacks."""
+        prepared = adapter.prepare_record(
+            {"name": "A", "is_company": 1, "customer_rank": "3", "supplier_rank": "n/a"}
+        )
+        
+        assert prepared["is_company"] is True
+        assert prepared["customer_rank"] == 3
+        assert prepared["supplier_rank"] == 0
+    
+    def test_prepare_frame_matches_prepare_record_on_ints(self, adapter, client):
+        """Test both paths reject fractional ranks and keep integer IDs."""
+        ranks = ["3", "3.0", "3.7", "-2", "n/a"]
+        records = [
+            {"name": "A", "customer_rank": rank, "country_id": 233} for rank in ranks
+        ]
+        
+        framed = adapter.prepare_frame(pd.DataFrame(records))
+        
+        prepared = [adapter.prepare_record(r) for r in records]
+        per_record = [r["customer_rank"] for r in prepared]
+        assert per_record == [3, 3, 0, -2, 0]
+        assert framed["customer_rank"].tolist() == per_record
+        assert framed["country_id"].tolist() == [r["country_id"] for r in prepared] == [233] * 5
+        assert client.resolved == []
+    
+    def test_validate_required_bulk(self, adapter):
+        """Test missing required fields are reported per record."""
+        records = [{"name": "A"}, {"name": ""}, {"name": False}, {"name": 0}, {}]
+        
+        assert adapter.validate_required_bulk(records) == [[], ["name"], ["name"], [], ["name"]]
+        assert adapter.validate_required({"name": None}) == ["name"]
+
+
+class TestReferenceCache:
+    """Tests for ReferenceCache."""
+    
+    def test_keys_are_case_insensitive_per_model(self):
+        """Test lookups fold case and stay scoped to their model."""
+        cache = ReferenceCache()
+        cache.set("res.country", "Belgium", 21)
+        cache.set("res.partner", "Belgium", 7)
+        
+        assert cache.get("res.country", "BELGIUM") == 21
+        assert cache.get("res.partner", "belgium") == 7
+    
+    def test_miss_not_kept_after_record_is_created(self):
+        """Test a reference created after one batch resolves in the next."""
+        client, cache = FakeClient(), ReferenceCache()
+        adapter = PartnerAdapter(client, cache)
+        
+        first = adapter.prepare_records([{"name": "A", "parent_id": "Acme"}])
+        client.created["Acme"] = 9
+        second = adapter.prepare_records([{"name": "B", "parent_id": "Acme"}])
+        
+        assert first[0]["parent_id"] is False
+        assert second[0]["parent_id"] == 9
+        assert cache.get("res.partner", "Acme") == 9
+    
+    def test_evicts_least_recently_used(self):
+        """Test the cache stays within maxsize, keeping recently read keys."""
+        cache = ReferenceCache(maxsize=2)
+        cache.set("res.country", "Belgium", 21)
+        cache.set("res.country", "France", 75)
+        cache.get("res.country", "Belgium")
+        
+        cache.set("res.country", "Spain", 68)
+        
+        assert cache.get("res.country", "France") is None
+        assert cache.get("res.country", "Belgium") == 21
+        assert cache.get("res.country", "Spain") == 68
+    
+    def test_clear_single_model(self):
+        """Test clearing one model keeps the others."""
+        cache = ReferenceCache()
+        cache.set("res.country", "Belgium", 21)
+        cache.set("uom.uom", 5, 1)
+        
+        cache.clear("res.country")
+        
+        assert cache.get("res.country", "Belgium") is None
+        assert cache.get("uom.uom", 5) == 1
+
+
+class FakeCategoryClient:
+    """Serves product.category lookups from a complete_name table."""
+    
+    def __init__(self, categories):
+        self.categories = dict(categories)
+        self.search_reads = 0
+        self.created = []
+    
+    def search_read(self, model, domain, fields=None, **kwargs):
+        self.search_reads += 1
+        (_, _, names), = domain
+        return [
+            {"id": self.categories[n], "complete_name": n}
+            for n in names if n in self.categories
+        ]
+    
+    def create(self, model, values):
+        record_id = 100 + len(self.created)
+        self.created.append(values)
+        return record_id
+    
+    def resolve_reference(self, model, value, search_field="name"):
+        return self.categories.get(value)
+
+
+class TestCategoryAdapter:
+    """Tests for CategoryAdapter hierarchy creation."""
+    
+    def test_create_with_hierarchy_creates_only_missing_levels(self):
+        """Test one lookup covers all levels and new levels chain parent_id."""
+        client = FakeCategoryClient({"All": 1, "All / Saleable": 2})
+        cache = ReferenceCache()
+        adapter = CategoryAdapter(client, cache)
+        
+        leaf_id = adapter.create_with_hierarchy("All / Saleable / Office / Chairs")
+        
+        assert client.search_reads == 1
+        assert client.created == [
+            {"name": "Office", "parent_id": 2},
+            {"name": "Chairs", "parent_id": 100},
+        ]
+        assert leaf_id == 101
+        assert cache.get("product.category", "All / Saleable / Office") == 100
+    
+    def test_parent_created_between_prepares_is_found(self):
+        """Test a parent missing at first is resolved once it exists."""
+        client = FakeCategoryClient({})
+        adapter = CategoryAdapter(client, ReferenceCache())
+        
+        assert "parent_id" not in adapter.prepare_record({"complete_name": "A / B"})
+        client.categories["A"] = 7
+        
+        assert adapter.prepare_record({"complete_name": "A / C"}) == {"name": "C", "parent_id": 7}
+
+
+class FakeLedgerClient:
+    """Serves account codes and partner names, counting lookups per model."""
+    
+    TABLES = {
+        "account.account": ("code", {"1000": 1, "2000": 2}),
+        "res.partner": ("name", {"Acme": 7}),
+    }
+    
+    def __init__(self):
+        self.search_reads = []
+        self.resolved = []
+    
+    def search_read(self, model, domain, fields=None, **kwargs):
+        self.search_reads.append(model)
+        field_name, table = self.TABLES.get(model, ("name", {}))
+        (_, _, values), = domain
+        return [{"id": table[v], field_name: v} for v in values if v in table]
+    
+    def resolve_reference(self, model, value, search_field="name"):
+        self.resolved.append((model, value))
+        return None
+
+
+class TestJournalEntryAdapter:
+    """Tests for JournalEntryAdapter line preparation."""
+    
+    def test_line_references_resolved_in_one_lookup_per_model(self):
+        """Test accounts and partners of all lines are fetched together."""
+        client = FakeLedgerClient()
+        adapter = JournalEntryAdapter(client, ReferenceCache())
+        adapter.confirm_safety()
+        lines = [
+            {"account_id": "1000", "partner_id": "Acme", "debit": "10.5"},
+            {"account_id": "2000", "credit": "bad"},
+            {"account_id": "1000", "partner_id": "Acme", "credit": 3},
+        ]
+        
+        prepared = adapter.prepare_record({"date": "2024-01-01", "line_ids": lines})
+        
+        assert [values for _, _, values in prepared["line_ids"]] == [
+            {"account_id": 1, "partner_id": 7, "debit": 10.5},
+            {"account_id": 2, "credit": 0.0},
+            {"account_id": 1, "partner_id": 7, "credit": 3.0},
+        ]
+        assert client.search_reads.count("account.account") == 1
+        assert client.search_reads.count("res.partner") == 1
+        assert client.resolved == []
+
+
+class TestGetAdapter:
+    """Tests for the get_adapter factory."""
+    
+    def test_uses_given_cache(self):
+        """Test each call builds an adapter around the caller's cache."""
+        client, cache = FakeClient(), ReferenceCache()
+        
+        first = get_adapter("res.partner", client, cache)
+        second = get_adapter("res.partner", client, cache)
+        
+        assert first is not second
+        assert first.cache is second.cache is cache
+    
+    def test_journal_adapter_is_never_shared(self):
+        """Test a confirmed journal adapter does not leak to later callers."""
+        client = FakeClient()
+        
+        first = get_adapter("account.move", client)
+        first.confirm_safety()
+        
+        assert get_adapter("account.move", client) is not first
+
+
+class TestRecordTypes:
+    """Tests keeping adapter coercions in sync with their record TypedDicts."""
+    
+    @pytest.mark.parametrize("adapter_class", [PartnerAdapter, ProductAdapter])
+    def test_coerced_fields_declared_with_matching_types(self, adapter_class):
+        """Test every coerced field appears in RECORD_TYPE with its coerced type."""
+        hints = get_type_hints(adapter_class.RECORD_TYPE)
+        
+        for name in adapter_class.BOOL_FIELDS:
+            assert hints[name] is bool
+        for name in adapter_class.INT_FIELDS:
+            assert hints[name] is int
+        for name in adapter_class.FLOAT_FIELDS:
+            assert hints[name] is float
@@ -2,9 +2,10 @@
 Tests for the DataCleaner module.
 """
 
+import pandas as pd
 import pytest
 
-from migration_tool.core.cleaner import DataCleaner
+from migration_tool.core.cleaner import DataCleaner, _map_unique
 
 
 class TestDataCleaner:
@@ -137,3 +138,35 @@ class TestDataCleaner:
         assert cleaner.strip_html("<p>Hello</p>") == "Hello"
         assert cleaner.strip_html("<b>Bold</b> text") == "Bold text"
         assert cleaner.strip_html("No&nbsp;break") == "No break"
+    
+    # Dataframe cleaning tests
+    def test_map_unique_keeps_mixed_types_apart(self):
+        """Test values that compare equal across types are mapped separately."""
+        series = pd.Series([1, True, 0, False, 1.0, "1"], dtype=object)
+        
+        result = _map_unique(series, lambda v: (type(v).__name__, v))
+        
+        assert result.tolist() == [
+            ("int", 1), ("bool", True), ("int", 0), ("bool", False), ("float", 1.0), ("str", "1"),
+        ]
+    
+    def test_clean_dataframe(self, cleaner):
+        """Test transforms on repeated and missing values keep row alignment."""
+        df = pd.DataFrame(
+            {
+                "email": [" A@X.COM ", None, " A@X.COM ", "b@y.com"],
+                "active": ["yes", "no", "yes", None],
+            },
+            index=[10, 11, 12, 13],
+        )
+        result = cleaner.clean(
+            df, transforms={"email": "normalize_email", "active": "normalize_boolean"}
+        )
+        email = result["email"].tolist()
+        assert email[0] == email[2] == "a@x.com"
+        assert pd.isna(email[1])
+        assert email[3] == "b@y.com"
+        active = result["active"].tolist()
+        assert active[:3] == [True, False, True]
+        assert pd.isna(active[3])
+        assert result.index.tolist() == [10, 11, 12, 13]
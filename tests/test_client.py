@@ -0,0 +1,332 @@
+"""
+Tests for the Odoo client, against an in-memory execute_kw proxy.
+"""
+
+import json
+import threading
+import time
+import xmlrpc.client
+from types import SimpleNamespace
+
+import pytest
+
+from migration_tool.odoo.client import (
+    JsonRpcTransport,
+    JsonRpcUnavailableError,
+    KeepAliveTransport,
+    OdooAPIError,
+    OdooClient,
+    OdooConnectionError,
+)
+
+
+class FakeConnection:
+    """Stands in for http.client.HTTPConnection with canned responses."""
+    
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+        self.closed = False
+    
+    def request(self, method, path, body, headers):
+        self.requests.append((method, path, json.loads(body)))
+    
+    def getresponse(self):
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        status, reply = response
+        return SimpleNamespace(status=status, read=lambda: json.dumps(reply).encode())
+    
+    def close(self):
+        self.closed = True
+
+
+class FakeProxy:
+    """Answers execute_kw from a handler and records every call."""
+    
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+    
+    def execute_kw(self, db, uid, password, model, method, args, kwargs):
+        self.calls.append((model, method, args, kwargs))
+        return self.handler(model, method, args, kwargs)
+
+
+def make_client(handler, multicall=False, **kwargs):
+    """Build an authenticated client whose object proxy is a FakeProxy."""
+    client = OdooClient("http://odoo.test", "test", "admin", "secret", retry_delay=0, **kwargs)
+    proxy = FakeProxy(handler)
+    client._uid = 2
+    client._server_proxy = lambda service: proxy
+    client._models = client._local.models = proxy
+    client._multicall_supported = multicall
+    return client, proxy
+
+
+def fault(message="boom"):
+    raise xmlrpc.client.Fault(1, message)
+
+
+class TestReferenceLookups:
+    """Tests for resolve_reference and its field-type lookup."""
+    
+    def test_failed_fields_get_not_retried(self):
+        """Test a failed fields_get is remembered for the model, not rerun per reference."""
+        def handler(model, method, args, kwargs):
+            if method == "fields_get":
+                fault()
+            return []
+        
+        client, proxy = make_client(handler)
+        
+        assert client.resolve_reference("res.country", "Belgium") is None
+        assert client.resolve_reference("res.country", "France") is None
+        
+        methods = [method for _, method, _, _ in proxy.calls]
+        assert methods.count("fields_get") == 1
+        assert methods.count("search") == 4  # Exact and case-insensitive per value
+        
+        client.clear_fields_cache("res.country")
+        client.resolve_reference("res.country", "Spain")
+        assert [method for _, method, _, _ in proxy.calls].count("fields_get") == 2
+
+
+
+class TestCreateBatch:
+    """Tests for chunked, pipelined creates."""
+    
+    @pytest.mark.parametrize("pipeline_depth", [1, 3])
+    def test_failed_chunk_keeps_created_ids(self, pipeline_depth):
+        """Test IDs of chunks that succeeded, in flight or not, ride on the error."""
+        def handler(model, method, args, kwargs):
+            (chunk,) = args
+            if any(record["name"] == "bad" for record in chunk):
+                fault("invalid record")
+            return [record["id"] for record in chunk]
+        
+        client, _ = make_client(handler)
+        records = [{"id": i, "name": "bad" if i == 3 else f"P{i}"} for i in range(1, 9)]
+        
+        with pytest.raises(OdooAPIError) as excinfo:
+            client.create_batch("res.partner", records, chunk_size=2, pipeline_depth=pipeline_depth)
+        
+        expected = [1, 2] if pipeline_depth == 1 else [1, 2, 5, 6, 7, 8]
+        assert excinfo.value.created_ids == expected
+
+
+class TestJsonRpcTransport:
+    """Tests for the /jsonrpc transport."""
+    
+    @pytest.fixture
+    def transport(self):
+        return JsonRpcTransport("https://odoo.test/base/", timeout=5)
+    
+    def test_call_returns_result(self, transport):
+        """Test the request envelope and the unwrapped result."""
+        conn = transport._local.conn = FakeConnection((200, {"result": [1, 2]}))
+        
+        assert transport.call("object", "execute_kw", "db", 2) == [1, 2]
+        
+        (method, path, payload), = conn.requests
+        assert (method, path) == ("POST", "/base/jsonrpc")
+        assert payload["params"] == {
+            "service": "object", "method": "execute_kw", "args": ["db", 2]
+        }
+    
+    def test_error_raises_fault(self, transport):
+        """Test a JSON-RPC error maps to a Fault carrying the server message."""
+        error = {"code": 200, "message": "Odoo Server Error", "data": {"message": "No name"}}
+        transport._local.conn = FakeConnection((200, {"error": error}))
+        
+        with pytest.raises(xmlrpc.client.Fault) as excinfo:
+            transport.call("object", "execute_kw")
+        
+        assert (excinfo.value.faultCode, excinfo.value.faultString) == (200, "No name")
+    
+    def test_not_found_raises_unavailable(self, transport):
+        """Test HTTP 404 means the server has no JSON-RPC endpoint."""
+        transport._local.conn = FakeConnection((404, {}))
+        
+        with pytest.raises(JsonRpcUnavailableError):
+            transport.call("common", "version")
+    
+    def test_broken_connection_is_dropped(self, transport):
+        """Test a failed request closes the connection so the next call opens a new one."""
+        conn = transport._local.conn = FakeConnection(ConnectionResetError("reset"))
+        
+        with pytest.raises(ConnectionError):
+            transport.call("common", "version")
+        
+        assert conn.closed
+        assert transport._local.conn is None
+
+
+class TestKeepAliveTransport:
+    """Tests for the keep-alive XML-RPC transport."""
+    
+    def test_connection_reused_with_timeout(self):
+        """Test one connection per host, with the socket timeout applied."""
+        transport = KeepAliveTransport(timeout=7)
+        
+        conn = transport.make_connection("odoo.test")
+        
+        assert conn.timeout == 7
+        assert transport.make_connection("odoo.test") is conn
+        assert ("Connection", "keep-alive") in transport._headers
+
+
+class TestExecute:
+    """Tests for execute, its retries and its protocol fallback."""
+    
+    def test_jsonrpc_fault_raises_api_error(self):
+        """Test a JSON-RPC server error surfaces as OdooAPIError, like an XML-RPC Fault."""
+        client, proxy = make_client(lambda *args: [], protocol="jsonrpc")
+        error = {"code": 200, "message": "Odoo Server Error", "data": {"message": "Access denied"}}
+        client._jsonrpc._local.conn = FakeConnection((200, {"error": error}))
+        
+        with pytest.raises(OdooAPIError, match="Access denied") as excinfo:
+            client.execute("res.partner", "search", [])
+        
+        assert excinfo.value.fault_code == 200
+        assert proxy.calls == []
+    
+    def test_jsonrpc_not_found_falls_back_to_xmlrpc(self):
+        """Test a 404 on /jsonrpc switches the client to XML-RPC for good."""
+        client, proxy = make_client(lambda *args: [7], protocol="jsonrpc")
+        client._jsonrpc._local.conn = FakeConnection((404, {}))
+        
+        assert client.execute("res.partner", "search", []) == [7]
+        assert client.execute("res.partner", "search", []) == [7]
+        
+        assert client.protocol == "xmlrpc"
+        assert client._jsonrpc is None
+        assert client._multicall_supported
+        assert len(proxy.calls) == 2
+    
+    def test_stale_connection_reinitializes_proxies(self):
+        """Test a reset connection rebuilds the proxies before the retry; a timeout does not."""
+        errors = [ConnectionResetError("reset"), TimeoutError("slow")]
+        
+        def handler(model, method, args, kwargs):
+            if errors:
+                raise errors.pop(0)
+            return [1]
+        
+        client, _ = make_client(handler)
+        services = []
+        proxy_factory = client._server_proxy
+        client._server_proxy = lambda service: services.append(service) or proxy_factory(service)
+        
+        assert client.execute("res.partner", "search", []) == [1]
+        assert services == ["common", "object"]  # One rebuild, after the reset only
+    
+    def test_retries_exhausted_raise_connection_error(self):
+        """Test transient errors are retried retry_attempts times, then reported."""
+        def handler(model, method, args, kwargs):
+            raise TimeoutError("slow")
+        
+        client, proxy = make_client(handler, retry_attempts=3)
+        
+        with pytest.raises(OdooConnectionError, match="Failed after 3 attempts"):
+            client.execute("res.partner", "search", [])
+        
+        assert len(proxy.calls) == 3
+    
+    @pytest.mark.parametrize("previous", [1.0, 10.0, 1000.0])
+    def test_backoff_capped(self, previous):
+        """Test the retry delay stays between retry_delay and retry_max_delay."""
+        client, _ = make_client(lambda *args: None)
+        client.retry_delay, client.retry_max_delay = 2.0, 30.0
+        
+        for _ in range(50):
+            assert 2.0 <= client._next_retry_delay(previous) <= 30.0
+    
+    def test_backoff_without_jitter(self):
+        """Test retry_jitter=0 triples the previous delay up to the cap."""
+        client, _ = make_client(lambda *args: None, retry_jitter=0.0, retry_max_delay=30.0)
+        client.retry_delay = 2.0
+        
+        assert client._next_retry_delay(2.0) == 6.0
+        assert client._next_retry_delay(20.0) == 30.0
+
+
+class TestBatchedCalls:
+    """Tests for multicall, map and paged reads."""
+    
+    def test_multicall_results_in_order(self):
+        """Test calls sent in one system.multicall come back in call order."""
+        client, proxy = make_client(lambda *args: None, multicall=True)
+        sent = []
+        
+        def multicall(calls):
+            sent.extend(calls)
+            return [[call["params"][4]] for call in calls]  # Echo the method name
+        
+        proxy.system = SimpleNamespace(multicall=multicall)
+        calls = [("res.partner", "search", [[]], {}), ("res.partner", "search_count", [[]], {})]
+        
+        assert client.execute_kw_multi(calls) == ["search", "search_count"]
+        assert len(sent) == 2
+        assert proxy.calls == []
+    
+    def test_multicall_fault_falls_back_to_sequential(self):
+        """Test a server without system.multicall gets sequential calls, then never multicall."""
+        client, proxy = make_client(lambda model, method, args, kwargs: method, multicall=True)
+        
+        def multicall(calls):
+            raise xmlrpc.client.Fault(1, "method system.multicall not supported")
+        
+        proxy.system = SimpleNamespace(multicall=multicall)
+        calls = [("res.partner", "search", [[]], {}), ("res.partner", "search_count", [[]], {})]
+        
+        assert client.execute_kw_multi(calls) == ["search", "search_count"]
+        assert not client._multicall_supported
+        assert [method for _, method, _, _ in proxy.calls] == ["search", "search_count"]
+    
+    def test_map_preserves_order(self):
+        """Test map runs calls on worker threads and returns results in argument order."""
+        threads = set()
+        
+        def handler(model, method, args, kwargs):
+            threads.add(threading.get_ident())
+            (ids,) = args
+            time.sleep(0.001 * (20 - ids[0]))  # Later calls finish first
+            return ids
+        
+        client, _ = make_client(handler)
+        
+        assert client.map("res.partner", "read", [[[i]] for i in range(20)]) == [
+            [i] for i in range(20)
+        ]
+        assert len(threads) > 1
+    
+    def test_map_fault_raises_api_error(self):
+        """Test a Fault in any mapped call surfaces as OdooAPIError."""
+        def handler(model, method, args, kwargs):
+            if args == [[3]]:
+                fault("missing record")
+            return args
+        
+        client, _ = make_client(handler)
+        
+        with pytest.raises(OdooAPIError, match="missing record"):
+            client.map("res.partner", "read", [[[i]] for i in range(6)])
+    
+    @pytest.mark.parametrize("pipeline_depth", [1, 3])
+    def test_read_all_page_order(self, pipeline_depth):
+        """Test pages fetched concurrently are still yielded in offset order."""
+        def handler(model, method, args, kwargs):
+            if method == "search_count":
+                return 10
+            offset, limit = kwargs.get("offset", 0), kwargs["limit"]
+            time.sleep(0.001 * (10 - offset))  # Later pages finish first
+            return [{"id": i} for i in range(offset, min(offset + limit, 10))]
+        
+        client, proxy = make_client(handler)
+        
+        records = client.read_all("res.partner", [], page_size=3, pipeline_depth=pipeline_depth)
+        
+        assert [record["id"] for record in records] == list(range(10))
+        assert [method for _, method, _, _ in proxy.calls].count("search_read") == 4
@@ -2,6 +2,7 @@
 Tests for the Deduplicator module.
 """
 
+import pandas as pd
 import pytest
 
 from migration_tool.core.deduplicator import Deduplicator, DedupeResult, DedupeAction
@@ -178,3 +179,114 @@ class TestDeduplicator:
         
         assert "DUPLICATE DETECTION REPORT" in report
         assert "Total records processed" in report
+    
+    def test_odoo_lookup_limited_to_import_values(self):
+        """Test only Odoo records sharing a key value with the import are fetched."""
+        
+        class FakeClient:
+            def __init__(self):
+                self.domains = []
+            
+            def search_read(self, model, domain, fields=None, **kwargs):
+                self.domains.append(domain)
+                return [{"id": 7, "default_code": "A-1"}]
+        
+        client = FakeClient()
+        deduper = Deduplicator(client)
+        records = [
+            {"__source_row__": 1, "default_code": "a-1"},
+            {"__source_row__": 2, "default_code": "B-2"},
+        ]
+        
+        result = deduper.find_duplicates(records, model="product.template")
+        
+        assert client.domains == [
+            ["|", ("default_code", "=ilike", "a-1"), ("default_code", "=ilike", "B-2")]
+        ]
+        assert result.odoo_duplicates == 1
+        assert result.unique_records == [records[1]]
+    
+    @pytest.mark.parametrize("case_sensitive", [False, True])
+    def test_vectorized_key_hashes(self, deduper, case_sensitive):
+        """Test column-wise hashing matches per-record hashing."""
+        records = [
+            {"code": " A-1 ", "code2": "x", "qty": 3},
+            {"code": "a-1", "code2": None, "qty": 3},
+            {"code": "", "code2": "X|Y", "qty": 0},
+            {"code": float("nan"), "code2": pd.NA, "qty": 1.5},
+            {"code2": "  "},
+            {},
+        ]
+        keys = ["qty", "code2", "code"]
+        deduper.VECTORIZE_MIN_ROWS = 0
+        
+        assert deduper._make_key_hashes(records, keys, case_sensitive) == [
+            deduper._make_key_hash(record, keys, case_sensitive) for record in records
+        ]
+    
+    def test_vectorized_batch_duplicates(self, deduper):
+        """Test the column-wise path finds the same batch duplicates."""
+        records = [
+            {"__source_row__": 1, "name": "John Doe", "phone": "555-0100"},
+            {"__source_row__": 2, "name": "Jane Smith", "phone": "555-0200"},
+            {"__source_row__": 3, "name": "john doe ", "phone": "555-0100"},  # Duplicate
+            {"__source_row__": 4, "name": "", "phone": None},  # No key, never a duplicate
+            {"__source_row__": 5, "name": "", "phone": None},
+        ]
+        deduper.VECTORIZE_MIN_ROWS = 0
+        
+        result = deduper.find_duplicates(records, model="res.partner", check_odoo=False)
+        
+        assert [m.source_row for m in result.matches] == [3]
+        assert result.matches[0].batch_row == 1
+        assert len(result.unique_records) == 4
+    
+    @pytest.mark.parametrize("vectorize_min_rows", [0, 1000])
+    def test_nan_keys_never_duplicates(self, deduper, vectorize_min_rows):
+        """Test NaN key values count as missing on both sides of the threshold."""
+        nan = float("nan")
+        records = [{"__source_row__": i, "name": nan, "email": nan} for i in (1, 2)]
+        records += [{"__source_row__": i, "name": f"P{i}"} for i in range(3, 11)]
+        deduper.VECTORIZE_MIN_ROWS = vectorize_min_rows
+        
+        result = deduper.find_duplicates(records, model="res.partner", check_odoo=False)
+        
+        assert result.matches == []
+        assert len(result.unique_records) == 10
+    
+    @pytest.mark.parametrize("vectorize_min_rows", [0, 1000])
+    def test_casefold_matching(self, deduper, vectorize_min_rows):
+        """Test case-insensitive matching folds ß but keeps dotted İ distinct."""
+        records = [
+            {"__source_row__": 1, "name": "Hauptstraße"},
+            {"__source_row__": 2, "name": "HAUPTSTRASSE"},  # Duplicate once folded
+            {"__source_row__": 3, "name": "İstanbul Ltd"},
+            {"__source_row__": 4, "name": "Istanbul Ltd"},  # Not a duplicate
+        ]
+        deduper.VECTORIZE_MIN_ROWS = vectorize_min_rows
+        
+        result = deduper.find_duplicates(
+            records, model="res.partner", keys=["name"], check_odoo=False
+        )
+        
+        assert [m.source_row for m in result.matches] == [2]
+    
+    def test_rerun_uses_key_hash_cache(self, deduper):
+        """Test a rerun of the same batch hits the cache and gives the same result."""
+        records = [
+            {"__source_row__": 1, "name": "Acme", "phone": "555"},
+            {"__source_row__": 2, "name": " ACME ", "phone": "555"},
+            {"__source_row__": 3, "name": "Other", "phone": None},
+        ]
+        
+        first = deduper.find_duplicates(records, model="res.partner", check_odoo=False)
+        hits = deduper._cached_key_hash.cache_info().hits
+        second = deduper.find_duplicates(records, model="res.partner", check_odoo=False)
+        
+        assert second == first
+        assert deduper._cached_key_hash.cache_info().hits >= hits + len(records)
+    
+    def test_non_string_keys_not_conflated(self, deduper):
+        """Test values that compare equal but stringify differently stay distinct."""
+        assert deduper._make_key_hash({"code": True}, ["code"], False) == "code:true"
+        assert deduper._make_key_hash({"code": 1}, ["code"], False) == "code:1"
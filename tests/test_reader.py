@@ -3,39 +3,26 @@ Tests for the DataReader module.
 """
 
 import pytest
-import tempfile
-from pathlib import Path
 
-from migration_tool.core.reader import DataReader, DataReaderError
+from migration_tool.core import reader as reader_module
+from migration_tool.core.reader import DataReaderError
 
 
 class TestDataReader:
     """Tests for DataReader class."""
     
-    @pytest.fixture
-    def reader(self):
-        return DataReader()
-    
     @pytest.fixture
     def sample_csv(self):
-        """Create a temporary CSV file for testing."""
-        content = """Name,Email,Phone
+        """CSV content for testing, read from memory."""
+        return b"""Name,Email,Phone
 John Doe,john@example.com,+1-555-0100
 Jane Smith,jane@example.com,+1-555-0200
 Bob Wilson,bob@example.com,+1-555-0300
 """
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            suffix=".csv",
-            delete=False,
-            encoding="utf-8"
-        ) as f:
-            f.write(content)
-            return Path(f.name)
     
     def test_read_csv_basic(self, reader, sample_csv):
         """Test basic CSV reading."""
-        result = reader.read_file(sample_csv)
+        result = reader.read_buffer(sample_csv, filename="sample.csv")
         
         assert result.total_rows == 3
         assert "Name" in result.columns
@@ -43,6 +30,18 @@ Bob Wilson,bob@example.com,+1-555-0300
         assert "Phone" in result.columns
         assert result.errors == []
     
+    def test_read_csv_file(self, reader, sample_csv, tmp_path):
+        """Test reading from disk matches reading the same bytes from memory."""
+        path = tmp_path / "sample.csv"
+        path.write_bytes(sample_csv)
+        
+        result = reader.read_file(path)
+        
+        assert result.data.drop(columns="__source_file__").equals(
+            reader.read_buffer(sample_csv, "sample.csv").data.drop(columns="__source_file__")
+        )
+        assert result.source_file == str(path)
+    
     def test_read_csv_with_mapping(self, reader, sample_csv):
         """Test CSV reading with column mapping."""
         mapping = {
@@ -51,7 +50,7 @@ Bob Wilson,bob@example.com,+1-555-0300
             "Phone": "phone",
         }
         
-        result = reader.read_file(sample_csv, mapping=mapping)
+        result = reader.read_buffer(sample_csv, "sample.csv", mapping=mapping)
         
         assert "name" in result.columns
         assert "email" in result.columns
@@ -65,24 +64,52 @@ Bob Wilson,bob@example.com,+1-555-0300
         
         assert "not found" in str(exc_info.value).lower()
     
-    def test_read_unsupported_format(self, reader):
+    def test_read_unsupported_format(self, reader, tmp_path):
         """Test reading unsupported file format."""
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            with pytest.raises(DataReaderError) as exc_info:
-                reader.read_file(f.name)
+        path = tmp_path / "data.txt"
+        path.touch()
+        with pytest.raises(DataReaderError) as exc_info:
+            reader.read_file(path)
         
         assert "unsupported" in str(exc_info.value).lower()
     
     def test_source_tracking(self, reader, sample_csv):
         """Test that source file and row are tracked."""
-        result = reader.read_file(sample_csv)
+        result = reader.read_buffer(sample_csv, "sample.csv")
         
         assert "__source_file__" in result.data.columns
         assert "__source_row__" in result.data.columns
         
         # Row numbers should be 2, 3, 4 (1-indexed with header)
-        row_nums = result.data["__source_row__"].tolist()
-        assert row_nums == [2, 3, 4]
+        row_nums = result.data["__source_row__"]
+        assert row_nums.dtype == "int64"
+        assert row_nums.tolist() == [2, 3, 4]
+        assert result.data["__source_file__"].dtype == "category"
+    
+    def test_apply_mapping_to_read_result(self, reader, sample_csv):
+        """Test remapping a cached read matches reading with the mapping."""
+        mapping = {"Name": "name", "Email": "email"}
+        
+        raw = reader.read_buffer(sample_csv, "sample.csv")
+        remapped = reader.apply_mapping(raw, mapping)
+        direct = reader.read_buffer(sample_csv, "sample.csv", mapping=mapping)
+        
+        assert remapped.columns == direct.columns
+        assert remapped.data["__source_row__"].tolist() == [2, 3, 4]
+        assert "Name" in raw.columns  # Source result untouched
+    
+    def test_read_multiple_files_parallel(self, reader, sample_csv, tmp_path):
+        """Test reading several files in worker processes keeps input order."""
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"part{i}.csv"
+            path.write_bytes(sample_csv + f"Extra {i},x{i}@example.com,1\n".encode())
+            paths.append(path)
+        
+        results = reader.read_files(paths, mapping={"Name": "name"}, max_workers=2)
+        
+        assert [r.source_file for r in results] == [str(p) for p in paths]
+        assert [r.data["name"].iloc[-1] for r in results] == [f"Extra {i}" for i in range(4)]
     
     def test_mapping_missing_columns_warning(self, reader, sample_csv):
         """Test warning when mapped column doesn't exist."""
@@ -91,7 +118,7 @@ Bob Wilson,bob@example.com,+1-555-0300
             "NonExistent": "missing_field",
         }
         
-        result = reader.read_file(sample_csv, mapping=mapping)
+        result = reader.read_buffer(sample_csv, "sample.csv", mapping=mapping)
         
         assert len(result.errors) > 0 or len(result.warnings) > 0
 
@@ -99,26 +126,72 @@ Bob Wilson,bob@example.com,+1-555-0300
 class TestDataReaderEncodings:
     """Tests for encoding handling."""
     
-    @pytest.fixture
-    def reader(self):
-        return DataReader()
-    
     def test_utf8_encoding(self, reader):
         """Test UTF-8 encoded file."""
         content = """Name,City
 José García,São Paulo
 François Müller,Zürich
 """
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            suffix=".csv",
-            delete=False,
-            encoding="utf-8"
-        ) as f:
-            f.write(content)
-            path = Path(f.name)
-        
-        result = reader.read_file(path)
+        result = reader.read_buffer(content.encode("utf-8"), "cities.csv")
         
         assert result.total_rows == 2
-        assert "José García" in result.data["Name"].values
+        assert result.data["Name"].tolist() == ["José García", "François Müller"]
+    
+    def test_utf8_bom(self, reader):
+        """Test a UTF-8 BOM is detected and not kept in the first header."""
+        content = "Name,City\nJosé García,São Paulo\n".encode("utf-8-sig")
+        
+        result = reader.read_buffer(content, "cities.csv")
+        
+        assert result.columns[0] == "Name"
+        assert result.warnings == []
+    
+    def test_latin1_encoding(self, reader):
+        """Test a non-UTF-8 file falls back to latin-1 with a warning."""
+        content = "Name,City\nJosé García,São Paulo\n".encode("latin-1")
+        
+        result = reader.read_buffer(content, "cities.csv")
+        
+        assert result.data["Name"].tolist() == ["José García"]
+        assert "latin-1" in result.warnings[0]
+
+
+class TestDataReaderPyarrow:
+    """Tests for the optional pyarrow CSV path."""
+    
+    @pytest.fixture
+    def typed_csv(self):
+        """Values pyarrow would convert if it inferred column types."""
+        return b"""Ref,Date,Active,Amount,Note
+001,2024-01-05,true,1.50,
+0042,2024-12-31,false,2,n/a
+"""
+    
+    def test_values_round_trip(self, reader, typed_csv):
+        """Test pyarrow keeps every value exactly as written."""
+        pytest.importorskip("pyarrow")
+        
+        result = reader.read_buffer(typed_csv, "typed.csv")
+        
+        assert result.data["Ref"].tolist() == ["001", "0042"]
+        assert result.data["Date"].tolist() == ["2024-01-05", "2024-12-31"]
+        assert result.data["Active"].tolist() == ["true", "false"]
+        assert result.data["Amount"].tolist() == ["1.50", "2"]
+        assert result.data["Note"].tolist() == ["", "n/a"]
+    
+    def test_matches_c_engine(self, reader, typed_csv):
+        """Test the pyarrow and C engine paths produce the same frame."""
+        pytest.importorskip("pyarrow")
+        
+        arrow_df = reader._parse_csv(typed_csv, "utf-8", 0)
+        c_df = reader._parse_csv(typed_csv, "latin-1", 0)  # Skips pyarrow
+        
+        assert arrow_df.columns.tolist() == c_df.columns.tolist()
+        assert arrow_df.astype(object).values.tolist() == c_df.astype(object).values.tolist()
+    
+    def test_duplicate_headers_use_c_engine(self, typed_csv):
+        """Test headers pandas would rename are left to the C engine."""
+        pytest.importorskip("pyarrow")
+        
+        assert reader_module._parse_csv_arrow(b"A,A\n1,2\n", 0) is None
+        assert reader_module._parse_csv_arrow(typed_csv, 0) is not None
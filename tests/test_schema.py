@@ -2,6 +2,8 @@
 Tests for the Schema Introspection module.
 """
 
+from types import SimpleNamespace
+
 import pytest
 
 from migration_tool.core.schema.models import (
@@ -11,6 +13,8 @@ from migration_tool.core.schema.models import (
     FieldClassification,
 )
 from migration_tool.core.schema.classifier import FieldClassifier, SYSTEM_FIELDS
+from migration_tool.core.schema.cache import SchemaCache
+from migration_tool.core.schema.inspector import SchemaInspector
 
 
 class TestFieldType:
@@ -48,6 +52,7 @@ class TestFieldMeta:
         assert field.name == "phone"
         assert field.field_type == FieldType.CHAR
         assert field.importable is True
+        assert not hasattr(field, "__dict__")  # Slotted: catalogs hold many of these
     
     def test_serialization(self):
         """Test to_dict and from_dict."""
@@ -111,13 +116,15 @@ class TestModelMeta:
         assert required[0].name == "name"
 
 
+@pytest.fixture(scope="module")
+def classifier():
+    # classify() keeps no state, so one instance serves the whole module
+    return FieldClassifier()
+
+
 class TestFieldClassifier:
     """Tests for FieldClassifier."""
     
-    @pytest.fixture
-    def classifier(self):
-        return FieldClassifier()
-    
     def test_classify_simple_char(self, classifier):
         """Test classifying a simple char field."""
         field = classifier.classify(
@@ -155,6 +162,15 @@ class TestFieldClassifier:
         assert field.exportable is True
         assert field.classification == FieldClassification.EXPORT_ONLY
     
+    def test_strict_mode_change_applies(self):
+        """Test switching strict_mode after construction changes unknown-type results."""
+        classifier = FieldClassifier(strict_mode=True)
+        field_info = {"type": "unknown_widget", "store": True}
+        
+        assert not classifier.classify("res.partner", "x_widget", "Widget", field_info).importable
+        classifier.strict_mode = False
+        assert classifier.classify("res.partner", "x_widget", "Widget", field_info).importable
+    
     def test_classify_computed_with_inverse(self, classifier):
         """Test computed field with inverse is importable."""
         field = classifier.classify(
@@ -278,8 +294,56 @@ class TestFieldClassifier:
         assert field.selection == [("contact", "Contact"), ("invoice", "Invoice")]
         assert field.importable is True
     
+    def test_classify_many(self, classifier):
+        """Test classifying a fields_get result matches per-field classify."""
+        fields_info = {
+            "name": {"type": "char", "string": "Name", "required": True},
+            "id": {"type": "integer", "string": "ID", "readonly": True},
+            "x_legacy": {"type": "char"},
+        }
+        
+        fields = classifier.classify_many("res.partner", fields_info)
+        
+        assert list(fields) == ["name", "id", "x_legacy"]
+        assert fields["name"] == classifier.classify(
+            "res.partner", "name", "Name", fields_info["name"]
+        )
+        assert fields["x_legacy"].label == "x_legacy"
+        assert fields["x_legacy"].is_custom is True
+    
     def test_system_fields_constant(self):
         """Test system fields set is defined."""
+        assert isinstance(SYSTEM_FIELDS, frozenset)  # O(1) lookups in classify()
         assert "id" in SYSTEM_FIELDS
         assert "create_uid" in SYSTEM_FIELDS
         assert "write_date" in SYSTEM_FIELDS
+
+
+class TestSchemaInspector:
+    """Tests for SchemaInspector in-memory storage."""
+    
+    def test_lru_evicts_least_recently_used(self, tmp_path):
+        """Test model schemas beyond max_models are evicted oldest first."""
+        inspector = SchemaInspector(None, cache=SchemaCache(tmp_path), max_models=2)
+        
+        inspector._remember("res.partner", ModelMeta(name="res.partner", label="Contact"))
+        inspector._remember("uom.uom", ModelMeta(name="uom.uom", label="UoM"))
+        inspector.get_model("res.partner")  # Touch: now most recently used
+        inspector._remember("product.template", ModelMeta(name="product.template", label="Product"))
+        
+        assert list(inspector._models) == ["res.partner", "product.template"]
+    
+    def test_eviction_keeps_models_in_disk_cache(self, tmp_path):
+        """Test models evicted from memory are still saved to the schema cache."""
+        client = SimpleNamespace(db="test")
+        inspector = SchemaInspector(client, cache=SchemaCache(tmp_path), max_models=1)
+        inspector._odoo_version, inspector._installed_modules = "17.0", []
+        
+        inspector._remember("res.partner", ModelMeta(name="res.partner", label="Contact"))
+        inspector._save_to_cache()
+        inspector._remember("uom.uom", ModelMeta(name="uom.uom", label="UoM"))
+        inspector._save_to_cache()
+        
+        assert list(inspector._models) == ["uom.uom"]
+        cached = SchemaCache(tmp_path).load(database="test", odoo_version="17.0", modules=[])
+        assert set(cached) == {"res.partner", "uom.uom"}
@@ -0,0 +1,242 @@
+"""
+Tests for the Odoo model schemas.
+"""
+
+import json
+
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+
+from migration_tool.schemas import (
+    AccountCreateSchema,
+    CategoryCreateSchema,
+    PartnerCreateSchema,
+    PartnerSchema,
+    ProductCreateSchema,
+)
+from migration_tool.schemas import partner as partner_module
+from migration_tool.schemas.base import compile_row_constructor, share_choice_strings
+from migration_tool.schemas.partner import strict_email
+from migration_tool.schemas.product import PRODUCT_CHOICES, coerce_product_numerics
+
+
+class TestToOdooDict:
+    """to_odoo_dict must match model_dump(exclude_none=True)."""
+    
+    @pytest.fixture
+    def account(self):
+        return AccountCreateSchema(
+            name="Bank",
+            code="512000",
+            account_type="asset_cash",
+            reconcile=True,
+            note=None,
+            tag_ids=[1, 2],
+            legacy_code=None,
+        )
+    
+    def test_account_matches_model_dump(self, account):
+        """Declared and extra fields, None values dropped."""
+        assert account.to_odoo_dict() == account.model_dump(exclude_none=True)
+    
+    def test_account_keeps_false_and_zero(self):
+        """Only None is dropped, not other falsy values."""
+        account = AccountCreateSchema(name="Cash", code="0", account_type="asset_cash")
+        values = account.to_odoo_dict()
+        assert values["reconcile"] is False
+        assert values["deprecated"] is False
+        assert values["code"] == "0"
+    
+    def test_category_excludes_complete_name(self):
+        """complete_name is computed by Odoo and left out."""
+        category = CategoryCreateSchema.from_complete_name("All / Electronics / Phones")
+        expected = category.model_dump(exclude={"complete_name"}, exclude_none=True)
+        assert category.to_odoo_dict() == expected
+        assert category.to_odoo_dict() == {"name": "Phones", "parent_id": "All / Electronics"}
+    
+    def test_partner_json_matches_dict(self):
+        """to_odoo_json encodes the same values as to_odoo_dict."""
+        partner = PartnerCreateSchema(name="Acme", is_company=True, email="info@acme.com")
+        assert json.loads(partner.to_odoo_json()) == partner.to_odoo_dict()
+        assert "company_type" not in json.loads(partner.to_odoo_json())
+    
+    def test_from_odoo_json(self):
+        """JSON input is validated like keyword input."""
+        product = ProductCreateSchema.from_odoo_json(b'{"name": " Widget ", "list_price": "9.5"}')
+        assert product == ProductCreateSchema(name=" Widget ", list_price="9.5")
+
+
+class TestFromTrusted:
+    """from_trusted builds instances without running validators."""
+    
+    def test_skips_validation(self):
+        """Values are stored as given."""
+        partner = PartnerCreateSchema.from_trusted({"name": "  Acme  ", "email": "not-an-email"})
+        assert partner.name == "  Acme  "
+        assert partner.email == "not-an-email"
+    
+    def test_to_odoo_dict_matches_validated(self):
+        """Clean rows give the same Odoo values either way."""
+        row = {"name": "Widget", "list_price": 9.5, "default_code": "W-1", "barcode_alt": "123"}
+        trusted = ProductCreateSchema.from_trusted(row)
+        assert trusted.to_odoo_dict() == ProductCreateSchema(**row).to_odoo_dict()
+
+
+class TestFrozen:
+    """Create schemas are immutable once validated."""
+    
+    def test_assignment_rejected(self):
+        """Setting a field after validation raises."""
+        product = ProductCreateSchema(name="Widget")
+        with pytest.raises(ValidationError):
+            product.name = "Gadget"
+    
+    def test_partner_company_type(self):
+        """company_type follows is_company without being stored."""
+        assert PartnerCreateSchema(name="Acme", is_company=True).company_type == "company"
+        assert PartnerCreateSchema(name="Jane").company_type == "person"
+        assert "company_type" not in PartnerCreateSchema(name="Jane").to_odoo_dict()
+    
+    def test_read_company_type_ignored(self):
+        """A company_type read from Odoo is dropped in favour of the computed one."""
+        partner = PartnerSchema(name="Acme", is_company=True, company_type="person")
+        assert partner.company_type == "company"
+        assert not partner.__pydantic_extra__
+        
+        partner = PartnerSchema.model_validate_json(b'{"name": "Jane", "company_type": "company"}')
+        assert partner.model_dump()["company_type"] == "person"
+    
+    def test_hashable(self):
+        """Equal instances hash equally, so they can be set members."""
+        category = CategoryCreateSchema.from_complete_name("All / Phones")
+        assert category in {CategoryCreateSchema.from_complete_name("All / Phones")}
+
+
+class TestNames:
+    """Constrained name fields."""
+    
+    def test_stripped_and_coerced(self):
+        """Names are stripped; numeric cells become strings."""
+        assert PartnerCreateSchema(name="  Acme  ").name == "Acme"
+        assert ProductCreateSchema(name=1234).name == "1234"
+    
+    @pytest.mark.parametrize("name", [None, "", "   ", "x" * 257])
+    def test_invalid(self, name):
+        """Missing, blank and overlong names are rejected."""
+        with pytest.raises(ValidationError):
+            ProductCreateSchema(name=name)
+
+
+class TestAccountType:
+    """Account type normalization."""
+    
+    def test_normalized(self):
+        """Known types pass with surrounding space and any case."""
+        account = AccountCreateSchema(name="Cash", code="1", account_type=" Asset_Cash ")
+        assert account.account_type == "asset_cash"
+    
+    @pytest.mark.parametrize("account_type", [None, 5, ["asset_cash"], "bogus"])
+    def test_invalid(self, account_type):
+        """Non-string and unknown types raise ValidationError."""
+        with pytest.raises(ValidationError):
+            AccountCreateSchema(name="Cash", code="1", account_type=account_type)
+
+
+class TestPartnerEmail:
+    """Partner email format check."""
+    
+    def test_valid_and_empty(self):
+        """Plausible addresses pass unchanged; empty becomes None."""
+        partner = PartnerCreateSchema(name="A", email="jane.doe@example.com")
+        assert partner.email == "jane.doe@example.com"
+        assert PartnerCreateSchema(name="A", email="").email is None
+    
+    @pytest.mark.parametrize("email", ["jane", "jane@example", "jane doe@example.com", "a@b@c.com"])
+    def test_invalid(self, email):
+        """Addresses without a single @ and a dotted domain are rejected."""
+        with pytest.raises(ValidationError):
+            PartnerCreateSchema(name="A", email=email)
+
+
+class TestStrictEmail:
+    """Full RFC validation through email-validator."""
+    
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        strict_email.cache_clear()
+        yield
+        strict_email.cache_clear()
+    
+    def test_normalized(self):
+        """The domain is lowercased; the local part is kept."""
+        pytest.importorskip("email_validator")
+        assert strict_email("Jane.Doe@EXAMPLE.com") == "Jane.Doe@example.com"
+    
+    def test_invalid(self):
+        """Invalid addresses raise ValueError."""
+        pytest.importorskip("email_validator")
+        with pytest.raises(ValueError):
+            strict_email("jane@@example.com")
+    
+    def test_missing_package(self, monkeypatch):
+        """Without email-validator, ImportError names the extra to install."""
+        monkeypatch.setattr(partner_module, "email_validator", None)
+        with pytest.raises(ImportError, match="pydantic\\[email\\]"):
+            strict_email("jane@example.com")
+
+
+class TestProductNumerics:
+    """Frame-wise numeric coercion and validate_cleaned."""
+    
+    def test_coerced_rows_validate(self):
+        """Empty and unparsable values become 0.0, as in validate_numeric."""
+        df = pd.DataFrame({
+            "name": ["Widget", "Gadget"],
+            "list_price": ["9.5", None],
+            "standard_price": ["n/a", 3],
+        })
+        rows = coerce_product_numerics(df).to_dict("records")
+        products = [ProductCreateSchema.validate_cleaned(row) for row in rows]
+        assert [p.list_price for p in products] == [9.5, 0.0]
+        assert [p.standard_price for p in products] == [0.0, 3.0]
+        assert df["list_price"][0] == "9.5"  # Input left untouched
+    
+    @pytest.mark.parametrize("price", [-1.0, "9.5", 3])
+    def test_rejects_uncoerced_or_negative(self, price):
+        """Negative or non-float numeric values are refused."""
+        with pytest.raises(ValueError, match="list_price"):
+            ProductCreateSchema.validate_cleaned({"name": "Widget", "list_price": price})
+
+
+class TestShareChoiceStrings:
+    """Selection values mapped to shared strings."""
+    
+    def test_shares_valid_and_keeps_invalid(self):
+        """Valid choices keep their value; invalid and missing values are left as they are."""
+        df = pd.DataFrame({"detailed_type": ["service", "gadget", None], "tracking": "lot"})
+        shared = share_choice_strings(df, PRODUCT_CHOICES)
+        assert shared["detailed_type"][:2].tolist() == ["service", "gadget"]
+        assert pd.isna(shared["detailed_type"][2])
+        assert shared["tracking"].tolist() == ["lot"] * 3
+
+
+class TestRowConstructor:
+    """Generated CSV row constructors."""
+    
+    HEADERS = ("name", "list_price", "sale_ok", "Unknown Column", "barcode")
+    
+    def test_converts_by_field_type(self):
+        """Cells are converted per field type; empty cells keep defaults."""
+        construct = compile_row_constructor(ProductCreateSchema, self.HEADERS)
+        product = construct((" Widget ", "9.5", "No", "ignored", ""))
+        assert product.name == "Widget"
+        assert product.list_price == 9.5
+        assert product.sale_ok is False
+        assert product.barcode is None
+        assert product.to_odoo_dict()["purchase_ok"] is True
+    
+    def test_cached_per_layout(self):
+        """The same header layout reuses the generated function."""
+        first = compile_row_constructor(ProductCreateSchema, self.HEADERS)
+        assert compile_row_constructor(ProductCreateSchema, self.HEADERS) is first
@@ -59,6 +59,46 @@ class TestValidationEngine:
         # First record should be valid, second has invalid email
         assert len(result.valid_records) >= 1
     
+    def test_schema_issues_mapped_to_rows(self, engine):
+        """Test batch schema validation attributes errors to the right rows."""
+        records = [
+            {"__source_row__": 7, "email": "a@example.com"},  # Missing name
+            {"__source_row__": 8, "name": "Ok"},
+            {"__source_row__": 9, "name": "Bad", "email": "nope"},
+        ]
+        
+        result = engine.validate(records, schema=PartnerCreateSchema)
+        
+        assert [(i.row, i.field) for i in result.issues] == [(7, "name"), (9, "email")]
+        assert result.issues[1].value == "nope"
+        assert [r["__source_row__"] for r in result.valid_records] == [8]
+    
+    def test_validate_streams_iterables(self, engine):
+        """Test a generator validated in small chunks matches a list."""
+        records = [
+            {"__source_row__": i, "name": "" if i % 3 == 0 else f"N{i}"} for i in range(1, 8)
+        ]
+        expected = engine.validate(records, required=["name"])
+        engine.STREAM_CHUNK_SIZE = 2
+        
+        result = engine.validate((r for r in records), required=["name"])
+        
+        assert result.valid_records == expected.valid_records
+        assert [i.row for i in result.issues] == [3, 6]
+        assert [len(issues) for _, issues in engine.iter_validate(records, required=["name"])] == [
+            0, 0, 1, 0, 0, 1, 0,
+        ]
+    
+    def test_validate_nothing_to_check(self, engine):
+        """Test records pass through when no checks are configured."""
+        records = [{"__source_row__": 1, "name": ""}, {"__source_row__": 2}]
+        
+        result = engine.validate(iter(records), required=[])
+        
+        assert result.valid_records == records
+        assert result.valid_records is not records
+        assert result.issues == []
+    
     def test_validate_returns_issues(self, engine):
         """Test that validation returns issue details."""
         records = [
@@ -98,6 +138,26 @@ class TestValidationEngine:
         assert "row" in df.columns
         assert "field" in df.columns
         assert "message" in df.columns
+        assert df["row"].tolist() == [1, 2]
+        assert df["severity"].tolist() == ["error", "error"]
+    
+    @pytest.mark.parametrize("vectorize_min_rows", [0, 1000])
+    def test_required_fields_vectorized(self, engine, vectorize_min_rows):
+        """Test per-record and column-wise required checks agree."""
+        records = [
+            {"__source_row__": 1, "name": "A", "code": 0},
+            {"__source_row__": 2, "name": " ", "code": None},
+            {"__source_row__": 3, "code": float("nan")},
+            {"__source_row__": 4, "name": "D", "code": "X"},
+        ]
+        engine.VECTORIZE_MIN_ROWS = vectorize_min_rows
+        
+        result = engine.validate(records, required=["name", "code"])
+        
+        assert [(i.row, i.field) for i in result.issues] == [
+            (2, "name"), (2, "code"), (3, "name"), (3, "code"),
+        ]
+        assert [r["__source_row__"] for r in result.valid_records] == [1, 4]
 
 
 class TestValidationIssue: